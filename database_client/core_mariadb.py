@@ -7,6 +7,7 @@ from .db_interfaces import CoreDBConnection
 from database_client import logging_config
 from database_client.logging_config import VALID_LOG_LEVELS
 
+
 class CoreMariaDBConnection(CoreDBConnection):
     """
     Database access class for hash table operations.
@@ -262,9 +263,11 @@ class CoreMariaDBConnection(CoreDBConnection):
                     # Clean up the results to only include needed fields
                     cleaned_results = []
                     for row in results:
+                        # Timestamps are stored as UNIX epochs, the web-gui converts them on render
                         cleaned_results.append({
                             'site_name': row[0],
                             'last_updated': row[1],
+                            'last_updated_timestamp': row[1],  # Epoch for sorting
                             'status_category': row[3]
                         })
 
@@ -352,18 +355,71 @@ class CoreMariaDBConnection(CoreDBConnection):
             self.logger.error(f"Error fetching site sync status: {e}")
             return []
 
-    def get_recent_logs(self, log_level: str = None, site_id: str = None) -> list:
+    def get_recent_logs(self, log_level: str = None, site_id: str = None,
+                        limit: int = None, offset: int = 0) -> list:
         """
         Get all logs from the last 30 days, optionally filtered by log_level and/or site_id.
 
         Args:
             log_level: Optional log level to filter by (case-insensitive)
             site_id: Optional site ID to filter by (case-insensitive)
+            limit: Optional maximum number of records to return
+            offset: Number of records to skip (used with limit for paging)
 
         Returns:
             List of dictionaries containing log records from the last 30 days,
             or empty list if no records found or an error occurred
         """
+        try:
+            with self._get_connection() as conn:
+                with conn.cursor() as cursor:
+                    return self._fetch_recent_logs(cursor, log_level, site_id, limit, offset)
+
+        except mariadb.Error as e:
+            self.logger.error(f"Error fetching recent logs: {e}")
+            return []
+
+    def get_logs_page(self, log_level: str = None, site_id: str = None,
+                      limit: int = None, offset: int = 0, before: tuple = None) -> dict[str, Any]:
+        """
+        Get everything the logs page needs using a single database connection.
+
+        The site_id filter is only applied if it names a site in site_list, so the
+        site lookup, filter validation and log query share one round-trip setup.
+
+        Args:
+            log_level: Optional log level to filter by (case-insensitive)
+            site_id: Optional site ID to filter by, ignored if not a valid site
+            limit: Optional maximum number of log records to return
+            offset: Number of log records to skip (used with limit for paging)
+            before: Optional (timestamp, log_id) of the last log on the previous page,
+                    only logs ordered after it are returned (keyset paging, no rows skipped)
+
+        Returns:
+            Dictionary with keys:
+                - valid_site_ids (list): site_name values from site_list
+                - site_id (str | None): the site filter that was applied
+                - logs (list): log records from the last 30 days
+        """
+        page = {'valid_site_ids': [], 'site_id': None, 'logs': []}
+        try:
+            with self._get_connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute("SELECT site_name FROM site_list ORDER BY site_name")
+                    page['valid_site_ids'] = [row[0] for row in cursor.fetchall()]
+
+                    if site_id and site_id in page['valid_site_ids']:
+                        page['site_id'] = site_id
+
+                    page['logs'] = self._fetch_recent_logs(cursor, log_level, page['site_id'], limit, offset, before)
+
+        except mariadb.Error as e:
+            self.logger.error(f"Error fetching logs page: {e}")
+        return page
+
+    def _fetch_recent_logs(self, cursor, log_level: str = None, site_id: str = None,
+                           limit: int = None, offset: int = 0, before: tuple = None) -> list:
+        """Run the last-30-days logs query on an open cursor and return the rows as dicts."""
         # Calculate timestamp for 30 days ago
         thirty_days_ago = int(time()) - (30 * 24 * 60 * 60)
 
@@ -381,51 +437,54 @@ class CoreMariaDBConnection(CoreDBConnection):
                 """
         params = [thirty_days_ago]
 
+        # Both columns use case-insensitive collation, comparing them directly keeps the
+        # (log_level, site_id, timestamp) index usable
         if log_level:
-            query += " AND UPPER(log_level) = UPPER(?)"
+            query += " AND log_level = ?"
             params.append(log_level)
 
         if site_id:
-            query += " AND UPPER(site_id) = UPPER(?)"
+            query += " AND site_id = ?"
             params.append(site_id)
 
-        query += " ORDER BY timestamp DESC"
-
-        try:
-            with self._get_connection() as conn:
-                with conn.cursor() as cursor:
-                    cursor.execute(query, params)
-                    results = cursor.fetchall()
-
-                    # Convert tuples to dictionaries
-                    dict_results = []
-                    for row in results:
-                        dict_results.append({
-                            'log_id': row[0],
-                            'site_id': row[1],
-                            'session_id': row[2],
-                            'log_level': row[3],
-                            'timestamp': row[4],
-                            'summary_message': row[5],
-                            'detailed_message': row[6]
-                        })
-
-                    filter_desc = []
-                    if log_level:
-                        filter_desc.append(f"log_level={log_level}")
-                    if site_id:
-                        filter_desc.append(f"site_id={site_id}")
-                    filter_str = f" with filters: {', '.join(filter_desc)}" if filter_desc else ""
-                    if results:
-                        self.logger.debug(f"Retrieved {len(results)} log records from last 30 days{filter_str}")
-                        return dict_results
-                    else:
-                        self.logger.debug(f"No log records found in the last 30 days{filter_str}")
-                        return []
-
-        except mariadb.Error as e:
-            self.logger.error(f"Error fetching recent logs: {e}")
-            return []
+        # Seek past the previous page instead of reading and discarding offset rows
+        if before is not None:
+            query += " AND (timestamp < ? OR (timestamp = ? AND log_id < ?))"
+            params.extend([before[0], before[0], before[1]])
+
+        query += " ORDER BY timestamp DESC, log_id DESC"
+
+        if limit is not None:
+            query += " LIMIT ? OFFSET ?"
+            params.extend([limit, offset])
+
+        cursor.execute(query, params)
+        results = cursor.fetchall()
+
+        # Convert tuples to dictionaries
+        dict_results = []
+        for row in results:
+            dict_results.append({
+                'log_id': row[0],
+                'site_id': row[1],
+                'session_id': row[2],
+                'log_level': row[3],
+                'timestamp': row[4],
+                'summary_message': row[5],
+                'detailed_message': row[6]
+            })
+
+        filter_desc = []
+        if log_level:
+            filter_desc.append(f"log_level={log_level}")
+        if site_id:
+            filter_desc.append(f"site_id={site_id}")
+        filter_str = f" with filters: {', '.join(filter_desc)}" if filter_desc else ""
+        if results:
+            self.logger.debug(f"Retrieved {len(results)} log records from last 30 days{filter_str}")
+        else:
+            self.logger.debug(f"No log records found in the last 30 days{filter_str}")
+        return dict_results
 
     def get_valid_site_ids(self) -> list:
         """
@@ -498,12 +557,12 @@ class CoreMariaDBConnection(CoreDBConnection):
             ValueError: If invalid log_level is provided
         """
         # Input validation
-        allowed_log_levels = VALID_LOG_LEVELS
         if not isinstance(log_level, str):
             raise ValueError("log_level must be a string")
 
-        if log_level.upper() not in allowed_log_levels:
-            raise ValueError(f"Invalid log_level. Allowed: {allowed_log_levels}")
+        log_level = log_level.upper()
+        if log_level not in VALID_LOG_LEVELS:
+            raise ValueError(f"Invalid log_level. Allowed: {sorted(VALID_LOG_LEVELS)}")
 
         # Calculate 24 hours ago timestamp
         import time
@@ -516,7 +575,7 @@ class CoreMariaDBConnection(CoreDBConnection):
                 WHERE log_level = ?
                   AND timestamp >= ? 
                 """
-        query_params = [log_level.upper(), twenty_four_hours_ago]
+        query_params = [log_level, twenty_four_hours_ago]
 
         try:
             with self._get_connection() as conn:
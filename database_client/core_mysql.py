@@ -1,76 +1,41 @@
-from typing import Any, List, Dict
+from typing import Any, List, Dict, Iterator
 from datetime import datetime, timedelta
+from time import time
 import mysql.connector
 from mysql.connector import Error
-from contextlib import contextmanager
 
 from .db_interfaces import CoreDBConnection
-from database_client import logging_config
+from .mysql_base import MYSQLConnectionBase
 from database_client.logging_config import VALID_LOG_LEVELS
 
-class CoreMYSQLConnection(CoreDBConnection):
+class CoreMYSQLConnection(MYSQLConnectionBase, CoreDBConnection):
     """
     Database access class for hash table operations.
 
     This class provides methods to interact with the MySQL database
     for storing and retrieving hash information.
     """
-    def __init__(self, host, database, user, password, port=3306,
-                 connection_factory=None, autocommit=True, raise_on_warnings=True, **kwargs):
-        """
-        Initialize the database connection configuration.
-
-        Args:
-            host: Database host
-            database: Database name
-            user: Database user
-            password: Database password
-            port: Database port (default: 3306)
-            connection_factory: Optional factory function for creating connections (for testing)
-            autocommit: Whether to autocommit transactions (default: True)
-            raise_on_warnings: Whether to raise on warnings (default: True)
-        """
-        self.config = {
-            'host': host,
-            'database': database,
-            'user': user,
-            'password': password,
-            'port': port,
-            'autocommit': autocommit,
-            'raise_on_warnings': raise_on_warnings
-        }
-
-        self.other_args = kwargs
-
-        self.database = database
-        self.connection_factory = connection_factory or mysql.connector.connect
-        self.logger = logging_config.configure_logging()
-
-    @contextmanager
-    def _get_connection(self):
-        """
-        Context manager for database connections.
-
-        Yields:
-            MySQL connection object
-
-        Raises:
-            Error: If a database error occurs
-        """
-        connection = None
-        try:
-            connection = self.connection_factory(**self.config)
-            self.logger.debug(f"Database connection established to {self.config['host']}")
-            yield connection
-        except Error as e:
-            self.logger.error(f"Database error: {e}")
-            if connection:
-                connection.rollback()
-            raise
-        finally:
-            if connection and connection.is_connected():
-                connection.close()
-                self.logger.debug("Database connection closed")
+    _LOG_COUNT_WINDOW = 30  # Seconds a per-level log count is reused before querying again
+    _LOG_STREAM_BATCH_SIZE = 500  # Rows held in memory at a time by iter_recent_logs
+
+    # Dashboard metrics, in the column order of the get_dashboard_content query
+    _DASHBOARD_KEYS = (
+        'crit_error_count',  # Number of Critical errors logged in the last 24h
+        'hash_record_count',  # Count of dirs/files/links currently on baseline
+        'sync_current',  # Baseline sync current
+        'sync_1_behind',  # Baseline on previous current
+        'sync_l24_behind',  # Baseline on some hash from last 24 hours
+        'sync_g24_behind',  # Baseline hash more than 24 hours ago
+        'sync_unknown',  # Baseline hash is not in the history table
+        'live_current',  # Heard from in last 35m
+        'live_1_behind',  # Heard from more than 35m ago
+        'live_l24_behind',  # Heard from in last 24h
+        'live_inactive',  # Have not heard from in over 24h
+    )
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._log_counts: dict[str, tuple[int, int]] = {}  # log_level -> (time window, count)
 
     def get_dashboard_content(self) -> dict[str, Any]:
         """
@@ -100,16 +65,22 @@ class CoreMYSQLConnection(CoreDBConnection):
         """
         query = """
                 WITH
-                    -- Get the most recent hash (current baseline)
-                    current_baseline AS (SELECT hash_value, created_at, record_count
+                    -- The two most recent hashes, read from state_history in a single scan
+                    recent_baselines AS (SELECT hash_value,
+                                                created_at,
+                                                record_count,
+                                                ROW_NUMBER() OVER (ORDER BY created_at DESC) as baseline_rank
                                          FROM state_history
                                          ORDER BY created_at DESC
-                                         LIMIT 1),
-                    -- Get the second most recent hash (1 behind baseline)
+                                         LIMIT 2),
+                    -- Most recent hash (current baseline)
+                    current_baseline AS (SELECT hash_value, created_at, record_count
+                                         FROM recent_baselines
+                                         WHERE baseline_rank = 1),
+                    -- Second most recent hash (1 behind baseline)
                     previous_baseline AS (SELECT hash_value, created_at
-                                          FROM state_history
-                                          ORDER BY created_at DESC
-                                          LIMIT 1 OFFSET 1),
+                                          FROM recent_baselines
+                                          WHERE baseline_rank = 2),
                     -- Time boundaries
                     time_bounds AS (SELECT NOW() - INTERVAL 35 MINUTE as live_threshold,
                                            NOW() - INTERVAL 24 HOUR   as day_threshold),
@@ -183,19 +154,7 @@ class CoreMYSQLConnection(CoreDBConnection):
                 """
 
         # Initialize context with default values
-        context = {
-            'crit_error_count': 0,  # Number of Critical errors logged in the last 24h
-            'hash_record_count': 0,  # Count of dirs/files/links currently on baseline
-            'sync_current': 0,  # Baseline sync current
-            'sync_1_behind': 0,  # Baseline on previous current
-            'sync_l24_behind': 0,  # Baseline on some hash from last 24 hours
-            'sync_g24_behind': 0,  # Baseline hash more than 24 hours ago
-            'sync_unknown': 0,  # Baseline hash is not in the history table
-            'live_current': 0,  # Heard from in last 35m
-            'live_1_behind': 0,  # Heard from more than 35m ago
-            'live_l24_behind': 0,  # Heard from in last 24h
-            'live_inactive': 0,  # Have not heard from in over 24h
-        }
+        context = dict.fromkeys(self._DASHBOARD_KEYS, 0)
 
         # Execute query and populate context
         try:
@@ -204,21 +163,9 @@ class CoreMYSQLConnection(CoreDBConnection):
                     cursor.execute(query)
                     result = cursor.fetchone()  # Use fetchone() since query returns single row
                     if result:
-                        # Update context with actual values from query result
-                        context.update({
-                            'crit_error_count': result[0] or 0,
-                            'hash_record_count': result[1] or 0,
-                            'sync_current': result[2] or 0,
-                            'sync_1_behind': result[3] or 0,
-                            'sync_l24_behind': result[4] or 0,
-                            'sync_g24_behind': result[5] or 0,
-                            'sync_unknown': result[6] or 0,
-                            'live_current': result[7] or 0,
-                            'live_1_behind': result[8] or 0,
-                            'live_l24_behind': result[9] or 0,
-                            'live_inactive': result[10] or 0,
-                        })
-                    self.logger.debug(f"Dashboard query result: {result}")
+                        # Update context with actual values from query result, columns follow _DASHBOARD_KEYS
+                        context.update(zip(self._DASHBOARD_KEYS, (value or 0 for value in result)))
+                    self.logger.debug("Dashboard query result: %s", result)
         except Exception as e:
             self.logger.error(f"Error collecting dashboard information: {e}")
             # Context remains with default values (0s) on error
@@ -371,27 +318,125 @@ class CoreMYSQLConnection(CoreDBConnection):
             self.logger.error(f"Error fetching site sync status: {e}")
             return []
 
-    def get_recent_logs(self, log_level: str = None, site_id: str = None) -> list:
+    def get_recent_logs(self, log_level: str = None, site_id: str = None,
+                        limit: int = None, offset: int = 0) -> list:
         """
         Get all logs from the last 30 days, optionally filtered by log_level and/or site_id.
 
         Args:
             log_level: Optional log level to filter by (case-insensitive)
             site_id: Optional site ID to filter by (case-insensitive)
+            limit: Optional maximum number of records to return
+            offset: Number of records to skip (used with limit for paging)
 
         Returns:
             List of dictionaries containing log records from the last 30 days,
             or empty list if no records found or an error occurred
         """
-        # Calculate timestamp for 30 days ago
-        # thirty_days_ago = int(time()) - (30 * 24 * 60 * 60)
-        from datetime import datetime, timedelta
+        query, params = self._recent_logs_query(log_level, site_id, limit, offset)
 
-        # Calculate 24 hours ago as a datetime object
-        thirty_days_ago = datetime.now() - timedelta(days=30)
+        try:
+            with self._get_connection() as conn:
+                with conn.cursor(dictionary=True) as cursor:
+                    cursor.execute(query, params)
+                    results = cursor.fetchall()
+                    self._log_recent_logs_result(results, log_level, site_id)
+                    return results or []
+
+        except Error as e:
+            self.logger.error(f"Error fetching recent logs: {e}")
+            return []
+
+    def iter_recent_logs(self, log_level: str = None, site_id: str = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream logs from the last 30 days, optionally filtered by log_level and/or site_id.
+
+        Rows are read from an unbuffered cursor in batches of _LOG_STREAM_BATCH_SIZE, so
+        memory use doesn't grow with the size of the result. The connection is held until
+        the iterator is exhausted or closed.
+
+        Args:
+            log_level: Optional log level to filter by (case-insensitive)
+            site_id: Optional site ID to filter by (case-insensitive)
+
+        Yields:
+            Dictionaries containing log records from the last 30 days, newest first
+
+        Raises:
+            Error: If a database error occurs, including part way through the stream
+        """
+        query, params = self._recent_logs_query(log_level, site_id)
+
+        try:
+            with self._get_connection() as conn:
+                with conn.cursor(dictionary=True, buffered=False) as cursor:
+                    cursor.execute(query, params)
+                    rows = cursor.fetchmany(self._LOG_STREAM_BATCH_SIZE)
+                    try:
+                        while rows:
+                            yield from rows
+                            rows = cursor.fetchmany(self._LOG_STREAM_BATCH_SIZE)
+                    except GeneratorExit:
+                        if rows:
+                            # Closed early: drop the session rather than read off up to 30 days
+                            # of rows. A pool reconnects a shut down connection on its next checkout.
+                            # A pooled wrapper only proxies reads, so clear the flag on the real
+                            # connection or closing the cursor raises "Unread result found"
+                            conn.shutdown()
+                            getattr(conn, '_cnx', conn).unread_result = False
+                        raise
 
+        except Error as e:
+            self.logger.error(f"Error streaming recent logs: {e}")
+            raise
+
+    def get_logs_page(self, log_level: str = None, site_id: str = None,
+                      limit: int = None, offset: int = 0, before: tuple = None) -> dict[str, Any]:
+        """
+        Get everything the logs page needs using a single database connection.
+
+        The site_id filter is only applied if it names a site in site_list, so the
+        site lookup, filter validation and log query share one round-trip setup.
+
+        Args:
+            log_level: Optional log level to filter by (case-insensitive)
+            site_id: Optional site ID to filter by, ignored if not a valid site
+            limit: Optional maximum number of log records to return
+            offset: Number of log records to skip (used with limit for paging)
+            before: Optional (timestamp, log_id) of the last log on the previous page,
+                    only logs ordered after it are returned (keyset paging, no rows skipped)
+
+        Returns:
+            Dictionary with keys:
+                - valid_site_ids (list): site_name values from site_list
+                - site_id (str | None): the site filter that was applied
+                - logs (list): log records from the last 30 days
+        """
+        page = {'valid_site_ids': [], 'site_id': None, 'logs': []}
+        try:
+            with self._get_connection() as conn:
+                with conn.cursor(dictionary=True) as cursor:
+                    cursor.execute("SELECT site_name FROM site_list ORDER BY site_name")
+                    page['valid_site_ids'] = [row['site_name'] for row in cursor.fetchall()]
+
+                    if site_id and site_id in page['valid_site_ids']:
+                        page['site_id'] = site_id
+
+                    query, params = self._recent_logs_query(log_level, page['site_id'], limit, offset, before)
+                    cursor.execute(query, params)
+                    page['logs'] = cursor.fetchall() or []
+                    self._log_recent_logs_result(page['logs'], log_level, page['site_id'])
+
+        except Error as e:
+            self.logger.error(f"Error fetching logs page: {e}")
+        return page
+
+    @staticmethod
+    def _recent_logs_query(log_level: str = None, site_id: str = None,
+                           limit: int = None, offset: int = 0, before: tuple = None) -> tuple[str, list]:
+        """Build the last-30-days logs query and its parameters for the optional filters."""
+        thirty_days_ago = datetime.now() - timedelta(days=30)
 
-        # Build query with optional filters
         query = """
                 SELECT log_id, \
                        site_id, \
@@ -405,38 +450,42 @@ class CoreMYSQLConnection(CoreDBConnection):
                 """
         params = [thirty_days_ago]
 
+        # Both columns use case-insensitive collation, comparing them directly keeps the
+        # (log_level, site_id, timestamp) index usable
         if log_level:
-            query += " AND UPPER(log_level) = UPPER(%s)"
+            query += " AND log_level = %s"
             params.append(log_level)
 
         if site_id:
-            query += " AND UPPER(site_id) = UPPER(%s)"
+            query += " AND site_id = %s"
             params.append(site_id)
 
-        query += " ORDER BY timestamp DESC"
+        # Seek past the previous page instead of reading and discarding offset rows
+        if before is not None:
+            query += " AND (timestamp < %s OR (timestamp = %s AND log_id < %s))"
+            params.extend([before[0], before[0], before[1]])
 
-        try:
-            with self._get_connection() as conn:
-                with conn.cursor(dictionary=True) as cursor:
-                    cursor.execute(query, params)
-                    results = cursor.fetchall()
+        # log_id breaks timestamp ties so pages are stable, it is the primary key so the
+        # timestamp indexes still provide the order
+        query += " ORDER BY timestamp DESC, log_id DESC"
 
-                    filter_desc = []
-                    if log_level:
-                        filter_desc.append(f"log_level={log_level}")
-                    if site_id:
-                        filter_desc.append(f"site_id={site_id}")
-                    filter_str = f" with filters: {', '.join(filter_desc)}" if filter_desc else ""
-                    if results:
-                        self.logger.debug(f"Retrieved {len(results)} log records from last 30 days{filter_str}")
-                        return results
-                    else:
-                        self.logger.debug(f"No log records found in the last 30 days{filter_str}")
-                        return []
+        if limit is not None:
+            query += " LIMIT %s OFFSET %s"
+            params.extend([limit, offset])
+        return query, params
 
-        except Error as e:
-            self.logger.error(f"Error fetching recent logs: {e}")
-            return []
+    def _log_recent_logs_result(self, results: list, log_level: str = None, site_id: str = None):
+        """Debug log the outcome of a recent logs query."""
+        filter_desc = []
+        if log_level:
+            filter_desc.append(f"log_level={log_level}")
+        if site_id:
+            filter_desc.append(f"site_id={site_id}")
+        filter_str = f" with filters: {', '.join(filter_desc)}" if filter_desc else ""
+        if results:
+            self.logger.debug(f"Retrieved {len(results)} log records from last 30 days{filter_str}")
+        else:
+            self.logger.debug(f"No log records found in the last 30 days{filter_str}")
 
     def get_valid_site_ids(self) -> list:
         """
@@ -589,15 +638,35 @@ class CoreMYSQLConnection(CoreDBConnection):
             ValueError: If invalid log_level is provided
         """
         # Input validation
-        allowed_log_levels = VALID_LOG_LEVELS
         if not isinstance(log_level, str):
             raise ValueError("log_level must be a string")
 
-        if log_level.upper() not in allowed_log_levels:
-            raise ValueError(f"Invalid log_level. Allowed: {allowed_log_levels}")
+        log_level = log_level.upper()
+        if log_level not in VALID_LOG_LEVELS:
+            raise ValueError(f"Invalid log_level. Allowed: {sorted(VALID_LOG_LEVELS)}")
+
+        # Dashboards poll this per level; reuse a count within the same time window
+        window = int(time()) // self._LOG_COUNT_WINDOW
+        cached = self._log_counts.get(log_level)
+        if cached and cached[0] == window:
+            return cached[1]
+
+        count = self._query_log_count_last_24h(log_level)
+        if count is None:
+            return 0
+        self._log_counts[log_level] = (window, count)
+        return count
 
-        from datetime import datetime, timedelta
+    def _query_log_count_last_24h(self, log_level: str) -> int | None:
+        """
+        Count log entries for a validated, upper-cased log level in the last 24 hours.
 
+        Args:
+            log_level: Log level to count
+
+        Returns:
+            Integer count of matching log records, or None on error
+        """
         # Calculate 24 hours ago as a datetime object
         twenty_four_hours_ago = datetime.now() - timedelta(hours=24)
 
@@ -608,7 +677,7 @@ class CoreMYSQLConnection(CoreDBConnection):
                 WHERE log_level = %s
                   AND timestamp >= %s
                 """
-        query_params = [log_level.upper(), twenty_four_hours_ago]
+        query_params = [log_level, twenty_four_hours_ago]
 
         try:
             with self._get_connection() as conn:
@@ -624,11 +693,11 @@ class CoreMYSQLConnection(CoreDBConnection):
         except mysql.connector.Error as e:
             # More specific error handling
             self.logger.error(f"MySQL error counting log records: {e.errno} - {e.msg}")
-            return 0
+            return None
         except Exception as e:
             # Catch any other unexpected errors
             self.logger.error(f"Unexpected error counting log records: {e}")
-            return 0
+            return None
 
     def put_remote_hash_status(self, update_list: list[dict[str, str]],
                                site_name: str,
@@ -4,67 +4,80 @@ Database module for REST API package.
 This module provides a factory function to create database instances
 using configuration from the config module.
 """
+from importlib import import_module
 from typing import Optional, Dict, Type
 
 from database_client import logging_config
 from .db_implementation import DBInstance
-from .remote_memory import RemoteInMemoryConnection
-from .remote_mssql_untested import RemoteMSSQLConnection
-from .remote_mysql import RemoteMYSQLConnection
-from .core_mysql import CoreMYSQLConnection
-from .pipeline_mssql import PipelineMSSQLConnection
-from .pipeline_mysql import PipelineMYSQLConnection
 
-class DBClientFactory:
-    def __init__(self, config: Optional[Dict] = None):
-        self.config = config or {}
-        self.logger = logging_config.configure_logging()
+# Backend classes by name, imported only when a configuration selects them so
+# processes don't load database drivers (pyodbc, mysql connector) they never use
+_BACKEND_MODULES = {
+    'RemoteInMemoryConnection': '.remote_memory',
+    'RemoteMSSQLConnection': '.remote_mssql_untested',
+    'RemoteMYSQLConnection': '.remote_mysql',
+    'CoreMYSQLConnection': '.core_mysql',
+    'PipelineMSSQLConnection': '.pipeline_mssql',
+    'PipelineMYSQLConnection': '.pipeline_mysql',
+}
 
-    def create_client(self) -> DBInstance:
-        """Create a database client instance"""
-        db_config = self.config.get('database', {})
+# Database implementation mappings
+REMOTE_TYPES = {
+    'mysql': 'RemoteMYSQLConnection',
+    'mssql': 'RemoteMSSQLConnection',
+    'local': 'RemoteInMemoryConnection',
+}
+CORE_TYPES = {
+    'mysql': 'CoreMYSQLConnection',
+}
+PIPELINE_TYPES = {
+    'mssql': 'PipelineMSSQLConnection',
+    'mysql': 'PipelineMYSQLConnection',
+}
+# (role, type key, config key, DBInstance argument, type mapping)
+_ROLES = tuple(
+    (role, f'{role}_type', f'{role}_config', f'{role}_db', types)
+    for role, types in (('remote', REMOTE_TYPES), ('core', CORE_TYPES), ('pipeline', PIPELINE_TYPES))
+)
 
-        # Database implementation mappings
-        remote_types = {
-            'mysql': RemoteMYSQLConnection,
-            'mssql': RemoteMSSQLConnection,
-            'local': RemoteInMemoryConnection,
-        }
 
-        core_types = {
-            'mysql': CoreMYSQLConnection,
-        }
+def __getattr__(name: str) -> Type:
+    """Import a backend class on first access and keep it as a module attribute."""
+    module_name = _BACKEND_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    backend = getattr(import_module(module_name, __package__), name)
+    globals()[name] = backend
+    return backend
 
-        pipeline_types = {
-            'mssql': PipelineMSSQLConnection,
-            'mysql': PipelineMYSQLConnection,
 
-        }
+def _backend(db_type: Optional[str], types: Dict[str, str]) -> Optional[Type]:
+    """Resolve the backend class for a configured type, or None if it is not mapped."""
+    name = types.get(db_type)
+    if name is None:
+        return None
+    return globals().get(name) or __getattr__(name)
 
-        # Create instances
-        remote_db = self._create_instance(
-            remote_types.get(db_config.get('remote_type')),
-            db_config.get('remote_config')
-        )
-        if remote_db:
-            self.logger.info(f'Created remote database instance: {db_config.get("remote_type")}')
 
-        core_db = self._create_instance(
-            core_types.get(db_config.get('core_type')),
-            db_config.get('core_config')
-        )
-        if core_db:
-            self.logger.info(f'Created core database instance: {db_config.get("core_type")}')
+class DBClientFactory:
+    def __init__(self, config: Optional[Dict] = None):
+        self.config = config or {}
+        self.logger = logging_config.configure_logging()
 
-        pipeline_db = self._create_instance(
-            pipeline_types.get(db_config.get('pipeline_type')),
-            db_config.get('pipeline_config')
-        )
-        if pipeline_db:
-            self.logger.info(f'Created pipeline database instance: {db_config.get("pipeline_type")}')
+    def create_client(self) -> DBInstance:
+        """Create a database client instance"""
+        db_config = self.config.get('database', {})
 
+        # Create instances, reading each role's type and config once
+        instances = {}
+        for role, type_key, config_key, instance_key, types in _ROLES:
+            db_type = db_config.get(type_key)
+            instance = self._create_instance(_backend(db_type, types), db_config.get(config_key))
+            if instance:
+                self.logger.info('Created %s database instance: %s', role, db_type)
+            instances[instance_key] = instance
 
-        return DBInstance(remote_db=remote_db, core_db=core_db, pipeline_db=pipeline_db)
+        return DBInstance(**instances)
 
     def _create_instance(self, class_type: Optional[Type], config: Optional[Dict]):
         """Helper to create an instance with optional config"""
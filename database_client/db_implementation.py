@@ -1,4 +1,4 @@
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Iterator, Tuple
 
 from .db_interfaces import RemoteDBConnection, CoreDBConnection, PipelineDBConnection
 
@@ -28,6 +28,11 @@ class DBInstance(RemoteDBConnection, CoreDBConnection, PipelineDBConnection):
             raise NotImplementedError("RemoteDBConnection implementation not provided")
         return self.remote_db.get_single_field(path, field)
 
+    def get_timestamps(self, paths: List[str], limit: Optional[int] = None) -> Dict[str, Any]:
+        if not self.remote_db:
+            raise NotImplementedError("RemoteDBConnection implementation not provided")
+        return self.remote_db.get_timestamps(paths, limit)
+
     def get_priority_updates(self) -> List[str]:
         if not self.remote_db:
             raise NotImplementedError("RemoteDBConnection implementation not provided")
@@ -38,6 +43,11 @@ class DBInstance(RemoteDBConnection, CoreDBConnection, PipelineDBConnection):
             raise NotImplementedError("RemoteDBConnection implementation not provided")
         return self.remote_db.put_log(args_dict)
 
+    def put_logs(self, rows: List[dict]) -> List[int] | None:
+        if not self.remote_db:
+            raise NotImplementedError("RemoteDBConnection implementation not provided")
+        return self.remote_db.put_logs(rows)
+
     def get_logs(self, limit: Optional[int] = None, offset: int = 0,
                  order_by: str = "timestamp", order_direction: str = "DESC",
                  session_id_filter: Optional[str] = None,
@@ -89,10 +99,22 @@ class DBInstance(RemoteDBConnection, CoreDBConnection, PipelineDBConnection):
             raise NotImplementedError("CoreDBConnection implementation not provided")
         return self.core_db.get_dashboard_content()
 
-    def get_recent_logs(self, log_level: str = None, site_id: str = None) -> list:
+    def get_recent_logs(self, log_level: str = None, site_id: str = None,
+                        limit: int = None, offset: int = 0) -> list:
         if not self.core_db:
             raise NotImplementedError("CoreDBConnection implementation not provided")
-        return self.core_db.get_recent_logs(log_level, site_id)
+        return self.core_db.get_recent_logs(log_level, site_id, limit, offset)
+
+    def iter_recent_logs(self, log_level: str = None, site_id: str = None) -> Iterator[Dict[str, Any]]:
+        if not self.core_db:
+            raise NotImplementedError("CoreDBConnection implementation not provided")
+        return self.core_db.iter_recent_logs(log_level, site_id)
+
+    def get_logs_page(self, log_level: str = None, site_id: str = None,
+                      limit: int = None, offset: int = 0, before: tuple = None) -> dict[str, Any]:
+        if not self.core_db:
+            raise NotImplementedError("CoreDBConnection implementation not provided")
+        return self.core_db.get_logs_page(log_level, site_id, limit, offset, before)
 
     def get_hash_record_count(self) -> int:
         if not self.core_db:
@@ -134,11 +156,37 @@ class DBInstance(RemoteDBConnection, CoreDBConnection, PipelineDBConnection):
             raise NotImplementedError("PipelineDBConnection implementation not provided")
         return self.pipeline_db.get_pipeline_updates()
 
+    def iter_pipeline_updates(self) -> Iterator[Dict[str, Any]]:
+        if not self.pipeline_db:
+            raise NotImplementedError("PipelineDBConnection implementation not provided")
+        return self.pipeline_db.iter_pipeline_updates()
+
+    def get_pipeline_updates_page(self, after: Optional[Tuple[Any, int]] = None,
+                                  batch_size: int = 500) -> Tuple[List[Dict[str, Any]], Optional[Tuple[Any, int]]]:
+        if not self.pipeline_db:
+            raise NotImplementedError("PipelineDBConnection implementation not provided")
+        return self.pipeline_db.get_pipeline_updates_page(after, batch_size)
+
     def put_pipeline_hash(self, update_path: str, hash_value: str) -> bool:
         if not self.pipeline_db:
             raise NotImplementedError("PipelineDBConnection implementation not provided")
         return self.pipeline_db.put_pipeline_hash(update_path, hash_value)
 
+    def put_pipeline_hash_many(self, pairs: List[Tuple[str, str]]) -> Dict[str, bool]:
+        if not self.pipeline_db:
+            raise NotImplementedError("PipelineDBConnection implementation not provided")
+        return self.pipeline_db.put_pipeline_hash_many(pairs)
+
+    def get_update_by_path(self, update_path: str) -> Optional[Dict[str, Any]]:
+        if not self.pipeline_db:
+            raise NotImplementedError("PipelineDBConnection implementation not provided")
+        return self.pipeline_db.get_update_by_path(update_path)
+
+    def get_updates_by_paths(self, update_paths: List[str]) -> Dict[str, Dict[str, Any]]:
+        if not self.pipeline_db:
+            raise NotImplementedError("PipelineDBConnection implementation not provided")
+        return self.pipeline_db.get_updates_by_paths(update_paths)
+
     def get_official_sites(self) -> List[Dict[str, Any]]:
         if not self.pipeline_db:
             raise NotImplementedError("PipelineDBConnection implementation not provided")
@@ -153,3 +201,8 @@ class DBInstance(RemoteDBConnection, CoreDBConnection, PipelineDBConnection):
         if not self.pipeline_db:
             return None
         return self.pipeline_db.pipeline_health_check()
+
+    def warm_pipeline_pool(self) -> int:
+        if not self.pipeline_db:
+            return 0
+        return self.pipeline_db.warm_pipeline_pool()
@@ -1,5 +1,7 @@
+import heapq
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any, List
+from operator import itemgetter
+from typing import Optional, Dict, Any, List, Iterator, Tuple
 
 
 class RemoteDBConnection(ABC):
@@ -21,7 +23,7 @@ class RemoteDBConnection(ABC):
         Raises:
             ValueError: If required parameters are not provided
         """
-        pass
+        raise NotImplementedError
 
     @abstractmethod
     def insert_or_update_hash(self, record: dict[str, Any]) -> bool:
@@ -34,7 +36,7 @@ class RemoteDBConnection(ABC):
         Raises:
             ValueError: If required parameters are not provided
         """
-        pass
+        raise NotImplementedError
 
     @abstractmethod
     def get_single_field(self, path: str, field: str) -> str | int | None:
@@ -48,7 +50,28 @@ class RemoteDBConnection(ABC):
         Raises:
             ValueError: If required parameters are not provided
         """
-        pass
+        raise NotImplementedError
+
+    def get_timestamps(self, paths: List[str], limit: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Get the current_dtg_latest value for several paths at once.
+
+        Implementations that can look paths up in one query should override this,
+        the default calls get_single_field for each path.
+        Args:
+            paths: Paths to retrieve timestamps for
+            limit: Only return the oldest limit paths, ties ordered by path (optional)
+        Returns:
+            Dictionary of path: timestamp, paths that were not found are left out
+        """
+        timestamps = {}
+        for path in paths:
+            timestamp = self.get_single_field(path, 'current_dtg_latest')
+            if timestamp is not None:
+                timestamps[path] = timestamp
+        if limit is not None:
+            timestamps = dict(heapq.nsmallest(limit, timestamps.items(), key=itemgetter(1, 0)))
+        return timestamps
 
     @abstractmethod
     def get_priority_updates(self) -> List[str]:
@@ -62,7 +85,7 @@ class RemoteDBConnection(ABC):
         Returns:
             A list of directory paths that need to be rechecked
         """
-        pass
+        raise NotImplementedError
 
     @abstractmethod
     def put_log(self, args_dict: dict) -> int | None:
@@ -74,7 +97,26 @@ class RemoteDBConnection(ABC):
         Returns:
             log_id number (int) if the log entry was inserted, None if an error occurred
         """
-        pass
+        raise NotImplementedError
+
+    def put_logs(self, rows: List[dict]) -> List[int] | None:
+        """
+        Put several log entries into database.
+
+        Implementations that can insert several rows in one statement should override this,
+        the default calls put_log for each entry.
+        Args:
+            rows: Log entries, each in the form accepted by put_log
+        Returns:
+            List of log_id numbers in the order of rows, None if an error occurred
+        """
+        log_ids = []
+        for row in rows:
+            log_id = self.put_log(row)
+            if log_id is None:
+                return None
+            log_ids.append(log_id)
+        return log_ids
 
     @abstractmethod
     def get_logs(self, limit: Optional[int] = None, offset: int = 0,
@@ -104,7 +146,7 @@ class RemoteDBConnection(ABC):
         Raises:
             ValueError: If invalid parameters are provided
         """
-        pass
+        raise NotImplementedError
 
     @abstractmethod
     def delete_log_entries(self, log_ids: list[int]) -> tuple[int, list]:
@@ -120,7 +162,7 @@ class RemoteDBConnection(ABC):
         Returns:
             True if the log entry was deleted, False if not found, or an error occurred.
         """
-        pass
+        raise NotImplementedError
 
     @abstractmethod
     def consolidate_logs(self) -> bool:
@@ -130,7 +172,7 @@ class RemoteDBConnection(ABC):
         Returns:
             bool: True if consolidation was successful, False otherwise
         """
-        pass
+        raise NotImplementedError
 
     @abstractmethod
     def find_orphaned_entries(self) -> list[str]:
@@ -140,7 +182,7 @@ class RemoteDBConnection(ABC):
         Returns:
              List of entries that exist but aren't listed in their parent's children arrays.
         """
-        pass
+        raise NotImplementedError
 
     @abstractmethod
     def find_untracked_children(self) -> list[Any]:
@@ -152,7 +194,7 @@ class RemoteDBConnection(ABC):
         Returns:
             List of paths that are listed in their parent's children arrays but don't exist as entries in the database.
         """
-        pass
+        raise NotImplementedError
 
     @abstractmethod
     def health_check(self) -> dict[str, bool]:
@@ -161,7 +203,7 @@ class RemoteDBConnection(ABC):
          Returns:
              {local_db: True or False} depending on if the database is active and responsive.
          """
-        pass
+        raise NotImplementedError
 
 
 class CoreDBConnection(ABC):
@@ -199,22 +241,61 @@ class CoreDBConnection(ABC):
             Returns dictionary with zero values for all metrics if query fails.
             Only includes sites that exist in the authoritative site_list table.
         """
-        pass
+        raise NotImplementedError
 
     @abstractmethod
-    def get_recent_logs(self, log_level: str = None, site_id: str = None) -> list:
+    def get_recent_logs(self, log_level: str = None, site_id: str = None,
+                        limit: int = None, offset: int = 0) -> list:
         """
         Get all logs from the last 30 days, optionally filtered by log_level and/or site_id.
 
         Args:
             log_level: Optional log level to filter by (case-insensitive)
             site_id: Optional site ID to filter by (case-insensitive)
+            limit: Optional maximum number of records to return
+            offset: Number of records to skip (used with limit for paging)
 
         Returns:
             List of dictionaries containing log records from the last 30 days,
             or empty list if no records found or an error occurred
         """
-        pass
+        raise NotImplementedError
+
+    def iter_recent_logs(self, log_level: str = None, site_id: str = None) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the logs from the last 30 days, optionally filtered by log_level and/or site_id.
+
+        Implementations that can stream rows from the database should override this,
+        the default materializes get_recent_logs.
+
+        Args:
+            log_level: Optional log level to filter by (case-insensitive)
+            site_id: Optional site ID to filter by (case-insensitive)
+
+        Yields:
+            Dictionaries containing log records from the last 30 days, newest first
+        """
+        yield from self.get_recent_logs(log_level, site_id)
+
+    @abstractmethod
+    def get_logs_page(self, log_level: str = None, site_id: str = None,
+                      limit: int = None, offset: int = 0, before: tuple = None) -> dict[str, Any]:
+        """
+        Get the valid site list and filtered recent logs in one database round-trip.
+
+        Args:
+            log_level: Optional log level to filter by (case-insensitive)
+            site_id: Optional site ID to filter by, ignored if not in site_list
+            limit: Optional maximum number of log records to return
+            offset: Number of log records to skip (used with limit for paging)
+            before: Optional (timestamp, log_id) of the last log on the previous page,
+                    only logs ordered after it are returned (keyset paging, no rows skipped)
+
+        Returns:
+            Dictionary with 'valid_site_ids', the applied 'site_id' filter and 'logs',
+            with empty values if an error occurred
+        """
+        raise NotImplementedError
 
     @abstractmethod
     def get_hash_record_count(self) -> int:
@@ -224,7 +305,7 @@ class CoreDBConnection(ABC):
         Returns:
             Integer count of total records or None if an error occurred
         """
-        pass
+        raise NotImplementedError
 
     @abstractmethod
     def get_log_count_last_24h(self, log_level: str) -> int:
@@ -245,7 +326,7 @@ class CoreDBConnection(ABC):
         Raises:
             ValueError: If invalid log_level is provided
         """
-        pass
+        raise NotImplementedError
 
     @abstractmethod
     def get_site_liveness(self) -> list:
@@ -257,7 +338,7 @@ class CoreDBConnection(ABC):
             or empty list if no records found or an error occurred.
             Each dictionary contains: site_name, last_updated, status_category
         """
-        pass
+        raise NotImplementedError
 
     @abstractmethod
     def get_site_sync_status(self) -> list:
@@ -270,7 +351,7 @@ class CoreDBConnection(ABC):
             or empty list if no records found or an error occurred.
             Each dictionary contains: site_name, current_hash, last_updated, sync_category
         """
-        pass
+        raise NotImplementedError
 
     @abstractmethod
     def put_remote_hash_status(self, update_list: list[dict[str, str]],
@@ -288,11 +369,11 @@ class CoreDBConnection(ABC):
         Returns:
             List paths updated
         """
-        pass
+        raise NotImplementedError
 
     @abstractmethod
     def sync_sites_from_mssql_upsert(self, mssql_sites: List[Dict[str, Any]]) -> bool:
-        pass
+        raise NotImplementedError
 
 
 class PipelineDBConnection(ABC):
@@ -305,15 +386,65 @@ class PipelineDBConnection(ABC):
 
     @abstractmethod
     def get_pipeline_updates(self) -> List[Dict[str, Any]]:
-        pass
+        raise NotImplementedError
+
+    def iter_pipeline_updates(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the unprocessed pipeline updates.
+
+        Implementations that can stream rows from the database should override this,
+        the default materializes get_pipeline_updates.
+        """
+        yield from self.get_pipeline_updates()
+
+    def get_pipeline_updates_page(self, after: Optional[Tuple[Any, int]] = None,
+                                  batch_size: int = 500) -> Tuple[List[Dict[str, Any]], Optional[Tuple[Any, int]]]:
+        """
+        Get one page of unprocessed pipeline updates ordered by (timestamp, id).
+
+        Callers pass the returned cursor back in until it comes back as None.
+        Implementations that can seek in the database should override this,
+        the default pages through get_pipeline_updates.
+        """
+        if not isinstance(batch_size, int) or batch_size <= 0:
+            raise ValueError("batch_size must be a positive integer")
+        updates = sorted(self.get_pipeline_updates(), key=itemgetter('timestamp', 'id'))
+        if after is not None:
+            updates = [update for update in updates if (update['timestamp'], update['id']) > tuple(after)]
+        page = updates[:batch_size]
+        if len(updates) <= batch_size:
+            return page, None
+        return page, (page[-1]['timestamp'], page[-1]['id'])
 
     @abstractmethod
     def put_pipeline_hash(self, update_path: str, hash_value: str) -> bool:
-        pass
+        raise NotImplementedError
+
+    def put_pipeline_hash_many(self, pairs: List[Tuple[str, str]]) -> Dict[str, bool]:
+        """Update many hashes, backends without a batched statement update one at a time."""
+        return {update_path: self.put_pipeline_hash(update_path, hash_value)
+                for update_path, hash_value in pairs}
+
+    @abstractmethod
+    def get_update_by_path(self, update_path: str) -> Optional[Dict[str, Any]]:
+        raise NotImplementedError
+
+    def get_updates_by_paths(self, update_paths: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the update records for many paths, keyed by path, paths with no record are left out.
+
+        Backends without a batched query look the paths up one at a time.
+        """
+        records = {}
+        for update_path in update_paths:
+            record = self.get_update_by_path(update_path)
+            if record:
+                records[update_path.strip()] = record
+        return records
 
     @abstractmethod
     def get_official_sites(self) -> List[Dict[str, Any]]:
-        pass
+        raise NotImplementedError
 
     # @abstractmethod
     # def put_pipeline_site_completion(self, site: str) -> bool:
@@ -321,4 +452,8 @@ class PipelineDBConnection(ABC):
 
     @abstractmethod
     def pipeline_health_check(self) -> Dict[str, bool]:
-        pass
+        raise NotImplementedError
+
+    def warm_pipeline_pool(self) -> int:
+        """Open pooled connections ahead of the first request, returns how many were opened."""
+        return 0
@@ -7,7 +7,7 @@ import logging
 import sys
 from typing import Optional
 
-VALID_LOG_LEVELS = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
+VALID_LOG_LEVELS = frozenset({'DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'})
 
 def configure_logging(log_level: Optional[str] = None) -> logging.Logger:
     """
@@ -34,11 +34,15 @@ def configure_logging(log_level: Optional[str] = None) -> logging.Logger:
         numeric_level = logging.INFO
     logger.setLevel(numeric_level)
 
-    # Only add handler if none exist (prevents duplicates)
-    if not logger.handlers:
-        # Create a console handler
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(numeric_level)
+    # Handlers are attached once per process; re-running configure_logging only updates the level
+    if logger.handlers:
+        for handler in logger.handlers:
+            handler.setLevel(numeric_level)
+        return logger
+
+    # Create a console handler
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setLevel(numeric_level)
 
     # Create formatter
     formatter = logging.Formatter(
@@ -0,0 +1,112 @@
+import os
+import threading
+import mysql.connector
+from mysql.connector import Error, pooling
+from contextlib import contextmanager
+
+from database_client import logging_config
+
+
+class MYSQLConnectionBase:
+    """
+    Shared connection handling for the MySQL backed database classes.
+
+    The remote and core MySQL classes use the same connection settings and
+    connection lifecycle, this class holds that setup in one place.
+
+    Connections come from a per-process pool so requests reuse established
+    sessions instead of paying a TCP and auth handshake each time.
+    """
+    def __init__(self, host=None, database=None, user=None, password=None, port=3306,
+                 connection_factory=None, autocommit=True, raise_on_warnings=True, pool_size=5, **kwargs):
+        """
+        Initialize the database connection configuration.
+
+        Args:
+            host: Database host
+            database: Database name
+            user: Database user
+            password: Database password
+            port: Database port (default: 3306)
+            connection_factory: Optional factory function for creating connections (for testing)
+            autocommit: Whether to autocommit transactions (default: True)
+            raise_on_warnings: Whether to raise on warnings (default: True)
+            pool_size: Connections kept in the pool, 0 disables pooling (default: 5)
+        """
+        self.config = {
+            'host': host,
+            'database': database,
+            'user': user,
+            'password': password,
+            'port': port,
+            'autocommit': autocommit,
+            'raise_on_warnings': raise_on_warnings
+        }
+        self.database = database
+        self.pool_size = min(pool_size, pooling.CNX_POOL_MAXSIZE)
+        if connection_factory:
+            self.connection_factory = connection_factory
+        elif self.pool_size > 0:
+            self.connection_factory = self._get_pooled_connection
+        else:
+            self.connection_factory = mysql.connector.connect
+        self._pool = None
+        self._pool_pid = None
+        self._pool_lock = threading.Lock()
+
+        self.other_args = kwargs
+
+        self.logger = logging_config.configure_logging()
+
+    def _get_pooled_connection(self, **config):
+        """
+        Get a connection from this process's pool, creating the pool on first use.
+
+        The pool is rebuilt after a fork (gunicorn preload_app), so workers never
+        share sockets opened by the master.
+
+        Args:
+            config: Connection arguments, used when the pool is created
+
+        Returns:
+            Pooled MySQL connection, closing it returns it to the pool
+        """
+        pid = os.getpid()
+        if self._pool is None or self._pool_pid != pid:
+            with self._pool_lock:
+                if self._pool is None or self._pool_pid != pid:
+                    self._pool = pooling.MySQLConnectionPool(pool_name=f"squishy_{id(self)}",
+                                                             pool_size=self.pool_size, **config)
+                    self._pool_pid = pid
+        return self._pool.get_connection()
+
+    @contextmanager
+    def _get_connection(self):
+        """
+        Context manager for database connections.
+
+        Yields:
+            MySQL connection object
+
+        Raises:
+            Error: If a database error occurs
+        """
+        connection = None
+        try:
+            connection = self.connection_factory(**self.config)
+            self.logger.debug(f"Database connection established to {self.config['host']}")
+            yield connection
+        except Error as e:
+            self.logger.error(f"Database error: {e}")
+            if connection:
+                connection.rollback()
+            raise
+        finally:
+            # No is_connected() check, it pings the server. Closing a pooled connection only
+            # returns it to the pool, and closing one that already dropped is harmless.
+            if connection:
+                try:
+                    connection.close()
+                    self.logger.debug("Database connection closed")
+                except Error as e:
+                    self.logger.debug(f"Database connection already closed: {e}")
@@ -1,10 +1,23 @@
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple, Iterator
+import os
+import queue
+import threading
 import pyodbc
+from time import monotonic
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 
 from .db_interfaces import PipelineDBConnection
 from database_client import logging_config
 
+_CONNECTION_STRING = ("DRIVER={{{driver}}};SERVER={server},{port};DATABASE={database};"
+                      "UID={username};PWD={password};Connection Timeout={timeout};")
+
+
+def _odbc_quote(value) -> str:
+    """Brace-quote a connection string value so ';' or '}' in it can't end the attribute."""
+    return "{" + str(value).replace("}", "}}") + "}"
+
 
 class PipelineMSSQLConnection(PipelineDBConnection):
     """
@@ -12,10 +25,27 @@ class PipelineMSSQLConnection(PipelineDBConnection):
 
     This class provides methods to interact with the MSSQL database
     for retrieving pipeline updates, sites, and updating hash values.
+
+    Connections are kept in a per-process pool so requests reuse open sessions
+    instead of paying a TCP, TLS and login handshake each time.
     """
+    _UPDATE_COLUMNS = ('id', 'TC_id', 'timestamp', 'update_path', 'update_size', 'hash_value')
+    _SITE_COLUMNS = ('id', 'name', 'site_name', 'online', 'description', 'created_at', 'updated_at')
+    _SELECT_UPDATES = f"SELECT {', '.join(_UPDATE_COLUMNS)} FROM authorized_updates"
+    # update_path is not declared unique, TOP (1) lets the server stop at the first match
+    _SELECT_UPDATE_BY_PATH = f"SELECT TOP (1) {', '.join(_UPDATE_COLUMNS)} FROM authorized_updates WHERE update_path = ?"
+    _SELECT_SITES = f"SELECT {', '.join(_SITE_COLUMNS)} FROM pipeline_site_list"
+    # Two parameters per row keeps each batch under SQL Server's 2100 parameter cap
+    _HASH_BATCH_SIZE = 1000
+    # Paths per IN (...) list, under SQL Server's 2100 parameter cap
+    _PATH_BATCH_SIZE = 2000
+    # Rows pulled from the driver per fetchmany call
+    _FETCH_SIZE = 1000
+    _HEALTH_CHECK_TTL = 5.0  # Seconds a successful query stands in for a health probe
 
     def __init__(self, server=None, database=None, username=None, password=None, driver=None,
-                 port=1433, connection_timeout=30, command_timeout=30, **kwargs):
+                 port=1433, connection_timeout=30, command_timeout=30, pool_size=5,
+                 validate_on_checkout=False, validate_idle_after=30.0, sites_cache_ttl=60.0, **kwargs):
         """
         Initialize the MSSQL database connection configuration.
 
@@ -28,6 +58,11 @@ class PipelineMSSQLConnection(PipelineDBConnection):
             port: Database port (default: 1433)
             connection_timeout: Connection timeout in seconds (default: 30)
             command_timeout: Command timeout in seconds (default: 30)
+            pool_size: Idle connections kept for reuse, 0 disables pooling (default: 5)
+            validate_on_checkout: Run SELECT 1 on every pooled connection before handing it out (default: False)
+            validate_idle_after: Seconds a pooled connection may sit idle before it is checked
+                                 with SELECT 1 on checkout (default: 30)
+            sites_cache_ttl: Seconds get_official_sites reuses its last result, 0 disables (default: 60)
         """
         self.server = server
         self.database = database
@@ -37,26 +72,150 @@ class PipelineMSSQLConnection(PipelineDBConnection):
         self.port = port
         self.connection_timeout = connection_timeout
         self.command_timeout = command_timeout
+        self.pool_size = max(pool_size, 0)
+        self.validate_on_checkout = validate_on_checkout
+        self.validate_idle_after = validate_idle_after
+        self._pool = None
+        self._pool_pid = None
+        self._pool_lock = threading.Lock()
+        self._last_success = None  # monotonic time a connection last finished without a database error
+        self.sites_cache_ttl = sites_cache_ttl
+        self._sites_cache = None  # (monotonic time fetched, sites) of the last good query
+        self._sites_lock = threading.Lock()
 
         self.other_args = kwargs
 
-        # Build connection string
-        self.connection_string = (
-            f"DRIVER={{{self.driver}}};"
-            f"SERVER={self.server},{self.port};"
-            f"DATABASE={self.database};"
-            f"UID={self.username};"
-            f"PWD={self.password};"
-            f"Connection Timeout={self.connection_timeout};"
-        )
+        self.connection_string = _CONNECTION_STRING.format(
+            driver=self.driver, server=self.server, port=self.port, database=self.database,
+            username=_odbc_quote(self.username), password=_odbc_quote(self.password),
+            timeout=self.connection_timeout)
 
+        # Handlers are attached once per process, later calls only set the level
         self.logger = logging_config.configure_logging()
 
+    def _get_pool(self) -> queue.Queue:
+        """
+        Get this process's queue of idle (connection, monotonic time returned) pairs,
+        creating it on first use.
+
+        The queue is rebuilt after a fork (gunicorn preload_app), so workers never
+        share connections opened by the master.
+        """
+        pid = os.getpid()
+        if self._pool is None or self._pool_pid != pid:
+            with self._pool_lock:
+                if self._pool is None or self._pool_pid != pid:
+                    self._pool = queue.LifoQueue(maxsize=self.pool_size)
+                    self._pool_pid = pid
+        return self._pool
+
+    def _checkout(self):
+        """
+        Take an idle connection from the pool, or open a new one when none is idle.
+
+        A connection that sat idle longer than validate_idle_after is checked first,
+        so one the server dropped (restart, failover, idle timeout) is replaced
+        rather than handed to a query whose error would read as "no results".
+
+        Returns:
+            pyodbc connection object
+        """
+        pool = self._get_pool()
+        while True:
+            try:
+                connection, idle_since = pool.get_nowait()
+            except queue.Empty:
+                break
+            if not self.validate_on_checkout and monotonic() - idle_since < self.validate_idle_after:
+                return connection
+            try:
+                connection.cursor().execute("SELECT 1").fetchone()
+                return connection
+            except pyodbc.Error as e:
+                self.logger.debug(f"Discarding dead pooled MSSQL connection: {e}")
+                self._discard(connection)
+
+        connection = pyodbc.connect(self.connection_string)
+        connection.timeout = self.command_timeout
+        self.logger.debug(f"MSSQL connection established to {self.server}")
+        return connection
+
+    def _checkin(self, connection) -> None:
+        """Return a healthy connection to the pool, closing it if the pool is full."""
+        if not self.pool_size:
+            self._discard(connection)
+            return
+        try:
+            # End any open read transaction so the next user starts clean
+            connection.rollback()
+            self._get_pool().put_nowait((connection, monotonic()))
+        except queue.Full:
+            self._discard(connection)
+        except pyodbc.Error as e:
+            self.logger.debug(f"Discarding MSSQL connection that failed to reset: {e}")
+            self._discard(connection)
+
+    def _discard_idle(self) -> None:
+        """Close every idle pooled connection, they likely share the fate of one that just failed."""
+        pool = self._get_pool()
+        while True:
+            try:
+                connection, _ = pool.get_nowait()
+            except queue.Empty:
+                return
+            self._discard(connection)
+
+    def _discard(self, connection) -> None:
+        """Close a connection without returning it to the pool."""
+        try:
+            connection.close()
+            self.logger.debug("MSSQL connection closed")
+        except pyodbc.Error:
+            pass
+
+    def _open_idle_connection(self) -> bool:
+        """Open one connection and park it in the pool, used to warm the pool."""
+        try:
+            connection = pyodbc.connect(self.connection_string)
+            connection.timeout = self.command_timeout
+        except pyodbc.Error as e:
+            self.logger.warning(f"Could not pre-open MSSQL connection: {e}")
+            return False
+        try:
+            self._get_pool().put_nowait((connection, monotonic()))
+            return True
+        except queue.Full:
+            self._discard(connection)
+            return False
+
+    def warm_pipeline_pool(self) -> int:
+        """
+        Fill the pool with open connections so no request pays the login handshake.
+
+        pyodbc releases the GIL while the driver connects, so the connections are
+        opened side by side on short-lived threads rather than one after another.
+        Call this once per process after any fork, e.g. from the gunicorn post_fork hook.
+
+        Returns:
+            Number of connections opened
+        """
+        missing = self.pool_size - self._get_pool().qsize()
+        if missing <= 0:
+            return 0
+        with ThreadPoolExecutor(max_workers=missing) as executor:
+            opened = sum(executor.map(lambda _: self._open_idle_connection(), range(missing)))
+        self.logger.debug(f"Pre-opened {opened} MSSQL connections")
+        return opened
+
     @contextmanager
     def _get_connection(self):
         """
         Context manager for database connections.
 
+        Connections that raised a database error are closed rather than pooled. The
+        idle pooled connections are closed with them, so after a server restart only
+        one call fails and the following checkouts open fresh connections.
+
         Yields:
             pyodbc connection object
 
@@ -64,25 +223,109 @@ class PipelineMSSQLConnection(PipelineDBConnection):
             Exception: If a database error occurs
         """
         connection = None
+        healthy = False
         try:
-            connection = pyodbc.connect(self.connection_string)
-            connection.timeout = self.command_timeout
-            self.logger.debug(f"MSSQL connection established to {self.server}")
+            connection = self._checkout()
             yield connection
+            healthy = True
+            self._last_success = monotonic()
         except pyodbc.Error as e:
             self.logger.error(f"MSSQL database error: {e}")
-            if connection:
-                connection.rollback()
+            self._last_success = None  # The next health check probes the server
+            self._discard_idle()
             raise
         except Exception as e:
             self.logger.error(f"Unexpected error connecting to MSSQL: {e}")
-            if connection:
-                connection.rollback()
+            # Not a connection problem, the connection is rolled back and reused
+            healthy = True
             raise
         finally:
             if connection:
-                connection.close()
-                self.logger.debug("MSSQL connection closed")
+                if healthy:
+                    self._checkin(connection)
+                else:
+                    self._discard(connection)
+
+    def _iter_dicts(self, cursor, columns: Tuple[str, ...]) -> Iterator[Dict[str, Any]]:
+        """
+        Stream the rows of an executed query as dictionaries keyed by the given columns.
+
+        Rows are fetched in blocks of _FETCH_SIZE so a large result never has to
+        sit in the driver's buffer and a Python list at the same time.
+        """
+        cursor.arraysize = self._FETCH_SIZE
+        while True:
+            rows = cursor.fetchmany(self._FETCH_SIZE)
+            if not rows:
+                return
+            yield from (dict(zip(columns, row)) for row in rows)
+
+    def iter_pipeline_updates(self) -> Iterator[Dict[str, Any]]:
+        """
+        Stream TeamCity updates that haven't been processed yet (hash_value is NULL).
+
+        The connection is held until the iterator is exhausted or closed.
+
+        Yields:
+            Dictionaries with the same keys as get_pipeline_updates
+
+        Raises:
+            pyodbc.Error: If a database error occurs
+        """
+        query = f"{self._SELECT_UPDATES} WHERE hash_value IS NULL ORDER BY timestamp ASC, id ASC"
+
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(query)
+            yield from self._iter_dicts(cursor, self._UPDATE_COLUMNS)
+
+    def get_pipeline_updates_page(self, after: Optional[Tuple[Any, int]] = None,
+                                  batch_size: int = 500) -> Tuple[List[Dict[str, Any]], Optional[Tuple[Any, int]]]:
+        """
+        Get one page of unprocessed TeamCity updates, oldest first.
+
+        Pages are keyed on (timestamp, id) rather than an offset, so each page is a
+        bounded seek and rows sharing a timestamp are never skipped or repeated.
+        Callers pass the returned cursor back in until it comes back as None.
+
+        Args:
+            after: Cursor returned with the previous page, None for the first page
+            batch_size: Maximum number of records in the page (default: 500)
+
+        Returns:
+            Tuple of the page's update dictionaries and the cursor for the next page,
+            the cursor is None on the last page. ([], None) if an error occurred
+
+        Raises:
+            ValueError: If batch_size is not a positive integer
+        """
+        if not isinstance(batch_size, int) or batch_size <= 0:
+            raise ValueError("batch_size must be a positive integer")
+
+        query = f"SELECT TOP (?) {', '.join(self._UPDATE_COLUMNS)} FROM authorized_updates WHERE hash_value IS NULL"
+        params = [batch_size]
+        if after is not None:
+            query += " AND (timestamp > ? OR (timestamp = ? AND id > ?))"
+            params += [after[0], after[0], after[1]]
+        query += " ORDER BY timestamp ASC, id ASC"
+
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(query, params)
+                page = list(self._iter_dicts(cursor, self._UPDATE_COLUMNS))
+
+        except pyodbc.Error as e:
+            self.logger.error(f"Error fetching pipeline updates page: {e}")
+            return [], None
+        except Exception as e:
+            self.logger.error(f"Unexpected error fetching pipeline updates page: {e}")
+            return [], None
+
+        self.logger.debug(f"Retrieved {len(page)} unprocessed pipeline updates")
+        if len(page) < batch_size:
+            return page, None
+        return page, (page[-1]['timestamp'], page[-1]['id'])
 
     def get_pipeline_updates(self) -> List[Dict[str, Any]]:
         """
@@ -97,29 +340,10 @@ class PipelineMSSQLConnection(PipelineDBConnection):
             - update_size: Size in bytes
             - hash_value: Will be None for unprocessed updates
         """
-        query = """
-                SELECT id, TC_id, timestamp, update_path, update_size, hash_value
-                FROM authorized_updates
-                WHERE hash_value IS NULL
-                ORDER BY timestamp ASC \
-                """
-
         try:
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(query)
-
-                # Get column names
-                columns = [column[0] for column in cursor.description]
-
-                # Fetch all rows and convert to list of dictionaries
-                results = []
-                for row in cursor.fetchall():
-                    row_dict = dict(zip(columns, row))
-                    results.append(row_dict)
-
-                self.logger.debug(f"Retrieved {len(results)} unprocessed pipeline updates")
-                return results
+            results = list(self.iter_pipeline_updates())
+            self.logger.debug(f"Retrieved {len(results)} unprocessed pipeline updates")
+            return results
 
         except pyodbc.Error as e:
             self.logger.error(f"Error fetching pipeline updates: {e}")
@@ -150,12 +374,7 @@ class PipelineMSSQLConnection(PipelineDBConnection):
         update_path = update_path.strip()
         hash_value = hash_value.strip()
 
-        query = """
-                UPDATE authorized_updates
-                SET hash_value = ?
-                WHERE update_path = ? \
-                  AND hash_value IS NULL \
-                """
+        query = "UPDATE authorized_updates SET hash_value = ? WHERE update_path = ? AND hash_value IS NULL"
 
         try:
             with self._get_connection() as conn:
@@ -182,42 +401,118 @@ class PipelineMSSQLConnection(PipelineDBConnection):
             self.logger.error(f"Unexpected error updating pipeline hash: {e}")
             return False
 
+    def put_pipeline_hash_many(self, pairs: List[Tuple[str, str]]) -> Dict[str, bool]:
+        """
+        Update the hash values for many update paths in one transaction.
+
+        Each batch is a single UPDATE joined to a VALUES list, the OUTPUT clause
+        reports which paths were updated so no per-row round trip is needed. It
+        returns the caller's path from the VALUES list rather than the stored one,
+        which the collation may match despite differing case or trailing spaces.
+
+        Args:
+            pairs: (update_path, hash_value) tuples, a repeated path keeps its last hash
+
+        Returns:
+            Dictionary mapping each update path to True if its hash was stored,
+            every path maps to False if an error occurred
+
+        Raises:
+            ValueError: If any pair is missing its update_path or hash_value
+        """
+        updates = {}
+        for update_path, hash_value in pairs:
+            if not update_path or not hash_value:
+                self.logger.debug("put_pipeline_hash_many missing update_path or hash_value")
+                raise ValueError("update_path and hash_value must be provided")
+            updates[update_path.strip()] = hash_value.strip()
+
+        results = dict.fromkeys(updates, False)
+        if not updates:
+            return results
+
+        items = list(updates.items())
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                for start in range(0, len(items), self._HASH_BATCH_SIZE):
+                    batch = items[start:start + self._HASH_BATCH_SIZE]
+                    values = ", ".join(["(?, ?)"] * len(batch))
+                    query = f"""
+                            UPDATE a
+                            SET a.hash_value = v.hash_value
+                            OUTPUT v.update_path
+                            FROM authorized_updates a
+                            JOIN (VALUES {values}) AS v(update_path, hash_value)
+                              ON a.update_path = v.update_path
+                            WHERE a.hash_value IS NULL
+                            """
+                    cursor.execute(query, [value for pair in batch for value in pair])
+                    for (update_path,) in cursor.fetchall():
+                        results[update_path] = True
+                conn.commit()
+
+        except pyodbc.Error as e:
+            self.logger.error(f"Error updating pipeline hashes: {e}")
+            return dict.fromkeys(updates, False)
+        except Exception as e:
+            self.logger.error(f"Unexpected error updating pipeline hashes: {e}")
+            return dict.fromkeys(updates, False)
+
+        updated = sum(results.values())
+        self.logger.info(f"Updated hashes for {updated} of {len(results)} pipeline paths")
+        if updated < len(results):
+            self.logger.warning(f"No unprocessed update found for {len(results) - updated} paths")
+        return results
+
     def get_official_sites(self) -> List[Dict[str, Any]]:
         """
         Get all site records from the MSSQL pipeline_site_list table.
 
+        The site list rarely changes, a successful result is reused for
+        sites_cache_ttl seconds and only one thread refreshes it when it expires.
+
         Returns:
             List of dictionaries containing site data, or empty list if error occurred
         """
-        query = """
-                SELECT id, name, site_name, online, description, created_at, updated_at
-                FROM pipeline_site_list
-                ORDER BY site_name
-                """
+        cached = self._sites_cache
+        if cached and monotonic() - cached[0] < self.sites_cache_ttl:
+            return list(cached[1])
+        with self._sites_lock:
+            # Another thread may have refreshed the list while this one waited
+            cached = self._sites_cache
+            if cached and monotonic() - cached[0] < self.sites_cache_ttl:
+                return list(cached[1])
+            sites = self._query_official_sites()
+            if sites is None:
+                return []
+            self._sites_cache = (monotonic(), sites)
+            return list(sites)
+
+    def invalidate_sites_cache(self) -> None:
+        """Drop the cached site list so the next get_official_sites queries the database."""
+        self._sites_cache = None
+
+    def _query_official_sites(self) -> Optional[List[Dict[str, Any]]]:
+        """Read pipeline_site_list, returns None if an error occurred."""
+        query = f"{self._SELECT_SITES} ORDER BY site_name"
 
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute(query)
 
-                # Get column names from cursor description
-                columns = [column[0] for column in cursor.description]
-
-                # Convert rows to dictionaries
-                sites = []
-                for row in cursor.fetchall():
-                    site_dict = dict(zip(columns, row))
-                    sites.append(site_dict)
+                sites = list(self._iter_dicts(cursor, self._SITE_COLUMNS))
 
                 self.logger.debug(f"Retrieved {len(sites)} official sites")
                 return sites
 
         except pyodbc.Error as e:
             self.logger.error(f"Error fetching official sites: {e}")
-            return []
+            return None
         except Exception as e:
             self.logger.error(f"Unexpected error fetching official sites: {e}")
-            return []
+            return None
 
     def put_pipeline_site_completion(self, site: str) -> bool:
         # TODO implement this method
@@ -227,9 +522,17 @@ class PipelineMSSQLConnection(PipelineDBConnection):
         """
         Verify that the MSSQL database is alive and responding to requests.
 
+        Any query that completed in the last _HEALTH_CHECK_TTL seconds already proves
+        the server is up, so frequent probes only run SELECT 1 when the connection
+        pool has been idle.
+
         Returns:
             Dictionary with 'pipeline_db' key indicating database health status
         """
+        last_success = self._last_success
+        if last_success is not None and monotonic() - last_success < self._HEALTH_CHECK_TTL:
+            return {'pipeline_db': True}
+
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
@@ -260,23 +563,15 @@ class PipelineMSSQLConnection(PipelineDBConnection):
             self.logger.debug("get_update_by_path missing update_path")
             raise ValueError("update_path must be provided")
 
-        query = """
-                SELECT id, TC_id, timestamp, update_path, update_size, hash_value
-                FROM authorized_updates
-                WHERE update_path = ? \
-                """
-
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute(query, (update_path.strip(),))
+                cursor.execute(self._SELECT_UPDATE_BY_PATH, (update_path.strip(),))
 
                 row = cursor.fetchone()
                 if row:
-                    columns = [column[0] for column in cursor.description]
-                    result = dict(zip(columns, row))
                     self.logger.debug(f"Found update record for path: {update_path}")
-                    return result
+                    return dict(zip(self._UPDATE_COLUMNS, row))
                 else:
                     self.logger.debug(f"No update record found for path: {update_path}")
                     return None
@@ -288,6 +583,60 @@ class PipelineMSSQLConnection(PipelineDBConnection):
             self.logger.error(f"Unexpected error fetching update by path: {e}")
             return None
 
+    def get_updates_by_paths(self, update_paths: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the update records for many paths, one query per batch of paths.
+
+        Each record is returned against the caller's path from the VALUES list rather
+        than the stored one, which the collation may match despite differing case or
+        trailing spaces.
+
+        Args:
+            update_paths: The paths to search for
+
+        Returns:
+            Dictionary mapping each path found to its update information, paths with
+            no record are left out. Empty dictionary if an error occurred
+
+        Raises:
+            ValueError: If any update_path is empty or only whitespace
+        """
+        if not all(path and path.strip() for path in update_paths):
+            self.logger.debug("get_updates_by_paths missing update_path")
+            raise ValueError("update_path must be provided")
+
+        paths = list(dict.fromkeys(path.strip() for path in update_paths))
+        columns = ("requested_path",) + self._UPDATE_COLUMNS
+        select = ", ".join(f"a.{column}" for column in self._UPDATE_COLUMNS)
+        results = {}
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                for start in range(0, len(paths), self._PATH_BATCH_SIZE):
+                    batch = paths[start:start + self._PATH_BATCH_SIZE]
+                    values = ", ".join(["(?)"] * len(batch))
+                    # Like get_update_by_path, TOP (1) keeps the first record for a path
+                    query = f"""
+                            SELECT v.update_path, u.*
+                            FROM (VALUES {values}) AS v(update_path)
+                            CROSS APPLY (SELECT TOP (1) {select}
+                                         FROM authorized_updates a
+                                         WHERE a.update_path = v.update_path) AS u
+                            """
+                    cursor.execute(query, batch)
+                    for record in self._iter_dicts(cursor, columns):
+                        results[record.pop("requested_path")] = record
+
+            self.logger.debug(f"Found update records for {len(results)} of {len(paths)} paths")
+            return results
+
+        except pyodbc.Error as e:
+            self.logger.error(f"Error fetching updates by paths: {e}")
+            return {}
+        except Exception as e:
+            self.logger.error(f"Unexpected error fetching updates by paths: {e}")
+            return {}
+
     def get_processed_updates(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Get processed updates (those with hash values).
@@ -298,36 +647,50 @@ class PipelineMSSQLConnection(PipelineDBConnection):
         Returns:
             List of dictionaries containing processed update information
         """
-        query = """
-                SELECT id, TC_id, timestamp, update_path, update_size, hash_value
-                FROM authorized_updates
-                WHERE hash_value IS NOT NULL
-                ORDER BY timestamp DESC \
-                """
+        columns = self.get_processed_updates_columnar(limit)
+        return [dict(zip(columns, values)) for values in zip(*columns.values())]
+
+    def get_processed_updates_columnar(self, limit: Optional[int] = None) -> Dict[str, List[Any]]:
+        """
+        Get processed updates (those with hash values) as one list per column.
+
+        Building a list per column instead of a dictionary per row keeps large
+        results small, row i is made of the i-th entry of every list.
+
+        Args:
+            limit: Maximum number of records to return (None for all)
+
+        Returns:
+            Dictionary mapping each column name to its values, newest update first.
+            The lists are empty if an error occurred
+        """
+        query = f"{self._SELECT_UPDATES} WHERE hash_value IS NOT NULL ORDER BY timestamp DESC"
+        params = ()
 
         if limit is not None:
             if not isinstance(limit, int) or limit <= 0:
                 raise ValueError("Limit must be a positive integer")
-            # Note: MSSQL uses TOP instead of LIMIT
-            query = query.replace("SELECT", f"SELECT TOP {limit}")
+            # Note: MSSQL uses TOP instead of LIMIT. A bound TOP keeps the statement
+            # text the same for every limit, so SQL Server reuses one cached plan
+            query = query.replace("SELECT", "SELECT TOP (?)", 1)
+            params = (limit,)
 
+        columns = {column: [] for column in self._UPDATE_COLUMNS}
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute(query)
+                cursor.execute(query, params)
 
-                columns = [column[0] for column in cursor.description]
-                results = []
-                for row in cursor.fetchall():
-                    row_dict = dict(zip(columns, row))
-                    results.append(row_dict)
+                cursor.arraysize = self._FETCH_SIZE
+                while rows := cursor.fetchmany(self._FETCH_SIZE):
+                    for values, column_values in zip(columns.values(), zip(*rows)):
+                        values.extend(column_values)
 
-                self.logger.debug(f"Retrieved {len(results)} processed pipeline updates")
-                return results
+                self.logger.debug(f"Retrieved {len(columns['id'])} processed pipeline updates")
+                return columns
 
         except pyodbc.Error as e:
             self.logger.error(f"Error fetching processed updates: {e}")
-            return []
         except Exception as e:
             self.logger.error(f"Unexpected error fetching processed updates: {e}")
-            return []
\ No newline at end of file
+        return {column: [] for column in self._UPDATE_COLUMNS}
@@ -83,9 +83,13 @@ class PipelineMYSQLConnection(PipelineDBConnection):
                 connection.rollback()
             raise
         finally:
-            if connection and connection.is_connected():
-                connection.close()
-                self.logger.debug("MySQL connection closed")
+            # Close without an is_connected() ping, a connection that already dropped just raises here
+            if connection:
+                try:
+                    connection.close()
+                    self.logger.debug("MySQL connection closed")
+                except Error as e:
+                    self.logger.debug(f"MySQL connection already closed: {e}")
 
     def get_pipeline_updates(self) -> List[Dict[str, Any]]:
         """
@@ -1,75 +1,101 @@
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Iterable
+import heapq
 import json
+import logging
+from operator import itemgetter
+from time import monotonic
 import mysql.connector
-from mysql.connector import Error
-from contextlib import contextmanager
+from mysql.connector import Error, errorcode
 
 from .db_interfaces import RemoteDBConnection
-from database_client import logging_config
+from .mysql_base import MYSQLConnectionBase
 
 
-class RemoteMYSQLConnection(RemoteDBConnection):
+def _sql(statement: str) -> str:
+    """Collapse the layout whitespace of an SQL literal, statements must not contain -- comments."""
+    return " ".join(statement.split())
+
+
+class RemoteMYSQLConnection(MYSQLConnectionBase, RemoteDBConnection):
     """
     Database access class for hash table operations.
 
     This class provides methods to interact with the MySQL database
     for storing and retrieving hash information.
     """
-    # def __init__(self, **kwargs):
-    def __init__(self, host=None, database=None, user=None, password=None, port=3306,
-                 connection_factory=None, autocommit=True, raise_on_warnings=True, **kwargs):
-        """
-        Initialize the database connection configuration.
-
-        Args:
-            host: Database host
-            database: Database name
-            user: Database user
-            password: Database password
-            port: Database port (default: 3306)
-            connection_factory: Optional factory function for creating connections (for testing)
-            autocommit: Whether to autocommit transactions (default: True)
-            raise_on_warnings: Whether to raise on warnings (default: True)
-        """
-        self.config = {
-            'host': host,
-            'database': database,
-            'user': user,
-            'password': password,
-            'port': port,
-            'autocommit': autocommit,
-            'raise_on_warnings': raise_on_warnings
-        }
-        self.database = database
-        self.connection_factory = connection_factory or mysql.connector.connect
-
-        self.other_args = kwargs
-
-        self.logger = logging_config.configure_logging()
-
-    @contextmanager
-    def _get_connection(self):
-        """
-        Context manager for database connections.
-        Yields:
-            MySQL connection object
-        Raises:
-            Error: If a database error occurs
-        """
-        connection = None
-        try:
-            connection = self.connection_factory(**self.config)
-            self.logger.debug(f"Database connection established to {self.config['host']}")
-            yield connection
-        except Error as e:
-            self.logger.error(f"Database error: {e}")
-            if connection:
-                connection.rollback()
-            raise
-        finally:
-            if connection and connection.is_connected():
-                connection.close()
-                self.logger.debug("Database connection closed")
+    # Explicit column lists, hashtable's generated hashed_path key is internal and never returned
+    _HASHTABLE_COLUMNS = ('path', 'current_hash', 'current_dtg_latest', 'current_dtg_first', 'target_hash',
+                          'prev_hash', 'prev_dtg_latest', 'dirs', 'files', 'links')
+    _LOG_COLUMNS = ('log_id', 'site_id', 'session_id', 'log_level', 'timestamp', 'summary_message', 'detailed_message')
+    _PATH_BATCH_SIZE = 1000  # Paths per IN (...) list, keeps statements well under max_allowed_packet
+    # path is TEXT and unindexed, lookups go through the hashed_path primary key it generates
+    _PATH_MATCH = "hashed_path = SHA2(%s, 256)"
+    _LOG_INSERT_BATCH_SIZE = 500  # Rows per multi-row logs INSERT in put_logs
+    _LOG_ORDER_COLUMNS = frozenset({'log_id', 'site_id', 'log_level', 'timestamp', 'session_id'})  # get_logs order_by whitelist
+    _HEALTH_CHECK_TTL = 1.0  # Seconds a health check result is reused, bounds probe queries per worker
+    _health_result = None  # (monotonic time checked, result) of the last health check
+    _SINGLE_FIELDS = ('current_hash', 'current_dtg_latest')  # Columns get_single_field may return
+    _DEADLOCK_ATTEMPTS = 3  # Tries insert_or_update_hash makes when InnoDB picks its transaction as a deadlock victim
+
+    # Statements are built once at import, each call sends the same compact text
+    _SELECT_HASH_RECORD = f"SELECT {', '.join(_HASHTABLE_COLUMNS)} FROM hashtable WHERE {_PATH_MATCH}"
+    _SELECT_HASH_FOR_UPDATE = \
+        f"SELECT current_hash, dirs, links, files, target_hash FROM hashtable WHERE {_PATH_MATCH} FOR UPDATE"
+    _UPDATE_HASH_TIMESTAMP = _sql("""
+        UPDATE hashtable
+        SET current_dtg_latest = CURRENT_TIMESTAMP,
+            target_hash        = %(target_hash)s
+        WHERE hashed_path = SHA2(%(path)s, 256)
+        """)
+    _UPDATE_HASH = _sql("""
+        UPDATE hashtable
+        SET prev_hash          = `current_hash`,
+            prev_dtg_latest    = `current_dtg_latest`,
+            current_hash       = %(current_hash)s,
+            current_dtg_latest = CURRENT_TIMESTAMP,
+            current_dtg_first  = `current_dtg_latest`,
+            dirs               = %(dirs)s,
+            files              = %(files)s,
+            links              = %(links)s,
+            target_hash        = %(target_hash)s
+        WHERE hashed_path = SHA2(%(path)s, 256)
+        """)
+    _INSERT_HASH = _sql("""
+        INSERT INTO hashtable (path, current_hash, current_dtg_latest, current_dtg_first,
+                               dirs, files, links, target_hash)
+            VALUES (%(path)s, %(current_hash)s, CURRENT_TIMESTAMP, `current_dtg_latest`,
+                    %(dirs)s, %(files)s, %(links)s, %(target_hash)s) AS entry
+        ON DUPLICATE KEY
+            UPDATE current_hash       = entry.current_hash,
+                   current_dtg_latest = entry.current_dtg_latest,
+                   current_dtg_first  = entry.current_dtg_first,
+                   dirs               = entry.dirs,
+                   files              = entry.files,
+                   links              = entry.links,
+                   target_hash        = entry.target_hash
+        """)
+    # Only changed paths with no changed descendants come back, the binary prefix compare keeps the
+    # case-sensitive startswith semantics under the column's case-insensitive collation
+    _SELECT_DEEPEST_CHANGED = _sql("""
+        WITH changed AS (SELECT path
+                         FROM hashtable
+                         WHERE target_hash IS NOT NULL
+                           AND current_hash != target_hash)
+        SELECT c.path
+        FROM changed c
+        WHERE NOT EXISTS (SELECT 1
+                          FROM changed d
+                          WHERE CAST(LEFT(d.path, CHAR_LENGTH(c.path) + 1) AS BINARY) =
+                                CAST(CONCAT(c.path, '/') AS BINARY))
+        """)
+    _INSERT_LOG = ("INSERT INTO logs (site_id, log_level, session_id, summary_message, detailed_message) "
+                   "VALUES (%(site_id)s, %(log_level)s, %(session_id)s, %(summary_message)s, %(detailed_message)s)")
+    _SELECT_LOGS = f"SELECT {', '.join(_LOG_COLUMNS)} FROM logs"
+
+    @staticmethod
+    def _paths_match(count: int) -> str:
+        """WHERE predicate matching count paths on the hashed_path primary key."""
+        return f"hashed_path IN ({', '.join(['SHA2(%s, 256)'] * count)})"
 
     def get_hash_record(self, path: str) -> Dict[str, Any] | None:
         """
@@ -83,20 +109,23 @@ class RemoteMYSQLConnection(RemoteDBConnection):
         """
         # Validate required keys
         if not path:
-            self.logger.debug(f"get_hash_record missing path")
+            self.logger.debug("get_hash_record missing path")
             raise ValueError(f"path value must be provided")
 
         try:
             with (self._get_connection() as conn):
-                with conn.cursor(dictionary=True) as cursor:
-                    cursor.execute("SELECT * FROM hashtable WHERE path = %s", (path,))
-                    result = cursor.fetchone()
+                # Tuple cursor, the single row is zipped against the known column list instead of
+                # having the driver build a dictionary from the result metadata
+                with conn.cursor() as cursor:
+                    cursor.execute(self._SELECT_HASH_RECORD, (path,))
+                    row = cursor.fetchone()
+                    result = dict(zip(self._HASHTABLE_COLUMNS, row)) if row else None
                     if result:
                         # convert lists for sql storage
                         self._convert_to_from_json(result)
-                        self.logger.debug(f"Found record for path: {path}")
+                        self.logger.debug("Found record for path: %s", path)
                     else:
-                        self.logger.debug(f"No record found for path: {path}")
+                        self.logger.debug("No record found for path: %s", path)
                     return result
         except Error as e:
             self.logger.error(f"Error fetching record: {e}")
@@ -114,7 +143,7 @@ class RemoteMYSQLConnection(RemoteDBConnection):
         """
         # Validate required keys and data formatting
         if missing_keys := {'path', 'current_hash'} - record.keys():
-            self.logger.debug(f"Update request missing keys: {missing_keys}")
+            self.logger.debug("Update request missing keys: %s", missing_keys)
             raise ValueError(f"{missing_keys} value(s) must be provided")
         for field in {'dirs', 'files', 'links'}:
             if record.get(field, None) and not isinstance(record[field], list):
@@ -128,31 +157,74 @@ class RemoteMYSQLConnection(RemoteDBConnection):
         links = record.get('links', [])
         target_hash = record.get('target_hash', None)
 
-        # Get existing record
-        try:
-            with self._get_connection() as conn:
-                with conn.cursor() as cursor:
-                    cursor.execute(
-                        "SELECT current_hash, dirs, links, files, target_hash FROM hashtable WHERE path = %s", (path,))
-                    result = cursor.fetchone()
-        except Error as e:
-            self.logger.error(f"Error checking database for existing record: {e}")
-            return False
+        # Read the existing record, write the new one, prune removed children and log the changes in
+        # one transaction on a single connection. The row is locked from the read until the commit, so
+        # concurrent updates to a path can't interleave, and a failure part way leaves nothing behind.
+        for attempt in range(1, self._DEADLOCK_ATTEMPTS + 1):
+            try:
+                with self._get_connection() as conn:
+                    conn.start_transaction()
+                    with conn.cursor() as cursor:
+                        cursor.execute(self._SELECT_HASH_FOR_UPDATE, (path,))
+                        result = cursor.fetchone()
+
+                        query, query_params, modified, created, deleted = self._prepare_hash_write(
+                            result, path, current_hash, dirs, files, links, target_hash)
+
+                        cursor.execute(query, query_params)
+                        if cursor.rowcount == 1:
+                            self.logger.info(f"Successfully updated database for path: {path}")
+                        if cursor.rowcount > 1:
+                            self.logger.warning(
+                                f"Caution, multiple records were updated for a single record operation for path: {path}")
+
+                        # Prune deleted paths from the database
+                        if deleted:
+                            deleted.update(self._recursive_delete_hash(cursor, deleted))
+                            self.logger.info(f"Removed {len(deleted)} records from the database")
+
+                        # Log changes to the database under the session_id passed in.
+                        changes = json.dumps({field: sorted(paths) for field, paths in
+                                              [('modified', modified), ('created', created), ('deleted', deleted)]})
+                        log_entry = {
+                            'session_id': record.get('session_id', None),
+                            'summary_message': f"Database hash changes",
+                            'detailed_message': changes
+                        }
+                        cursor.execute(self._INSERT_LOG, self._log_params(log_entry))
+                    conn.commit()
+                break
+            except Error as e:
+                # Locking a path that doesn't exist yet takes a gap lock, so two inserts of new paths
+                # into the same gap can deadlock. InnoDB rolls one back whole, it is safe to run again
+                if e.errno == errorcode.ER_LOCK_DEADLOCK and attempt < self._DEADLOCK_ATTEMPTS:
+                    self.logger.warning("Deadlock writing record for path %s, retrying (attempt %s)", path, attempt)
+                    continue
+                self.logger.error(f"Error inserting/updating record: {e}")
+                return False
 
+        self.logger.debug("Changes logged to database under session_id %s", record.get('session_id', None))
+        return True
+
+    def _prepare_hash_write(self, result: tuple | None, path: str, current_hash: str, dirs: list, files: list,
+                            links: list, target_hash: str | None) -> tuple[str, dict, set, set, set]:
+        """
+        Build the write for insert_or_update_hash and the changes it makes.
+        Args:
+            result: (current_hash, dirs, links, files, target_hash) of the existing record or None
+            path, current_hash, dirs, files, links, target_hash: Values from the update request
+        Returns:
+            (query, query_params, modified, created, deleted) where the last three are sets of paths
+        """
         # Handle the case where result is None (path not in database)
         if result is None:
             # Set default values for new record
             existing_hash = None
-            existing_dirs = []
-            existing_links = []
-            existing_files = []
+            existing_dirs_json = existing_links_json = existing_files_json = None
             existing_target_hash = None
         else:
-            # Unpack existing record
+            # Unpack existing record, the stored lists are only decoded when calculating deletions
             existing_hash, existing_dirs_json, existing_links_json, existing_files_json, existing_target_hash = result
-            existing_dirs = json.loads(existing_dirs_json) if existing_dirs_json else []
-            existing_links = json.loads(existing_links_json) if existing_links_json else []
-            existing_files = json.loads(existing_files_json) if existing_files_json else []
 
         # Determine the final target_hash value (update if passed, otherwise keep as is)
         final_target_hash = target_hash.strip() if target_hash is not None else existing_target_hash
@@ -170,92 +242,34 @@ class RemoteMYSQLConnection(RemoteDBConnection):
 
         # EXISTING RECORD build query and calculate changes for existing records
         if result:
-            self.logger.debug(f"Updating hash for path: {path}")
+            self.logger.debug("Updating hash for path: %s", path)
 
             if existing_hash == current_hash:  # Hash unchanged
-                self.logger.debug(f"Hash unchanged: {path}")
-                query = """
-                        UPDATE hashtable
-                        SET current_dtg_latest = CURRENT_TIMESTAMP,
-                            target_hash        = %(target_hash)s
-                        WHERE path = %(path)s
-                        """
+                self.logger.debug("Hash unchanged: %s", path)
+                query = self._UPDATE_HASH_TIMESTAMP
             else:  # Hash changed, move current_hash and timestamp to previous columns and update the record
                 self.logger.info(f"Hash changed: {path}")
                 modified.add(path)
-                query = """
-                        UPDATE hashtable
-                        SET prev_hash          = `current_hash`,
-                            prev_dtg_latest    = `current_dtg_latest`,
-                            current_hash       = %(current_hash)s,
-                            current_dtg_latest = CURRENT_TIMESTAMP,
-                            current_dtg_first  = `current_dtg_latest`,
-                            dirs               = %(dirs)s,
-                            files              = %(files)s,
-                            links              = %(links)s,
-                            target_hash        = %(target_hash)s
-                        WHERE path = %(path)s
-                        """
+                query = self._UPDATE_HASH
 
             # Calculate deletions for all field types (additions added automatically)
-            for field_name, existing_list, request_list in [
-                ('dirs', existing_dirs or [], dirs),
-                ('files', existing_files or [], files),
-                ('links', existing_links or [], links)
-            ]:
-                deleted.update(f"{path}/{x}" for x in set(existing_list) - set(request_list))
+            child_prefix = f"{path}/"
+            for existing_json, request_list in ((existing_dirs_json, dirs),
+                                                (existing_files_json, files),
+                                                (existing_links_json, links)):
+                if existing_json:
+                    deleted.update(map(child_prefix.__add__, set(json.loads(existing_json)).difference(request_list)))
         # NEW RECORD build query and add to created list
         else:
             self.logger.info(f"Inserting new record for path: {path}")
             created.add(path)
-            query = """
-                    INSERT INTO hashtable (path, current_hash, current_dtg_latest, current_dtg_first,
-                                           dirs, files, links, target_hash)
-                        VALUES (%(path)s, %(current_hash)s, CURRENT_TIMESTAMP, `current_dtg_latest`,
-                                %(dirs)s, %(files)s, %(links)s, %(target_hash)s) AS entry
-                    ON DUPLICATE KEY
-                        UPDATE current_hash       = entry.current_hash,
-                               current_dtg_latest = entry.current_dtg_latest,
-                               current_dtg_first  = entry.current_dtg_first,
-                               dirs               = entry.dirs,
-                               files              = entry.files,
-                               links              = entry.links,
-                               target_hash        = entry.target_hash
-                    """
-
-        self.logger.debug(f"Prepared data for path {path}: hash={current_hash}")
+            query = self._INSERT_HASH
+
+        self.logger.debug("Prepared data for path %s: hash=%s", path, current_hash)
 
         # convert lists for sql storage
         self._convert_to_from_json(query_params)
-        # Execute query and handle deletions
-        try:
-            with self._get_connection() as conn:
-                with conn.cursor() as cursor:
-                    cursor.execute(query, query_params)
-                    if cursor.rowcount == 1:
-                        self.logger.info(f"Successfully updated database for path: {path}")
-                    if cursor.rowcount > 1:
-                        self.logger.warning(
-                            f"Caution, multiple records were updated for a single record operation for path: {path}")
-        except Error as e:
-            self.logger.error(f"Error inserting/updating record: {e}")
-            return False
-
-        # Prune deleted paths from the database
-        for deleted_path in deleted:
-            deleted.update(self._recursive_delete_hash(deleted_path))
-            self.logger.info(f"Removed {len(deleted)} records from the database")
-        # Log changes to the database under the session_id passed in.
-        changes = json.dumps({field: sorted(paths) for field, paths in
-                              [('modified', modified), ('created', created), ('deleted', deleted)]})
-        log_entry = {
-            'session_id': record.get('session_id', None),
-            'summary_message': f"Database hash changes",
-            'detailed_message': changes
-        }
-        self.put_log(log_entry)
-        self.logger.debug(f"Changes logged to database under session_id {record.get('session_id', None)}")
-        return True
+        return query, query_params, modified, created, deleted
 
     def _convert_to_from_json(self, params):
         """Takes a list of lists and convert to list of json string or other way around, in place"""
@@ -265,56 +279,42 @@ class RemoteMYSQLConnection(RemoteDBConnection):
             elif isinstance(params[key], str):
                 params[key] = json.loads(params[key])
 
-    def _recursive_delete_hash(self, path: str) -> set[str]:
-        """delete a hash record and all its children recursively."""
-        deleted_list = []
-        # Get existing record
-        try:
-            with self._get_connection() as conn:
-                with conn.cursor(dictionary=True) as cursor:
-                    cursor.execute("SELECT dirs, links, files FROM hashtable WHERE path = %s", (path,))
-                    result = cursor.fetchone()
-                if not result:
-                    self.logger.debug(f"No record found for path: {path}")
-                    return set()
-        except Error as e:
-            self.logger.error(f"Error checking database for existing record: {e}")
-            return set()
-
-        # convert lists for sql storage
-        self._convert_to_from_json(result)
-        # Combine list fields from the database and call recursive delete on each one
-        dirs, links, files = (result.get(field, []) for field in ['dirs', 'links', 'files'])
-        for item in [f"{path}/{item}" for item in dirs + files + links]:
-            deleted_list.extend(self._recursive_delete_hash(item))
-
-        if self._delete_hash_entry(path):
-            deleted_list.append(path)
-
-        return set(deleted_list)
-
-    def _delete_hash_entry(self, path: str) -> bool:
+    def _recursive_delete_hash(self, cursor, paths: Iterable[str]) -> set[str]:
         """
-        Delete a hashtable record by path.
+        Delete hash records and all their children recursively.
+
+        The tree is walked one level at a time on the caller's cursor, so the deletes are part of
+        the caller's transaction. Each level is read and deleted with batched IN (...) statements
+        rather than a query per path.
         Args:
-            path: Path to delete from the database.
+            cursor: Cursor of the connection to delete on
+            paths: Paths to delete from the database.
         Returns:
-            True if the record was deleted, False if not found, or an error occurred.
+            Set of paths that were deleted, including children.
+        Raises:
+            Error: If a database error occurs
         """
-        query = "DELETE FROM hashtable WHERE path = %s"
-        try:
-            with self._get_connection() as conn:
-                with conn.cursor() as cursor:
-                    # Delete the entry with the matching path
-                    cursor.execute(query, (path,))
-                    # Check if any rows were affected (deleted)
-                    rows_affected = cursor.rowcount
+        deleted = set()
+        level = list(paths)
+        while level:
+            children = []
+            for i in range(0, len(level), self._PATH_BATCH_SIZE):
+                batch = level[i:i + self._PATH_BATCH_SIZE]
+                cursor.execute(
+                    f"SELECT path, dirs, links, files FROM hashtable WHERE {self._paths_match(len(batch))}", batch)
+                rows = cursor.fetchall()
+                if not rows:
+                    continue
 
-            return rows_affected > 0
-        except Exception as e:
-            # Log the error
-            self.logger.error(f"Error deleting hash entry for path {path}: {e}")
-            return False
+                found = [row[0] for row in rows]
+                for row_path, *child_lists in rows:
+                    children.extend(f"{row_path}/{item}" for child_list in child_lists
+                                    for item in json.loads(child_list or '[]'))
+                cursor.execute(f"DELETE FROM hashtable WHERE {self._paths_match(len(found))}", found)
+                deleted.update(found)
+            level = children
+
+        return deleted
 
     def get_single_field(self, path: str, field: str) -> str | int | None:
         """
@@ -329,77 +329,89 @@ class RemoteMYSQLConnection(RemoteDBConnection):
         """
         # Validate required parameters
         if not path or not field:
-            self.logger.debug(f"get_single_field missing path or field")
+            self.logger.debug("get_single_field missing path or field")
             raise ValueError(f"path and field value must be provided")
-        if field not in {'current_hash', 'current_dtg_latest'}:
+        if field not in self._SINGLE_FIELDS:
             raise ValueError(f"Invalid field name: {field}")
 
-        query = f"SELECT {field} FROM hashtable WHERE path = %s"
+        query = f"SELECT {field} FROM hashtable WHERE {self._PATH_MATCH}"
         try:
             with self._get_connection() as conn:
                 with conn.cursor() as cursor:
                     cursor.execute(query, (path,))
                     result = cursor.fetchone()
                     if result:
-                        self.logger.debug(f"Found {field} for path: {path}")
+                        self.logger.debug("Found %s for path: %s", field, path)
                     else:
-                        self.logger.debug(f"No {field} found for path: {path}")
+                        self.logger.debug("No %s found for path: %s", field, path)
                     return result[0] if result else None
         except Error as e:
             self.logger.error(f"Error fetching {field}: {e}")
             return None
 
+    def get_timestamps(self, paths: List[str], limit: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Get the current_dtg_latest value for several paths with batched IN (...) queries.
+        Args:
+            paths: Paths to retrieve timestamps for
+            limit: Only return the oldest limit paths, ties ordered by path (optional)
+        Returns:
+            Dictionary of path: timestamp, paths that were not found are left out.
+            Empty if an error occurred.
+        """
+        timestamps = {}
+        # With a limit each batch is sorted and cut server side, only the batch winners are merged here
+        order_clause = " AND current_dtg_latest IS NOT NULL ORDER BY current_dtg_latest, path LIMIT %s" \
+            if limit is not None else ""
+        try:
+            with self._get_connection() as conn:
+                with conn.cursor() as cursor:
+                    for i in range(0, len(paths), self._PATH_BATCH_SIZE):
+                        batch = paths[i:i + self._PATH_BATCH_SIZE]
+                        cursor.execute(
+                            f"SELECT path, current_dtg_latest FROM hashtable WHERE {self._paths_match(len(batch))}"
+                            f"{order_clause}", batch + [limit] if limit is not None else batch)
+                        timestamps.update(cursor.fetchall())
+        except Error as e:
+            self.logger.error(f"Error fetching timestamps: {e}")
+            return {}
+
+        if limit is not None and len(timestamps) > limit:
+            timestamps = dict(heapq.nsmallest(limit, timestamps.items(), key=itemgetter(1, 0)))
+
+        self.logger.debug("Found timestamps for %s of %s paths", len(timestamps), len(paths))
+        return timestamps
+
     def get_priority_updates(self) -> List[str]:
         """
-        Get directories where target_hash != current_hash, prioritizing the shallowest paths
-        to avoid redundant updates of nested directories.
+        Get directories where target_hash != current_hash, keeping only the deepest changed paths
+        (parents are refreshed when their changed children are rehashed).
         Returns:
-            List of directory paths needing updates, deduplicated by hierarchy
+            List of directory paths needing updates, deduplicated by hierarchy, deepest first
         """
-        query = """
-                SELECT path
-                FROM hashtable
-                WHERE target_hash IS NOT NULL
-                  AND current_hash != target_hash
-                """
         try:
             with self._get_connection() as conn:
                 with conn.cursor() as cursor:
-                    cursor.execute(query)
-                    paths = [row[0] for row in cursor.fetchall()]
+                    cursor.execute(self._SELECT_DEEPEST_CHANGED)
+                    deepest_only = [row[0] for row in cursor.fetchall()]
         except Error as e:
             self.logger.error(f"Error fetching priority updates: {e}")
             return []
 
-        if not paths:
+        if not deepest_only:
             self.logger.info("All hashes in the db are in sync")
             return []
 
-        # Sort by depth and eliminate parents that will be updated by deeper children
-        self.logger.debug(f"Pre-sorted priority updates: {paths}")
-        paths_set = set(paths)
-        deepest_only = []
-        for path in paths_set:
-            # Check if this path has any descendants in the changed set
-            has_descendants = any(
-                other_path.startswith(path + '/')
-                for other_path in paths_set
-                if other_path != path
-            )
-            # Only include paths that have no descendants in the changed set
-            if not has_descendants:
-                deepest_only.append(path)
         # Sort deepest first for consistent processing order
         deepest_only.sort(key=lambda x: (-x.count('/'), x))
-        self.logger.debug(f"Deepest changed nodes only: {deepest_only}")
+        self.logger.debug("Deepest changed nodes only: %s", deepest_only)
         return deepest_only
 
-
-    def put_log(self, args_dict: dict) -> int | None:
+    def _log_params(self, args_dict: dict) -> dict:
         """
-        Insert a log entry into the local_database.
+        Validate a log entry and fill in the column defaults.
         Returns:
-            log_id number (int) if the log entry was inserted, None if an error occurred
+            Dict of logs column:value keypairs to insert
         Raises:
             ValueError: If required parameters are not provided
         """
@@ -407,11 +419,11 @@ class RemoteMYSQLConnection(RemoteDBConnection):
         if 'message' in args_dict.keys() and 'summary_message' not in args_dict.keys():
             args_dict['summary_message'] = args_dict['message']
         if missing_keys := {'summary_message'} - args_dict.keys():
-            self.logger.debug(f"Update request missing keys: {missing_keys}")
+            self.logger.debug("Update request missing keys: %s", missing_keys)
             raise ValueError(f"{missing_keys} value(s) must be provided")
 
         # Extract parameters with defaults
-        params = {
+        return {
             'site_id': args_dict.get('site_id', 'local' ),
             'log_level': args_dict.get('log_level', 'INFO'),
             'session_id': args_dict.get('session_id', None),
@@ -419,12 +431,20 @@ class RemoteMYSQLConnection(RemoteDBConnection):
             'detailed_message': args_dict.get('detailed_message', None)
         }
 
-        query = """INSERT INTO logs (site_id, log_level, session_id, summary_message, detailed_message)
-                   VALUES (%(site_id)s, %(log_level)s, %(session_id)s, %(summary_message)s, %(detailed_message)s)"""
+    def put_log(self, args_dict: dict) -> int | None:
+        """
+        Insert a log entry into the local_database.
+        Returns:
+            log_id number (int) if the log entry was inserted, None if an error occurred
+        Raises:
+            ValueError: If required parameters are not provided
+        """
+        params = self._log_params(args_dict)
+
         try:
             with self._get_connection() as conn:
                 with conn.cursor() as cursor:
-                    cursor.execute(query, params)
+                    cursor.execute(self._INSERT_LOG, params)
                     if cursor.rowcount == 0:
                         self.logger.debug("Log entry failed to insert")
                         return None
@@ -433,13 +453,52 @@ class RemoteMYSQLConnection(RemoteDBConnection):
 
                     # Get the auto-generated log_id
                     log_id = cursor.lastrowid
-                    self.logger.debug(f"Successfully inserted log entry with ID: {log_id}")
+                    self.logger.debug("Successfully inserted log entry with ID: %s", log_id)
 
                     return log_id
         except Error as e:
             self.logger.error(f"Error inserting log entry: {e}")
             return None
 
+    def put_logs(self, rows: List[dict]) -> List[int] | None:
+        """
+        Insert several log entries with multi-row INSERT statements in one transaction.
+
+        A single INSERT of known size gets consecutive log_id values, so each statement's
+        ids are read from lastrowid instead of being looked up.
+        Args:
+            rows: Log entries, each in the form accepted by put_log
+        Returns:
+            List of log_id numbers in the order of rows, None if an error occurred
+        Raises:
+            ValueError: If required parameters are not provided in any entry
+        """
+        params = [self._log_params(row) for row in rows]
+        if not params:
+            return []
+
+        log_ids = []
+        try:
+            with self._get_connection() as conn:
+                conn.start_transaction()
+                with conn.cursor() as cursor:
+                    for i in range(0, len(params), self._LOG_INSERT_BATCH_SIZE):
+                        batch = params[i:i + self._LOG_INSERT_BATCH_SIZE]
+                        values = ', '.join(['(%s, %s, %s, %s, %s)'] * len(batch))
+                        cursor.execute(
+                            "INSERT INTO logs (site_id, log_level, session_id, summary_message, detailed_message) "
+                            f"VALUES {values}",
+                            [row[column] for row in batch for column in
+                             ('site_id', 'log_level', 'session_id', 'summary_message', 'detailed_message')])
+                        log_ids.extend(range(cursor.lastrowid, cursor.lastrowid + len(batch)))
+                conn.commit()
+        except Error as e:
+            self.logger.error(f"Error inserting log entries: {e}")
+            return None
+
+        self.logger.debug("Inserted %s log entries", len(log_ids))
+        return log_ids
+
     def get_logs(self, limit: Optional[int] = None, offset: int = 0,
                  order_by: str = "timestamp", order_direction: str = "DESC",
                  session_id_filter: Optional[str] = None,
@@ -481,13 +540,11 @@ class RemoteMYSQLConnection(RemoteDBConnection):
             raise ValueError("older_than_days must be a positive integer")
 
         # Validate order_by column (whitelist approach for security)
-        allowed_columns = {'log_id', 'site_id', 'log_level', 'timestamp', 'session_id'}
-        if order_by not in allowed_columns:
-            raise ValueError(f"Invalid order_by column. Allowed: {allowed_columns}")
+        if order_by not in self._LOG_ORDER_COLUMNS:
+            raise ValueError(f"Invalid order_by column. Allowed: {sorted(self._LOG_ORDER_COLUMNS)}")
 
         # Build query with proper parameterization
-        base_query = "SELECT * FROM logs"
-        query_parts = [base_query]
+        query_parts = [self._SELECT_LOGS]
         query_params = []
         where_conditions = []
 
@@ -524,20 +581,22 @@ class RemoteMYSQLConnection(RemoteDBConnection):
 
         try:
             with self._get_connection() as conn:
-                with conn.cursor(dictionary=True, buffered=True) as cursor:
+                # Unbuffered, fetchall reads the rows straight into the result list without a driver-side copy
+                with conn.cursor(dictionary=True) as cursor:
                     cursor.execute(final_query, query_params)
                     result = cursor.fetchall()
 
-                    # More informative logging
-                    record_count = len(result) if result else 0
-                    filter_info = []
-                    if session_id_filter is not None:
-                        filter_info.append(f"session_id: {session_id_filter}")
-                    if older_than_days is not None:
-                        filter_info.append(f"older than {older_than_days} days")
+                    # More informative logging, only built when debug logging is on
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        record_count = len(result) if result else 0
+                        filter_info = []
+                        if session_id_filter is not None:
+                            filter_info.append(f"session_id: {session_id_filter}")
+                        if older_than_days is not None:
+                            filter_info.append(f"older than {older_than_days} days")
 
-                    filter_str = f" (filters: {', '.join(filter_info)})" if filter_info else ""
-                    self.logger.debug(f"Retrieved {record_count} log records from database{filter_str}")
+                        filter_str = f" (filters: {', '.join(filter_info)})" if filter_info else ""
+                        self.logger.debug("Retrieved %s log records from database%s", record_count, filter_str)
 
                     return result or []  # Ensure we always return a list
 
@@ -569,7 +628,7 @@ class RemoteMYSQLConnection(RemoteDBConnection):
                 self.logger.info("No sessions found to consolidate")
                 return True
 
-            self.logger.debug(f"Found {len(session_ids)} sessions to consolidate")
+            self.logger.debug("Found %s sessions to consolidate", len(session_ids))
 
             # Consolidate each session
             for session_id in session_ids:
@@ -590,16 +649,16 @@ class RemoteMYSQLConnection(RemoteDBConnection):
             session_id: The session ID to consolidate logs for
         """
         # Get all entries for this session_id
-        query = "SELECT * FROM logs WHERE session_id = %s ORDER BY log_id"
+        query = f"{self._SELECT_LOGS} WHERE session_id = %s ORDER BY log_id"
         try:
             with self._get_connection() as conn:
                 with conn.cursor(dictionary=True) as cursor:
                     cursor.execute(query, (session_id,))
                     result = cursor.fetchall()
                     if result:
-                        self.logger.debug(f"Found {len(result)} entries with session id {session_id}")
+                        self.logger.debug("Found %s entries with session id %s", len(result), session_id)
                     else:
-                        self.logger.debug(f"No log entry found with session id {session_id}")
+                        self.logger.debug("No log entry found with session id %s", session_id)
                         return
         except Error as e:
             self.logger.error(f"Error fetching log entry: {e}")
@@ -634,7 +693,7 @@ class RemoteMYSQLConnection(RemoteDBConnection):
 
         # Process each log level group
         for log_level, group_data in log_level_groups.items():
-            self.logger.debug(f"Consolidating {len(group_data['entries'])} entries for log level {log_level}")
+            self.logger.debug("Consolidating %s entries for log level %s", len(group_data['entries']), log_level)
 
             # Consolidate JSON data for this log level
             consolidated_changes = {}
@@ -642,7 +701,7 @@ class RemoteMYSQLConnection(RemoteDBConnection):
             for log_entry in group_data['entries']:
                 try:
                     data = json.loads(log_entry.get('detailed_message', '{}'))
-                    self.logger.debug(f"Processing JSON encoded log entry")
+                    self.logger.debug("Processing JSON encoded log entry")
 
                     # Merge data by keys, deduplicating lists
                     for key, value in data.items():
@@ -655,7 +714,7 @@ class RemoteMYSQLConnection(RemoteDBConnection):
                             consolidated_changes[key].add(str(value))
 
                 except json.JSONDecodeError as e:
-                    self.logger.debug(f"Not a JSON encoded log entry: {e}")
+                    self.logger.debug("Not a JSON encoded log entry: %s", e)
                     # Handle non-JSON entries by treating them as text
                     text_key = 'messages'
                     if text_key not in consolidated_changes:
@@ -689,7 +748,7 @@ class RemoteMYSQLConnection(RemoteDBConnection):
             if failed_deletes:
                 self.logger.warning(f"Failed to delete {len(failed_deletes)} entries: {failed_deletes}")
 
-            self.logger.debug(f"Consolidated {deleted_count} {log_level} entries for session {session_id}")
+            self.logger.debug("Consolidated %s %s entries for session %s", deleted_count, log_level, session_id)
 
         self.logger.info(f"Finished consolidating session {session_id}")
 
@@ -740,7 +799,7 @@ class RemoteMYSQLConnection(RemoteDBConnection):
                 self.logger.warning(f"Error deleting log entry {log_id}: {e}")
                 failed_deletes.append(log_id)
 
-        self.logger.debug(f"Removed {deleted_count} log entry from the database")
+        self.logger.debug("Removed %s log entry from the database", deleted_count)
         return deleted_count, failed_deletes
 
     def find_orphaned_entries(self) -> list[str]:
@@ -887,7 +946,7 @@ class RemoteMYSQLConnection(RemoteDBConnection):
 
     def _path_exists(self, path: str, conn) -> bool:
         """Check if a path exists in the database."""
-        query = "SELECT 1 FROM hashtable WHERE path = %s LIMIT 1"
+        query = f"SELECT 1 FROM hashtable WHERE {self._PATH_MATCH} LIMIT 1"
         with conn.cursor() as cursor:
             cursor.execute(query, (path,))
             return cursor.fetchone() is not None
@@ -896,19 +955,28 @@ class RemoteMYSQLConnection(RemoteDBConnection):
     def health_check(self) -> dict[str, bool]:
         """
         Verify that the local database is alive and responding to requests.
+
+        The result is reused for _HEALTH_CHECK_TTL seconds, so frequent readiness
+        probes don't each cost a database round trip.
         Returns:
             {local_db: True or False} depending on if the database is active and responsive.
         """
+        now = monotonic()
+        if self._health_result and now - self._health_result[0] < self._HEALTH_CHECK_TTL:
+            return {'local_db': self._health_result[1]}
+
+        alive = False
         try:
             with self._get_connection() as conn:
                 with conn.cursor() as cursor:
                     cursor.execute("SELECT 1;")
                     _ = cursor.fetchall()  # Consume the result
                     # If the query executes without an exception, the database is responsive
-                    self.logger.info("MySQL database is responsive.")
-                    return {'local_db': True}
+                    self.logger.debug("MySQL database is responsive.")
+                    alive = True
 
         except Exception as e:
             self.logger.error(f"Error connecting to MySQL: {e}")
 
-        return {'local_db': False}
+        self._health_result = (now, alive)
+        return {'local_db': alive}
@@ -18,10 +18,10 @@ class ConfigError(Exception):
 class Config:
     """Configuration class for rest_client package."""
     # Define required keys as class constants
-    REQUIRED_KEYS = []
-    SENSITIVE_KEYS = []
-    NUMERIC_KEYS = ['max_retries', 'retry_delay', 'long_delay']
-    BOOLEAN_KEYS = []
+    REQUIRED_KEYS = ()
+    SENSITIVE_KEYS = frozenset()
+    NUMERIC_KEYS = frozenset({'max_retries', 'retry_delay', 'long_delay'})
+    BOOLEAN_KEYS = frozenset()
 
     # Default values for configuration
     DEFAULTS = {
@@ -93,7 +93,7 @@ class Config:
                 return int(value)
             except ValueError:
                 raise ConfigError(f"Invalid integer value for {key}: {value}")
-        elif key == self.BOOLEAN_KEYS:
+        elif key in self.BOOLEAN_KEYS:
             return value.lower() in ('true', '1', 'yes', 'on')
         return value
 
@@ -106,7 +106,7 @@ class Config:
         """
         missing_keys = [
             key for key in self.REQUIRED_KEYS
-            if key not in self._config or self._config[key] is None
+            if self._config.get(key) is None
         ]
 
         if missing_keys:
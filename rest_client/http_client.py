@@ -21,6 +21,9 @@ class HttpClient(ABC):
 
 
 class RequestsHttpClient(HttpClient):
+    # requests keyword each method's data is sent as
+    _DATA_ARGUMENT = {'post': 'json', 'get': 'params', 'patch': 'json'}
+
     def __init__(self):
         self.max_retries = config.get('max_retries')
         self.retry_delay = config.get('retry_delay')
@@ -36,14 +39,10 @@ class RequestsHttpClient(HttpClient):
         return self._make_request('patch', url, json_data)
 
     def _make_request(self, method: str, url: str, data: Optional[dict] = None) -> Tuple[int, Any]:
-        method_map = {
-            'post': lambda: requests.post(url, json=data, timeout=30),
-            'get': lambda: requests.get(url, params=data, timeout=30),
-            'patch': lambda: requests.patch(url, json=data, timeout=30)
-        }
-
-        if method not in method_map:
+        if method not in self._DATA_ARGUMENT:
             return 405, f"'{method}' is not an allowed method."
+        request_func = getattr(requests, method)
+        request_kwargs = {self._DATA_ARGUMENT[method]: data, 'timeout': 30}
 
         total_attempts = 0
 
@@ -52,7 +51,7 @@ class RequestsHttpClient(HttpClient):
                 total_attempts += 1
 
                 try:
-                    response = method_map[method]()
+                    response = request_func(url, **request_kwargs)
                     status_code = response.status_code
 
                     # Return immediately for 4xx errors (client errors)
@@ -82,6 +82,20 @@ class RestProcessorInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_child_timestamps(self, path: str, limit: int | None = None) -> dict | None:
+        """
+        Get the timestamps of every child (dirs, files and links) of a path in one request.
+
+        Args:
+            path: The parent path
+            limit: Only return the oldest limit children (optional)
+
+        Returns:
+            A dictionary of child path: timestamp, or None if not found or error
+        """
+        pass
+
     @abstractmethod
     def get_priority_updates(self) -> list | None:
         """
@@ -124,6 +138,19 @@ class RestProcessorInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    def put_logs(self, entries: list[dict]) -> list | None:
+        """
+        Store several log entries in the database with one request.
+
+        Args:
+            entries: list of dictionaries holding the put_log arguments for each entry
+
+        Returns:
+            A list of the new log ids in the order of entries, or None if any entry is invalid or error
+        """
+        pass
+
     @abstractmethod
     def find_orphaned_entries(self) -> list | None:
         """
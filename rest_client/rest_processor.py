@@ -1,5 +1,4 @@
 from typing import Tuple, Any
-from time import time
 
 from .rest_interface import RestProcessorInterface
 from .http_client import HttpClient
@@ -133,15 +132,18 @@ class RestProcessor(RestProcessorInterface):
         # Convert root_path relative items to absolute path strings
         dirs = [f"{root_path}/{relative_dir}" for relative_dir in dirs]
 
-        # Build and sort by timestamp
-        dir_timestamps = [(self.get_single_timestamp(directory) or int(time()), directory)
-                          for directory in dirs]
-        ordered_dirs = [directory for _, directory in sorted(dir_timestamps)]
-
         # Calculate the number of directories to return
         update_num = max(1, int(len(dirs) * percent / 100)) + 1 # Make sure to round up with +1
         update_num = min(update_num, len(dirs))
 
+        # The server sorts the children by timestamp and only returns the oldest update_num of them
+        timestamps = self.get_child_timestamps(root_path, update_num) or {}
+        ordered_dirs = [directory for _, directory in sorted((ts, directory) for directory, ts in timestamps.items())]
+        # Children with no timestamp in the database are the newest, fill any remaining slots with them
+        if len(ordered_dirs) < update_num:
+            returned = set(ordered_dirs)
+            ordered_dirs.extend(sorted(directory for directory in dirs if directory not in returned))
+
         logger.info(f"Returning {update_num} directories for update")
         return ordered_dirs[:update_num]
 
@@ -159,6 +161,24 @@ class RestProcessor(RestProcessorInterface):
         logger.debug("Processing get single timestamp request")
         return self._process_response(response)
 
+    def get_child_timestamps(self, path: str, limit: int | None = None) -> dict | None:
+        """
+        Get the timestamps of every child (dirs, files and links) of a path in one request.
+
+        Args:
+            path: The parent path
+            limit: Only return the oldest limit children (optional)
+
+        Returns:
+            A dictionary of child path: timestamp, or None if not found or error
+        """
+        params = {"path": path, 'field': 'child_timestamps'}
+        if limit is not None:
+            params['limit'] = limit
+        response = self._db_get("api/hashtable", params)
+        logger.debug("Processing get child timestamps request")
+        return self._process_response(response)
+
     def get_priority_updates(self) -> list | None:
         """
         Get paths that need priority updates.
@@ -201,13 +221,56 @@ class RestProcessor(RestProcessorInterface):
         Returns:
             int representing the number of updates sent to the REST API that were successful
         """
-        # Validate input, allow api to set to default if arg is not valid
-        # log_level = log_level.upper() if log_level and log_level.upper() in config.get('valid_log_levels') else None
-
-        if not message:
+        request_data = self._log_request_data(message, site_id, timestamp, detailed_message, log_level, session_id)
+        if request_data is None:
             # if validation_errors:
             logger.debug(f"Skipping put_log for invalid item")
             return 0
+
+        response = self._db_put("api/logs", request_data)
+        logger.debug("Processing log entry request")
+        # Api / process response will return True if successful, None otherwise
+        if self._process_response(response):
+            return 1
+        else:
+            return 0
+
+    def put_logs(self, entries: list[dict]) -> list | None:
+        """
+        Store several log entries in the database with one request.
+
+        Args:
+            entries: list of dictionaries holding the put_log arguments for each entry
+
+        Returns:
+            A list of the new log ids in the order of entries, or None if any entry is invalid or error
+        """
+        request_data = [self._log_request_data(**entry) for entry in entries]
+        if None in request_data:
+            logger.debug(f"Skipping put_logs for invalid item")
+            return None
+
+        response = self._db_put("api/logs", request_data)
+        logger.debug("Processing log entries request")
+        return self._process_response(response)
+
+    @staticmethod
+    def _log_request_data(message: str,
+                          site_id: str=None,
+                          timestamp: int=None,
+                          detailed_message: str=None,
+                          log_level: str=None,
+                          session_id: str=None
+                          ) -> dict | None:
+        """
+        Assemble the REST API body for a log entry.
+
+        Returns:
+            The log entry dictionary, or None if there is no message
+        """
+        # Validate input, allow api to set to default if arg is not valid
+        if not message:
+            return None
         log_level = log_level.upper() if isinstance(log_level, str) and log_level.upper() in config.get('valid_log_levels') else config.get('log_level')
         # Assemble the log entry
         request_data = { 'summary_message': message }
@@ -220,18 +283,7 @@ class RestProcessor(RestProcessorInterface):
         for key, value in columns.items():
             if value:
                 request_data[key] = value
-
-        # if session_id: request_data['session_id'] = session_id
-        # if detailed_message: request_data['detailed_message'] = detailed_message
-        # if log_level: request_data['log_level'] = log_level.upper()
-
-        response = self._db_put("api/logs", request_data)
-        logger.debug("Processing log entry request")
-        # Api / process response will return True if successful, None otherwise
-        if self._process_response(response):
-            return 1
-        else:
-            return 0
+        return request_data
 
     def find_orphaned_entries(self) -> list | None:
         """
@@ -498,7 +550,7 @@ class RestProcessor(RestProcessorInterface):
 
         return None
 
-    def _db_put(self, endpoint: str, data: dict) -> Tuple[int, Any]:
+    def _db_put(self, endpoint: str, data: dict | list) -> Tuple[int, Any]:
         """
         Send a PUT request to the REST API.
 
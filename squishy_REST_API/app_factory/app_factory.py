@@ -4,17 +4,37 @@ Application factory for REST API package.
 This module provides a factory function to create Flask application instances
 with proper configuration and dependency injection.
 """
-from flask import Flask
-from flask_moment import Moment
+from functools import lru_cache
+
+from flask import Flask, request, url_for
+from jinja2 import FileSystemBytecodeCache
 from database_client import DBClientFactory
 
 from squishy_REST_API import config, logger
 from ..routes import register_all_routes
 from .db_client_implementation import DBInstance
+from .json_provider import ORJSONProvider, orjson
 
 
 class RESTAPIFactory:
     """Factory for creating rest api app"""
+    _db_instance = None  # Shared by every app built in this process
+
+    @classmethod
+    def _get_db_instance(cls) -> DBInstance:
+        """
+        Get the process-wide database instance, creating it on first use.
+
+        The database clients open a connection per call and hold no per-request
+        state, so one instance can back every app created by this factory.
+
+        Returns:
+            DBInstance wrapping the configured database clients
+        """
+        if cls._db_instance is None:
+            db_config = {'database': config.database_config}
+            cls._db_instance = DBInstance(DBClientFactory(db_config).create_client())
+        return cls._db_instance
 
     @staticmethod
     def create_app(test_config=None):
@@ -26,39 +46,93 @@ class RESTAPIFactory:
             Configured Flask application
         """
 
-        # Get db instance for use in routes - database interactions
-        db_config = {'database': config.database_config}
-        db_client = DBClientFactory(db_config).create_client()
-        db_instance = DBInstance(db_client)
-
         if config.is_core:  # Create Flask app (with locations of web-gui templates)
+            from flask_moment import Moment  # Only the web-gui uses it, remote sites skip the import
             app = Flask(__name__, template_folder='../web/templates', static_folder='../web/static')
             moment = Moment(app)  # Used in web-gui templates
         else:  # Create Flask app for remote site
             app = Flask(__name__)
 
+        if orjson is not None:  # Faster JSON encoding when orjson is installed
+            app.json = ORJSONProvider(app)
+
+        # Get db instance for use in routes - database interactions
+        db_instance = None
+        if test_config and test_config.get('db_instance'):
+            db_instance = test_config.pop('db_instance')
+        if db_instance is None:
+            db_instance = RESTAPIFactory._get_db_instance()
+
         # Load configuration
         if test_config:
-            if test_config.get('db_instance'):
-                db_instance = test_config.pop('db_instance')
             app.config.update(test_config)  # Load test configuration if provided
             logger.info("Application configured with test configuration")
         else:
             # Load configuration from config module
+            settings = config.snapshot()
             app.config.update({
-                'DEBUG': config.get('debug', False),
+                'DEBUG': settings.debug,
                 'TESTING': False,
-                'SECRET_KEY': config.get('secret_key', 'dev-key-change-in-production'),
+                'SECRET_KEY': settings.secret_key or 'dev-key-change-in-production',
             })
             logger.info("Application configured with default configuration")
 
         # Register routes
         register_all_routes(app, db_instance, config.is_core)
 
+        if config.is_core:  # After routes, so template filters registered there are available
+            RESTAPIFactory._prepare_templates(app)
+            RESTAPIFactory._install_cached_url_for(app)
+
         # Log application startup
         summary_message = f"REST API started at {config.site_name}. "
         detailed_message = f"DEBUG={app.config['DEBUG']}, Local API=True, Core API={config.is_core}"
         logger.info(summary_message + detailed_message)
         db_instance.put_log({'summary_message': summary_message, 'detailed_message': detailed_message})
 
-        return app
\ No newline at end of file
+        return app
+
+    @staticmethod
+    def _prepare_templates(app):
+        """
+        Share compiled templates between workers and compile them all at startup.
+
+        A filesystem bytecode cache lets restarted workers skip re-compiling the
+        web-gui templates, and loading every template here keeps the compile cost
+        off the first request each worker serves.
+        """
+        try:
+            # No directory given: Jinja uses a per-user 0700 directory and checks its
+            # owner, other local users can't plant bytecode for the workers to load
+            app.jinja_env.bytecode_cache = FileSystemBytecodeCache()
+        except (OSError, RuntimeError) as e:
+            logger.warning("Jinja bytecode cache disabled: %s", e)
+
+        for template_name in app.jinja_env.list_templates():
+            app.jinja_env.get_template(template_name)
+        logger.debug("web-gui templates pre-compiled")
+
+    @staticmethod
+    def _install_cached_url_for(app):
+        """
+        Replace the template url_for global with a memoised version.
+
+        The hashtable detail page builds a link per child entry, so the same URL
+        rules are resolved many times per render. Results are keyed on the
+        script root as well as the arguments so mounted deployments stay correct.
+        Blueprint-relative endpoints and external URLs depend on the current
+        request beyond that key, so they always go straight to url_for.
+        """
+        @lru_cache(maxsize=8192)
+        def _build(script_root, endpoint, values):
+            return url_for(endpoint, **dict(values))
+
+        def cached_url_for(endpoint, **values):
+            if endpoint.startswith('.') or '_external' in values or '_scheme' in values:
+                return url_for(endpoint, **values)
+            try:
+                return _build(request.script_root, endpoint, tuple(sorted(values.items())))
+            except TypeError:  # Unhashable argument, resolve without the cache
+                return url_for(endpoint, **values)
+
+        app.jinja_env.globals['url_for'] = cached_url_for
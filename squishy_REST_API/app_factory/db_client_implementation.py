@@ -1,143 +1,10 @@
-from typing import Dict, Tuple, Optional, Any, List
+from typing import Dict, Tuple, Optional, Any, List, Iterator
 from datetime import datetime
 
-# from .db_client_interface import DBClientInterface, CoreDBClientInterface, DBInstanceInterface
 from .db_client_interface import DBInstanceInterface
 from squishy_REST_API import config
 
 
-# class RemoteDBStorage(DBClientInterface):
-#     """Hash storage implementation using REST connector"""
-#     def __init__(self, local_db_instance):
-#         self.local_db_instance = local_db_instance
-#
-#     def get_hash_record(self, path: str) -> Dict[str, Any] | None:
-#         return self.local_db_instance.get_hash_record(path)
-#
-#     def insert_or_update_hash(self, record: Dict[str, Any]) -> bool:
-#         return self.local_db_instance.insert_or_update_hash(record)
-#
-#     def get_single_hash_record(self, path: str) -> str | None:
-#         field_data = self.local_db_instance.get_single_field(path, 'current_hash')
-#         if isinstance(field_data, str):
-#             return field_data
-#         else:
-#             return None
-#
-#     def get_single_timestamp(self, path: str) -> int | None:
-#         field_data = self.local_db_instance.get_single_field(path, 'current_dtg_latest')
-#         if isinstance(field_data, int):
-#             return field_data
-#         else:
-#             return None
-#
-#     def get_priority_updates(self) -> List[str]:
-#         return self.local_db_instance.get_priority_updates()
-#
-#     def put_log(self, args_dict: dict) -> int:
-#         return self.local_db_instance.put_log(args_dict)
-#
-#     def get_logs(self, limit: Optional[int] = None, offset: int = 0,
-#                  order_by: str = "timestamp", order_direction: str = "DESC",
-#                  session_id_filter: Optional[str] = None,
-#                  older_than_days: Optional[int] = None) -> List[Dict[str, Any]]:
-#         return self.local_db_instance.get_logs(limit, offset, order_by,
-#                                                order_direction, session_id_filter,
-#                                                older_than_days)
-#
-#     def consolidate_logs(self) -> bool:
-#         return self.local_db_instance.consolidate_logs()
-#
-#     def delete_log_entries(self, log_ids: list[int]) -> tuple[list, list]:
-#         return self.local_db_instance.delete_log_entries(log_ids)
-#
-#     def find_orphaned_entries(self) -> list[str]:
-#         return self.local_db_instance.find_orphaned_entries()
-#
-#     def find_untracked_children(self) -> list[Any]:
-#         return self.local_db_instance.find_untracked_children()
-#
-#     def heath_check(self) -> dict:
-#         return self.local_db_instance.health_check()
-#
-#
-# class CoreDBStorage(DBClientInterface, CoreDBClientInterface):
-#     """Hash storage implementation using REST connector"""
-#     def __init__(self, local_db_instance, pipeline_db_instance):
-#         self.local_db_instance = local_db_instance
-#         self.pipeline_db_instance = pipeline_db_instance
-#
-#     # Remote client implementations
-#     def get_hash_record(self, path: str) -> Dict[str, Any] | None:
-#         return self.local_db_instance.get_hash_record(path)
-#
-#     def insert_or_update_hash(self, record: Dict[str, Any]) -> bool:
-#         return self.local_db_instance.insert_or_update_hash(record)
-#
-#     def get_single_hash_record(self, path: str) -> str | None:
-#         field_data = self.local_db_instance.get_single_field(path, 'current_hash')
-#         if isinstance(field_data, str):
-#             return field_data
-#         else:
-#             return None
-#
-#     def get_single_timestamp(self, path: str) -> int | None:
-#         field_data = self.local_db_instance.get_single_field(path, 'current_dtg_latest')
-#         if isinstance(field_data, int):
-#             return field_data
-#         else:
-#             return None
-#
-#     def get_priority_updates(self) -> List[str]:
-#         return self.local_db_instance.get_priority_updates()
-#
-#     def put_log(self, args_dict: dict) -> int:
-#         return self.local_db_instance.put_log(args_dict)
-#
-#     def get_logs(self, limit: Optional[int] = None, offset: int = 0,
-#                  order_by: str = "timestamp", order_direction: str = "DESC",
-#                  session_id_filter: Optional[str] = None,
-#                  older_than_days: Optional[int] = None) -> List[Dict[str, Any]]:
-#         return self.local_db_instance.get_logs(limit, offset, order_by,
-#                                                order_direction, session_id_filter,
-#                                                older_than_days)
-#
-#     def consolidate_logs(self) -> bool:
-#         return self.local_db_instance.consolidate_logs()
-#
-#     def delete_log_entries(self, log_ids: list[int]) -> tuple[list, list]:
-#         return self.local_db_instance.delete_log_entries(log_ids)
-#
-#     def find_orphaned_entries(self) -> list[str]:
-#         return self.local_db_instance.find_orphaned_entries()
-#
-#     def find_untracked_children(self) -> list[Any]:
-#         return self.local_db_instance.find_untracked_children()
-#
-#     def heath_check(self) -> dict:
-#         return self.local_db_instance.health_check()
-#
-#     # Remote client core site only implementations
-#     def put_remote_site_status(self) -> bool:
-#         return self.local_db_instance.put_remote_site_status()
-#
-#     # Core client core site only implementations
-#     def get_pipeline_updates(self) -> List[Dict[str, Any]]:
-#         """Get TeamCity updates that haven't been processed yet."""
-#         return self.pipeline_db_instance.get_pipeline_updates()
-#
-#     def put_pipeline_hash(self, update_path: str, hash_value: str) -> bool:
-#         """Put calculated hash back into the database for a specific update path."""
-#         return self.pipeline_db_instance.put_pipeline_hash(update_path, hash_value)
-#
-#     def get_pipeline_sites(self) -> List[str]:
-#         """Get the current authoritative sites list from the MSSQL table."""
-#         return self.pipeline_db_instance.get_official_sites()
-#
-#     def put_pipeline_site_completion(self, site: str) -> bool:
-#         return self.pipeline_db_instance.put_pipeline_site_completion
-
-
 class DBInstance(DBInstanceInterface):
     """Hash storage implementation using REST connector"""
     def __init__(self, local_db_instance):
@@ -163,6 +30,16 @@ class DBInstance(DBInstanceInterface):
         else:
             return None
 
+    def get_child_timestamps(self, path: str, limit: int | None = None) -> Dict[str, float] | None:
+        record = self.local_db_instance.get_hash_record(path)
+        if not record:
+            return None
+        children = [f"{path}/{item}" for field in ('dirs', 'files', 'links') for item in record.get(field) or []]
+        timestamps = self.local_db_instance.get_timestamps(children, limit) if children else {}
+        # Epoch seconds so clients can order them, datetimes would serialize as HTTP date strings
+        return {child: value.timestamp() if isinstance(value, datetime) else value
+                for child, value in timestamps.items()}
+
     def get_priority_updates(self) -> List[str]:
         return self.local_db_instance.get_priority_updates()
 
@@ -172,6 +49,13 @@ class DBInstance(DBInstanceInterface):
             args_dict['site_id'] = config.site_name
         return self.local_db_instance.put_log(args_dict)
 
+    def put_logs(self, rows: List[dict]) -> List[int] | None:
+        for args_dict in rows:
+            site_id = args_dict.get('site_id')
+            if not site_id or 'local' == site_id:
+                args_dict['site_id'] = config.site_name
+        return self.local_db_instance.put_logs(rows)
+
     def get_logs(self, limit: Optional[int] = None, offset: int = 0,
                  order_by: str = "timestamp", order_direction: str = "DESC",
                  session_id_filter: Optional[str] = None,
@@ -206,8 +90,16 @@ class DBInstance(DBInstanceInterface):
     def get_dashboard_content(self) -> dict[str, Any]:
         return self.local_db_instance.get_dashboard_content()
 
-    def get_recent_logs(self, log_level: str = None, site_id: str = None) -> list:
-        return self.local_db_instance.get_recent_logs(log_level, site_id)
+    def get_recent_logs(self, log_level: str = None, site_id: str = None,
+                        limit: int = None, offset: int = 0) -> list:
+        return self.local_db_instance.get_recent_logs(log_level, site_id, limit, offset)
+
+    def iter_recent_logs(self, log_level: str = None, site_id: str = None) -> Iterator[dict]:
+        return self.local_db_instance.iter_recent_logs(log_level, site_id)
+
+    def get_logs_page(self, log_level: str = None, site_id: str = None,
+                      limit: int = None, offset: int = 0, before: tuple = None) -> dict:
+        return self.local_db_instance.get_logs_page(log_level, site_id, limit, offset, before)
 
     def get_hash_record_count(self) -> int:
         return self.local_db_instance.get_hash_record_count()
@@ -237,5 +129,9 @@ class DBInstance(DBInstanceInterface):
         """Get the current authoritative sites list from the MSSQL table."""
         return self.local_db_instance.get_official_sites()
 
+    def warm_pipeline_pool(self) -> int:
+        """Open the pipeline database's pooled connections before the first request."""
+        return self.local_db_instance.warm_pipeline_pool()
+
     # def put_pipeline_site_completion(self, site: str) -> bool:
     #     return self.local_db_instance.put_pipeline_site_completion()
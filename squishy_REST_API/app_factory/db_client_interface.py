@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Tuple, Optional, Any, List
+from typing import Dict, Tuple, Optional, Any, List, Iterator
 
 
 class DBInstanceInterface(ABC):
@@ -7,54 +7,62 @@ class DBInstanceInterface(ABC):
     # RemoteDBConnection interface methods
     @abstractmethod
     def get_hash_record(self, path: str) -> Optional[Dict[str, Any]]:
-        pass
+        raise NotImplementedError
 
     @abstractmethod
     def insert_or_update_hash(self, record: dict[str, Any]) -> bool:
-        pass
+        raise NotImplementedError
 
     @abstractmethod
     def get_single_hash_record(self, path: str) -> str | None:
-        pass
+        raise NotImplementedError
 
     @abstractmethod
     def get_single_timestamp(self, path: str) -> int | None:
-        pass
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_child_timestamps(self, path: str, limit: int | None = None) -> Dict[str, float] | None:
+        raise NotImplementedError
 
     @abstractmethod
     def get_priority_updates(self) -> List[str]:
-        pass
+        raise NotImplementedError
 
     @abstractmethod
     def put_log(self, args_dict: dict) -> int | None:
-        pass
+        raise NotImplementedError
+
+    @abstractmethod
+    def put_logs(self, rows: List[dict]) -> List[int] | None:
+        raise NotImplementedError
 
     @abstractmethod
     def get_logs(self, limit: Optional[int] = None, offset: int = 0,
                  order_by: str = "timestamp", order_direction: str = "DESC",
                  session_id_filter: Optional[str] = None,
                  older_than_days: Optional[int] = None) -> List[Dict[str, Any]]:
-        pass
+        raise NotImplementedError
 
     @abstractmethod
     def consolidate_logs(self) -> bool:
-        pass
+        raise NotImplementedError
 
     @abstractmethod
     def delete_log_entries(self, log_ids: list[int]) -> tuple[list, list]:
-        pass
+        raise NotImplementedError
 
     @abstractmethod
     def find_orphaned_entries(self) -> list[str]:
-        pass
+        raise NotImplementedError
 
     @abstractmethod
     def find_untracked_children(self) -> list[Any]:
-        pass
+        raise NotImplementedError
 
     @abstractmethod
     def health_check(self) -> dict[str, bool]:
-        pass
+        raise NotImplementedError
 
     @abstractmethod
     def put_remote_hash_status(self, update_list: list[dict[str, str]],
@@ -62,49 +70,62 @@ class DBInstanceInterface(ABC):
                                drop_existing: bool = False,
                                root_path: str = None
                                ) -> list[str]:
-        pass
+        raise NotImplementedError
 
     ########## CoreDBConnection interface methods
     @abstractmethod
     def get_dashboard_content(self) -> dict[str, Any]:
-        pass
+        raise NotImplementedError
 
     @abstractmethod
     def get_recent_logs(self) -> list:
-        pass
+        raise NotImplementedError
+
+    @abstractmethod
+    def iter_recent_logs(self, log_level: str = None, site_id: str = None) -> Iterator[dict]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_logs_page(self, log_level: str = None, site_id: str = None,
+                      limit: int = None, offset: int = 0, before: tuple = None) -> dict:
+        raise NotImplementedError
 
     @abstractmethod
     def get_hash_record_count(self) -> int:
-        pass
+        raise NotImplementedError
 
     @abstractmethod
     def get_log_count_last_24h(self, log_level: str='INFO') -> int:
-        pass
+        raise NotImplementedError
 
     @abstractmethod
     def get_site_liveness(self) -> list:
-        pass
+        raise NotImplementedError
 
     @abstractmethod
     def get_site_sync_status(self) -> list:
-        pass
+        raise NotImplementedError
 
     @abstractmethod
     def sync_sites_from_mssql_upsert(self, mssql_sites: List[Dict[str, Any]]) -> bool:
-        pass
+        raise NotImplementedError
 
     # PipelineDBConnection interface methods
     @abstractmethod
     def get_pipeline_updates(self) -> List[Dict[str, Any]]:
-        pass
+        raise NotImplementedError
 
     @abstractmethod
     def put_pipeline_hash(self, update_path: str, hash_value: str) -> bool:
-        pass
+        raise NotImplementedError
 
     @abstractmethod
     def get_pipeline_sites(self) -> List[str]:
-        pass
+        raise NotImplementedError
+
+    @abstractmethod
+    def warm_pipeline_pool(self) -> int:
+        raise NotImplementedError
 
     # @abstractmethod
     # def put_pipeline_site_completion(self, site: str) -> bool:
@@ -0,0 +1,47 @@
+"""
+JSON provider for REST API package.
+
+This module provides an orjson backed Flask JSON provider. orjson is optional,
+when it is not installed the application keeps Flask's default provider.
+"""
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider that serializes with orjson.
+
+    Output is equivalent to the default provider: keys are sorted, non-string
+    keys become strings and dates still use the HTTP date format, so API clients
+    see no change in the payloads. Non-ASCII text is sent as UTF-8 rather than
+    escaped, which decodes to the same values.
+    """
+    _OPTIONS = (orjson.OPT_SORT_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS) if orjson else 0
+    _COMPACT = (",", ":")
+
+    def dumps(self, obj, **kwargs) -> str:
+        """
+        Serialize obj as JSON with orjson.
+
+        jsonify's indent=2 (debug mode) and compact separators map onto orjson's
+        output, any other json.dumps argument is honoured by the default provider.
+        """
+        default = kwargs.pop("default", self.default)
+        option = self._OPTIONS
+        indent = kwargs.pop("indent", None)
+        separators = kwargs.pop("separators", None)
+        if indent == 2 and separators is None:
+            option |= orjson.OPT_INDENT_2
+        elif indent is not None or (separators is not None and tuple(separators) != self._COMPACT):
+            kwargs.update(indent=indent, separators=separators)
+        if kwargs:
+            return super().dumps(obj, default=default, **kwargs)
+        return orjson.dumps(obj, default=default, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
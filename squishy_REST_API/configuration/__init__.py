@@ -1,3 +1,6 @@
-from .config import config, logger
+from .config import Config, config, logger
 
-__all__ = ['config', 'logger']
\ No newline at end of file
+# Fixed at class definition, exposed as an immutable constant for per-request checks
+VALID_LOG_LEVELS = Config.VALID_LOG_LEVELS
+
+__all__ = ['config', 'logger', 'VALID_LOG_LEVELS']
\ No newline at end of file
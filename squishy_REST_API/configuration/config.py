@@ -5,20 +5,59 @@ This module centralizes configuration management and provides a way to
 load configuration from environment variables or configuration files.
 """
 import os
-from typing import Dict, Any, Optional, Union
+from dataclasses import dataclass
+from types import MappingProxyType
+from functools import cached_property, lru_cache
+from typing import Dict, Any, Optional, Union, Callable, Tuple, Iterable
 
 from .logging_config import configure_logging
 
+_TRUE_VALUES = frozenset({'true', '1', 'yes', 'on'})
+
 
 class ConfigError(Exception):
     """Custom exception for configuration errors."""
     pass
 
 
+@dataclass(frozen=True, slots=True)
+class ConfigSnapshot:
+    """Read-only copy of the settings used by the server entry points."""
+    api_host: str
+    api_port: int
+    debug: bool
+    use_gunicorn: bool
+    secret_key: Optional[str]
+    site_name: Optional[str]
+    is_core: bool
+
+
+def _to_bool(value: str) -> bool:
+    """Convert an environment string to a boolean."""
+    return value.lower() in _TRUE_VALUES
+
+
+def _converter_for(key: str, numeric_keys: Iterable[str], boolean_keys: Iterable[str]) -> Callable[[str], Any]:
+    """Select the conversion function for a configuration key."""
+    if key in numeric_keys:
+        return int
+    if key in boolean_keys:
+        return _to_bool
+    return str
+
+
+def _build_env_items(env_mapping: Dict[str, str], numeric_keys: Iterable[str],
+                     boolean_keys: Iterable[str]) -> Tuple[Tuple[str, str, Callable[[str], Any]], ...]:
+    """Pair each environment mapping with its converter, once at class definition."""
+    return tuple(
+        (config_key, env_key, _converter_for(config_key, numeric_keys, boolean_keys))
+        for config_key, env_key in env_mapping.items()
+    )
+
+
 class Config:
     """Configuration class for REST API package."""
     _instance = None
-    _config = None
 
     def __new__(cls):
         if cls._instance is None:
@@ -26,16 +65,18 @@ class Config:
         return cls._instance
 
     # Define required keys as class constants
-    REQUIRED_KEYS = ['db_user', 'db_password', 'secret_key', 'site_name', 'core_name']
-    SENSITIVE_KEYS = ['db_password', 'secret_key']
-    NUMERIC_KEYS = ['db_port', 'api_port', 'workers', 'timeout', 'keepalive', 'max_requests', 'max_requests_jitter']
-    BOOLEAN_KEYS = ['debug', 'use_gunicorn']
+    REQUIRED_KEYS = ('db_user', 'db_password', 'secret_key', 'site_name', 'core_name')  # Ordered for error messages
+    SENSITIVE_KEYS = frozenset({'db_password', 'secret_key'})
+    NUMERIC_KEYS = frozenset({'db_port', 'db_pool_size', 'api_port', 'workers', 'threads', 'timeout', 'keepalive',
+                              'max_requests', 'max_requests_jitter'})
+    BOOLEAN_KEYS = frozenset({'debug', 'use_gunicorn', 'preload_app'})
     MAX_LENGTHS = {'site_name': 5}
-
+    VALID_LOG_LEVELS = frozenset({'DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'})
+    # Cached properties derived from _config, dropped whenever the configuration changes
+    _CACHED_PROPERTIES = ('site_name', 'database_url', 'gunicorn_config', 'database_config', '_snapshot')
 
     # Default generic configuration values
     DEFAULTS = {
-        'valid_log_levels': {'DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'},
         'log_level': 'INFO',
         'site_name': None,
         'core_name': 'HQS0',
@@ -51,7 +92,8 @@ class Config:
     # Gunicorn (WSGI) default configs
     DEFAULTS.update({
         'workers': 4,
-        'worker_class': 'sync',
+        'worker_class': 'gthread',  # Threaded workers so blocking DB calls don't stall a whole worker
+        'threads': 4,
         'timeout': 60,
         'keepalive': 2,
         'max_requests': 1000,
@@ -59,6 +101,7 @@ class Config:
         'accesslog': '-',
         'errorlog': '-',
         'proc_name': 'squishy_rest_api',
+        'preload_app': True,  # Load the app in the master once, workers share it copy-on-write
         'use_gunicorn': True
     })
     # Database default configs
@@ -69,6 +112,7 @@ class Config:
         'db_user': None,
         'db_password': None,
         'db_port': 3306,
+        'db_pool_size': None,  # Pooled connections per database client, per worker process, None sizes it to threads
 
         'pipeline_db_type': 'mysql',
         'pipeline_db_server': 'mysql_squishy_db',
@@ -78,6 +122,9 @@ class Config:
         'pipeline_db_port': 1433,
     })
 
+    # Read-only from here on, every Config copies it into its own _config
+    DEFAULTS = MappingProxyType(DEFAULTS)
+
     # Environment variable mapping
     ENV_MAPPING = {
         'db_type': 'LOCAL_DB_TYPE',
@@ -86,6 +133,7 @@ class Config:
         'db_user': 'LOCAL_DB_USER',
         'db_password': 'LOCAL_DB_PASSWORD',
         'db_port': 'LOCAL_DB_PORT',
+        'db_pool_size': 'LOCAL_DB_POOL_SIZE',
         'pipeline_db_type': 'PIPELINE_DB_TYPE',
         'pipeline_db_server': 'PIPELINE_DB_SERVER',
         'pipeline_db_name': 'PIPELINE_DB_NAME',
@@ -97,9 +145,12 @@ class Config:
         'api_host': 'API_HOST',
         'api_port': 'API_PORT',
         'debug': 'DEBUG',
+        'preload_app': 'PRELOAD_APP',
         'secret_key': 'API_SECRET_KEY',
         'log_level': 'LOG_LEVEL'
     }
+    # (config_key, env_key, converter) triples, classified once instead of per value
+    _ENV_ITEMS = _build_env_items(ENV_MAPPING, NUMERIC_KEYS, BOOLEAN_KEYS)
 
 
     def __init__(self, config_dict: Optional[Dict[str, Any]] = None):
@@ -112,91 +163,182 @@ class Config:
         Raises:
             ConfigError: If required configuration is missing
         """
-        self._config: Dict[str, Any] = self.DEFAULTS.copy()
+        raw_env = None if config_dict else self._read_environment()
+        if raw_env is not None and raw_env == getattr(self, '_env_snapshot', None):
+            return  # Singleton already initialised from this environment
+
+        self._env_snapshot = None  # Only recorded once initialisation completes
+        self._config: Dict[str, Any] = dict(self.DEFAULTS)
+        self._clear_cached()  # Singleton may be re-initialised
 
         if config_dict:
             self._config.update(config_dict)
         else:
-            self._load_from_environment()
+            self._config.update(self._resolve_env(raw_env))
 
         self._validate_configuration()
+        self._bind_accessors()
 
-        self.gunicorn_config = {
-            'bind': f'{self._config["api_host"]}:{self._config["api_port"]}',
-            'workers': self._config["workers"],
-            'worker_class': self._config["worker_class"],
-            'timeout': self._config["timeout"],
-            'keepalive': self._config["keepalive"],
-            'max_requests': self._config["max_requests"],
-            'max_requests_jitter': self._config["max_requests_jitter"],
-            'loglevel': self._config["log_level"],  # Accepts same levels as our logger debug,info,warning,error,critical
-            'accesslog': self._config["accesslog"],
-            'errorlog': self._config["errorlog"],
-            'proc_name': self._config["proc_name"],
-        }
+        # core_name is required, so only an empty site name can't be a core site
+        self.is_core = bool(self.site_name and self.site_name in self._config['core_name'].upper())
 
-        self.database_config = {
-            'remote_type': self._config['db_type'],
-            'remote_config': {
-                'server': self._config['db_host'],
-                'host': self._config['db_host'],
-                'database': self._config['db_name'],
-                'user': self._config['db_user'],
-                'password': self._config['db_password'],
-                'port': self._config['db_port'],
-            },
-            'core_type': self._config['db_type'],
-            'core_config': {
-                'server': self._config['db_host'],
-                'host': self._config['db_host'],
-                'database': self._config['db_name'],
-                'user': self._config['db_user'],
-                'password': self._config['db_password'],
-                'port': self._config['db_port'],
-            },
-            'pipeline_type': self._config['pipeline_db_type'],
-            'pipeline_config': {
-                'server': self._config['pipeline_db_server'],
-                'host': self._config['pipeline_db_server'],
-                'database': self._config['pipeline_db_name'] ,
-                'user': self._config['pipeline_db_user'],
-                'password': self._config['pipeline_db_password'],
-                'port': self._config['pipeline_db_port']
-            }
-        }
+        # Create logger
+        self.logger = configure_logging(self._config.get('log_level'))
+        self._env_snapshot = raw_env
 
-        # Get sites' data
-        self.site_name = self._config.get('site_name')
-        self.site_name = self.site_name.upper() if self.site_name else None
+    def _clear_cached(self) -> None:
+        """Drop cached derived values so they are rebuilt from the current configuration."""
+        for name in self._CACHED_PROPERTIES:
+            self.__dict__.pop(name, None)
 
-        core_name = self._config.get('core_name')
-        self.is_core = (
-                core_name is not None and
-                self.site_name is not None and
-                self.site_name in core_name.upper()
-        )
+    @cached_property
+    def site_name(self) -> Optional[str]:
+        """
+        Name of this site, as upper-cased by validation.
+
+        Returns:
+            Site name, or None when it is empty
+        """
+        return self._config.get('site_name') or None
 
+    @cached_property
+    def gunicorn_config(self) -> Dict[str, Any]:
+        """
+        Gunicorn settings, built on first access.
+
+        Returns:
+            Gunicorn configuration dictionary
+        """
+        return self._build_gunicorn_config(self._config)
+
+    @cached_property
+    def database_config(self) -> Dict[str, Any]:
+        """
+        Database client settings, built on first access.
 
-        # Update database dict based on is_core status
+        Core and pipeline entries are only populated for the core site.
+
+        Returns:
+            Database configuration dictionary
+        """
+        database_config = self._build_database_config(self._config)
         if not self.is_core:
-            for key in {'core_type', 'core_config', 'pipeline_type', 'pipeline_config'}:
-                self.database_config[key] = None
+            for key in ('core_type', 'core_config', 'pipeline_type', 'pipeline_config'):
+                database_config[key] = None
+        return database_config
 
-        # Create logger
-        self.logger = configure_logging(self._config.get('log_level'))
+    @staticmethod
+    def _build_gunicorn_config(c: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the gunicorn settings dictionary from the configuration values.
+
+        Args:
+            c: Configuration dictionary (read through a local reference)
+
+        Returns:
+            Gunicorn configuration dictionary
+        """
+        return {
+            'bind': f'{c["api_host"]}:{c["api_port"]}',
+            'workers': c["workers"],
+            'worker_class': c["worker_class"],
+            'threads': c["threads"],
+            'timeout': c["timeout"],
+            'keepalive': c["keepalive"],
+            'max_requests': c["max_requests"],
+            'max_requests_jitter': c["max_requests_jitter"],
+            'loglevel': c["log_level"],  # Accepts same levels as our logger debug,info,warning,error,critical
+            'accesslog': c["accesslog"],
+            'errorlog': c["errorlog"],
+            'proc_name': c["proc_name"],
+            'preload_app': c["preload_app"],
+        }
+
+    @staticmethod
+    def _build_database_config(c: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the database client configuration dictionary.
+
+        Args:
+            c: Configuration dictionary (read through a local reference)
+
+        Returns:
+            Database configuration dictionary
+        """
+        # Remote and core clients use the same local database, share one dict
+        # One connection per request thread plus one for the worker's own health checks
+        pool_size = c['threads'] + 1 if c['db_pool_size'] is None else c['db_pool_size']
+        local_db = {
+            'server': c['db_host'],
+            'host': c['db_host'],
+            'database': c['db_name'],
+            'user': c['db_user'],
+            'password': c['db_password'],
+            'port': c['db_port'],
+            'pool_size': pool_size,
+        }
+        return {
+            'remote_type': c['db_type'],
+            'remote_config': local_db,
+            'core_type': c['db_type'],
+            'core_config': local_db,
+            'pipeline_type': c['pipeline_db_type'],
+            'pipeline_config': {
+                'server': c['pipeline_db_server'],
+                'host': c['pipeline_db_server'],
+                'database': c['pipeline_db_name'],
+                'user': c['pipeline_db_user'],
+                'password': c['pipeline_db_password'],
+                'port': c['pipeline_db_port'],
+                'pool_size': pool_size,
+            }
+        }
 
     # @property
     # def core_api_url(self) -> str:
     #     return f"https://{self._config.get('core_host')}.{self._config.get('core_top_level_domain')}"
 
-    def _load_from_environment(self) -> None:
-        """Load configuration from environment variables."""
-        for config_key, env_key in self.ENV_MAPPING.items():
-            env_value = os.environ.get(env_key)
-            if env_value is not None:
-                self._config[config_key] = self._convert_value(config_key, env_value)
+    @classmethod
+    def _read_environment(cls) -> tuple:
+        """
+        Read the raw environment values used by the configuration.
+
+        Returns:
+            Environment values in _ENV_ITEMS order (None where unset)
+        """
+        environ_get = os.environ.get
+        return tuple(environ_get(env_key) for _, env_key, _ in cls._ENV_ITEMS)
 
-    def _convert_value(self, key: str, value: str) -> Union[int, bool, str]:
+    @classmethod
+    @lru_cache(maxsize=8)
+    def _resolve_env(cls, raw_values: tuple) -> Dict[str, Any]:
+        """
+        Convert raw environment values into typed configuration values.
+
+        Results are memoized on the raw values, so repeated Config() constructions
+        against an unchanged environment skip the type conversions entirely.
+
+        Args:
+            raw_values: Environment values in _ENV_ITEMS order (None where unset)
+
+        Returns:
+            Dictionary of converted values for the variables that are set
+
+        Raises:
+            ConfigError: If a numeric value cannot be converted
+        """
+        resolved = {}
+        for (config_key, _, converter), env_value in zip(cls._ENV_ITEMS, raw_values):
+            if env_value is None:
+                continue
+            try:
+                resolved[config_key] = converter(env_value)
+            except ValueError:
+                raise ConfigError(f"Invalid integer value for {config_key}: {env_value}")
+        return resolved
+
+    @classmethod
+    def _convert_value(cls, key: str, value: str) -> Union[int, bool, str]:
         """
         Convert string values to appropriate types.
 
@@ -210,14 +352,11 @@ class Config:
         Raises:
             ConfigError: If conversion fails
         """
-        if key in self.NUMERIC_KEYS:
-            try:
-                return int(value)
-            except ValueError:
-                raise ConfigError(f"Invalid integer value for {key}: {value}")
-        elif key == self.BOOLEAN_KEYS:
-            return value.lower() in ('true', '1', 'yes', 'on')
-        return value
+        converter = _converter_for(key, cls.NUMERIC_KEYS, cls.BOOLEAN_KEYS)
+        try:
+            return converter(value)
+        except ValueError:
+            raise ConfigError(f"Invalid integer value for {key}: {value}")
 
     def _validate_configuration(self) -> None:
         """
@@ -228,21 +367,31 @@ class Config:
         """
         missing_keys = [
             key for key in self.REQUIRED_KEYS
-            if key not in self._config or self._config[key] is None
+            if self._config.get(key) is None
         ]
 
         if missing_keys:
             raise ConfigError(f"Missing required configuration keys: {', '.join(missing_keys)}")
 
         for key, max_length in self.MAX_LENGTHS.items():
-            if self._config[key] and len(self._config[key]) > max_length:
+            value = self._config[key]
+            if value and len(value) > max_length:
                 raise ConfigError(f"Configuration value for {key} must be {max_length} or fewer characters")
 
         self._config['site_name'] = self._config['site_name'].upper()
 
-        self._config['log_level'] = self._config['log_level'].upper()
-        if self._config['log_level'] not in self._config.get('valid_log_levels'):
-            self._config['log_level'] = 'INFO'
+        log_level = self._config['log_level'].upper()
+        self._config['log_level'] = log_level if log_level in self.VALID_LOG_LEVELS else 'INFO'
+
+    def _bind_accessors(self) -> None:
+        """
+        Cache lookups used on hot paths against the current configuration dict.
+
+        get() is rebound straight to the dict's own get, and the debug flag is
+        resolved once instead of on every is_debug_mode() call.
+        """
+        self.get = self._config.get
+        self.is_debug = bool(self._config.get('debug', False))
 
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -274,6 +423,8 @@ class Config:
 
         # Set the new value
         self._config[key] = value
+        self._clear_cached()  # Rebuild derived values on next access
+        self._env_snapshot = None  # No longer matches the environment, the next Config() reloads it
 
         try:
             # Validate the configuration with the new value
@@ -286,10 +437,12 @@ class Config:
                 del self._config[key]
             # Re-raise the error
             raise ConfigError(e)
+        self._bind_accessors()
 
-    def get_database_url(self) -> str:
+    @cached_property
+    def database_url(self) -> str:
         """
-        Get database connection URL.
+        Database connection URL, built once on first access.
 
         Returns:
             Database connection URL
@@ -299,6 +452,38 @@ class Config:
             f"@{self._config['db_host']}:{self._config['db_port']}/{self._config['db_name']}"
         )
 
+    def get_database_url(self) -> str:
+        """
+        Get database connection URL.
+
+        Returns:
+            Database connection URL
+        """
+        return self.database_url
+
+    @cached_property
+    def _snapshot(self) -> ConfigSnapshot:
+        """Snapshot built on first use and reused until the configuration changes."""
+        c = self._config
+        return ConfigSnapshot(
+            api_host=c['api_host'],
+            api_port=c['api_port'],
+            debug=self.is_debug,
+            use_gunicorn=bool(c['use_gunicorn']),
+            secret_key=c['secret_key'],
+            site_name=self.site_name,
+            is_core=self.is_core,
+        )
+
+    def snapshot(self) -> ConfigSnapshot:
+        """
+        Get a frozen snapshot of the server settings.
+
+        Returns:
+            ConfigSnapshot with attribute access to the current values
+        """
+        return self._snapshot
+
     def is_debug_mode(self) -> bool:
         """
         Check if debug mode is enabled.
@@ -306,7 +491,7 @@ class Config:
         Returns:
             True if debug mode is enabled, False otherwise
         """
-        return bool(self._config.get('debug', False))
+        return self.is_debug
 
     def __getitem__(self, key: str) -> Any:
         """Allow dictionary-style access to configuration."""
@@ -318,8 +503,8 @@ class Config:
 
     def __repr__(self) -> str:
         """String representation of config (without sensitive data)."""
-        safe_config = {k: v for k, v in self._config.items()
-                      if k not in ('db_password', 'secret_key')}
+        safe_keys = sorted(self._config.keys() - self.SENSITIVE_KEYS)  # Sorted for stable output
+        safe_config = {k: self._config[k] for k in safe_keys}
         return f"Config({safe_config})"
 
 
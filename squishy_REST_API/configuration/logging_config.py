@@ -7,6 +7,9 @@ import logging
 import sys
 from typing import Optional
 
+# Level names resolved once, looked up on every configure_logging call
+_LEVELS = {name: getattr(logging, name) for name in ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')}
+
 
 def configure_logging(log_level: Optional[str] = None) -> logging.Logger:
     """
@@ -28,11 +31,15 @@ def configure_logging(log_level: Optional[str] = None) -> logging.Logger:
     logger = logging.getLogger('rest_api')
 
     # Set the log level
-    numeric_level = getattr(logging, log_level, None)
-    if not isinstance(numeric_level, int):
-        numeric_level = logging.INFO
+    numeric_level = _LEVELS.get(log_level, logging.INFO)
     logger.setLevel(numeric_level)
 
+    # Handlers are attached once per process; re-running Config() only updates the level
+    if logger.handlers:
+        for handler in logger.handlers:
+            handler.setLevel(numeric_level)
+        return logger
+
     # Create a console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(numeric_level)
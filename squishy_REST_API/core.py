@@ -3,23 +3,37 @@ Main entry point for the squishy_REST_API package.
 
 This module creates and runs a default Flask application with gunicorn WSGI server.
 """
+from functools import lru_cache
+
 from squishy_REST_API import config, logger, RESTAPIFactory
 
 
-def run_with_gunicorn(app):
-    """Run the application with Gunicorn."""
-    try:
-        from gunicorn.app.wsgiapp import WSGIApplication
-    except ImportError:
-        logger.error("Gunicorn not installed. Install with: pip install gunicorn")
-        return False
+def warm_worker(server, worker):
+    """
+    Gunicorn post_fork hook, readies the worker before it takes requests.
 
-    # Get configuration (config validation handled in config.py)
-    gunicorn_config = config.gunicorn_config
+    The app itself is built once in the master (preload_app) and inherited by
+    every worker. Database pools are per process, so each worker opens its pool
+    here rather than on its first request.
+    """
+    db_instance = RESTAPIFactory._get_db_instance()
+    db_instance.health_check()
+    db_instance.warm_pipeline_pool()
 
-    logger.info(f"Starting Gunicorn server on {gunicorn_config['bind']} with {gunicorn_config['workers']} workers")
 
-    # Create Gunicorn app
+@lru_cache(maxsize=1)
+def get_standalone_application():
+    """
+    Get the gunicorn application class used to serve an existing app object.
+
+    gunicorn is imported on first call only, so the package still imports when
+    it isn't installed, and the class is defined once per process.
+
+    Raises:
+        ImportError: If gunicorn is not installed
+    """
+    from gunicorn.app.wsgiapp import WSGIApplication
+
     class StandaloneApplication(WSGIApplication):
         def __init__(self, class_app, options=None):
             self.options = options or {}
@@ -34,28 +48,47 @@ def run_with_gunicorn(app):
         def load(self):
             return self.application
 
+    return StandaloneApplication
+
+
+def run_with_gunicorn(app):
+    """Run the application with Gunicorn."""
+    try:
+        standalone_application = get_standalone_application()
+    except ImportError:
+        logger.error("Gunicorn not installed. Install with: pip install gunicorn")
+        return False
+
+    # Get configuration (config validation handled in config.py)
+    gunicorn_config = {**config.gunicorn_config, 'post_fork': warm_worker}
+
+    logger.info(f"Starting Gunicorn server on {gunicorn_config['bind']} with {gunicorn_config['workers']} workers")
+
     # Run with Gunicorn
-    StandaloneApplication(app, gunicorn_config).run()
+    standalone_application(app, gunicorn_config).run()
     return True
 
 
 def run_development(app):
     """Run with Flask development server."""
-    host = config.get('api_host', '0.0.0.0')
-    port = config.get('api_port', 5000)
-    debug = config.get('debug', False)
+    settings = config.snapshot()
 
-    logger.info(f"Starting development server on {host}:{port} (debug={debug})")
-    app.run(host=host, port=port, debug=debug)
+    logger.info(f"Starting development server on {settings.api_host}:{settings.api_port} (debug={settings.debug})")
+    app.run(host=settings.api_host, port=settings.api_port, debug=settings.debug, threaded=True)  # Don't serialise requests if used as a fallback
 
 
 def main():
     """Main entry point with server selection."""
 
-    # Create the app
-    app = RESTAPIFactory.create_app()
+    # Create the app, bad configuration or an unreachable database is reported as EX_CONFIG
+    try:
+        app = RESTAPIFactory.create_app()
+    except (ValueError, ConnectionError) as e:
+        logger.error(f"Failed to create application: {e}")
+        return 78  # EX_CONFIG, tells systemd/docker not to restart-loop
+
     try:
-        if config.get('use_gunicorn', True):  # Default to using gunicorn WSGI
+        if config.snapshot().use_gunicorn:  # Default to using gunicorn WSGI
             if not run_with_gunicorn(app):
                 logger.warning("Failed to start Gunicorn, falling back to development server")
                 run_development(app)
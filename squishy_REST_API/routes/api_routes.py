@@ -48,6 +48,15 @@ def register_api_routes(app: Flask, db_instance):
                         return create_error_response(f"Path not found", 404)
                     return create_success_response(data=result)
 
+                elif field == 'child_timestamps':
+                    # Get timestamps of every dir, file and link in the record, in one lookup.
+                    # With limit only the oldest children are returned.
+                    limit = request.args.get('limit', type=int)
+                    result = db_instance.get_child_timestamps(path, limit if limit and limit > 0 else None)
+                    if result is None:
+                        return create_error_response(f"Path not found", 404)
+                    return create_success_response(data=result)
+
                 elif field == 'record':
                     # Get full record (default behavior)
                     result = db_instance.get_hash_record(path)
@@ -84,6 +93,9 @@ def register_api_routes(app: Flask, db_instance):
                 if not response:
                     logger.error(f"Database error for record: {request.json}")
                     return create_error_response("Database error, see DB logs", error_type='Database error')
+                # Drop cached web-gui pages that may now show stale hash data
+                if 'gui_cache' in app.extensions:
+                    app.extensions['gui_cache'].clear()
                 return create_success_response(data=response)
             except ValueError as e:
                 return create_error_response(e, 400)
@@ -93,13 +105,23 @@ def register_api_routes(app: Flask, db_instance):
         """Handle log operations - POST to add logs, GET to consolidate logs, DELETE to remove logs."""
         if request.method == 'POST':
             logger.debug(f"POST /api/logs")
-            # Update site_id if unknown or 'local'
-            if not request.json.get('site_id') or request.json.get('site_id').lower() == 'local':
-                request.json['site_id'] = config.get('site_name')  # site_name is required to boot-up
-            try: # Insert log entry
-                response = db_instance.put_log(request.json)
-                if not response:
-                    return create_error_response("Error adding log entry")
+            # A list body inserts all entries together, otherwise the body is a single entry
+            entries = request.json if isinstance(request.json, list) else [request.json]
+            if not all(isinstance(entry, dict) for entry in entries):
+                return create_error_response("Each log entry must be a JSON object", 400)
+            for entry in entries:
+                # Update site_id if unknown or 'local'
+                if not entry.get('site_id') or entry.get('site_id').lower() == 'local':
+                    entry['site_id'] = config.get('site_name')  # site_name is required to boot-up
+            try: # Insert log entries
+                if isinstance(request.json, list):
+                    response = db_instance.put_logs(entries)
+                    if response is None:
+                        return create_error_response("Error adding log entries")
+                else:
+                    response = db_instance.put_log(request.json)
+                    if not response:
+                        return create_error_response("Error adding log entry")
             except ValueError as e:
                 return create_error_response(e, 400)
 
@@ -193,6 +215,11 @@ def register_api_routes(app: Flask, db_instance):
 
         return create_success_response(data=health_status)
 
+    @app.route('/livez', methods=['GET'])
+    def liveness():
+        """Report that the API process is up, without touching the database."""
+        return create_success_response(data={"status": "alive"})
+
     @app.route('/api/docs')
     def api_documentation():
         """Return comprehensive API documentation."""
@@ -223,8 +250,13 @@ def register_api_routes(app: Flask, db_instance):
                             "type": "string",
                             "required": False,
                             "default": "record",
-                            "options": ["record", "hash", "timestamp", "priority", "untracked", "orphaned"],
+                            "options": ["record", "hash", "timestamp", "child_timestamps", "priority", "untracked", "orphaned"],
                             "description": "Specific field to retrieve"
+                        },
+                        "limit": {
+                            "type": "integer",
+                            "required": False,
+                            "description": "With field=child_timestamps, only return the oldest limit children"
                         }
                     },
                     "POST": {
@@ -269,9 +301,10 @@ def register_api_routes(app: Flask, db_instance):
                     },
                     "POST": {
                         "body": {
-                            "type": "object",
+                            "type": "object or array",
                             "required": True,
-                            "description": "Log entry data",
+                            "description": "Log entry data, an array of entries is inserted together "
+                                           "and returns their log_ids in order",
                             "example": {
                                 "site_id": "SITE1",
                                 "log_level": "INFO",
@@ -315,6 +348,13 @@ def register_api_routes(app: Flask, db_instance):
                     }
                 }
             },
+            "/livez": {
+                "methods": ["GET"],
+                "description": "Process liveness probe, answers without querying the database",
+                "responses": {
+                    "200": "API process is running"
+                }
+            },
             "/api/docs": {
                 "methods": ["GET"],
                 "description": "This endpoint - returns API documentation",
@@ -366,6 +406,26 @@ def register_api_routes(app: Flask, db_instance):
                         "501": "Operation not supported",
                         "503": "Pipeline database unavailable"
                     }
+                },
+                "/api/logs/recent": {
+                    "methods": ["GET"],
+                    "description": "Stream logs from the last 30 days as newline delimited JSON (core site only)",
+                    "parameters": {
+                        "log_level": {
+                            "type": "string",
+                            "required": False,
+                            "description": "Only return logs at this level"
+                        },
+                        "site_id": {
+                            "type": "string",
+                            "required": False,
+                            "description": "Only return logs from this site"
+                        }
+                    },
+                    "responses": {
+                        "200": "application/x-ndjson stream, one log record per line",
+                        "500": "Server error"
+                    }
                 }
             })
 
@@ -3,7 +3,7 @@ Core Routes module for REST API package.
 
 This module defines the API routes necessary for core site operations and registers them with the Flask application.
 """
-from flask import jsonify, request, Flask, render_template
+from flask import jsonify, request, Flask, render_template, stream_with_context
 
 from squishy_REST_API import logger, config
 from .utils import create_success_response, create_error_response
@@ -136,6 +136,44 @@ def register_core_routes(app: Flask, db_instance):
 
         return create_error_response("Invalid request method")
 
+    @app.route('/api/logs/recent', methods=['GET'])
+    def stream_recent_logs():
+        """
+        Stream the logs from the last 30 days as newline delimited JSON.
+
+        Rows are sent as they are read from the database, so the response size
+        doesn't bound the worker's memory. The first row is read before the
+        response starts, so a failed query still returns an error status. If the
+        database fails part way through, the last line is an error object.
+        """
+        log_level = request.args.get('log_level') or None
+        site_id = request.args.get('site_id') or None
+        logger.debug(f"GET /api/logs/recent log_level={log_level} site_id={site_id}")
+        try:
+            logs = iter(db_instance.iter_recent_logs(log_level, site_id))
+            first = next(logs, None)
+        except Exception as e:
+            logger.error(f"Error streaming recent logs: {e}")
+            return create_error_response(e)
+
+        def lines():
+            if first is None:
+                return
+            try:
+                yield app.json.dumps(first) + "\n"
+                for log in logs:
+                    yield app.json.dumps(log) + "\n"
+            except Exception as e:
+                logger.error(f"Error streaming recent logs: {e}")
+                yield app.json.dumps({"error": "Database error", "message": f"Log stream ended early: {e}",
+                                      "status": 500}) + "\n"
+            finally:
+                # A client that disconnects closes this generator, release the database cursor now
+                if hasattr(logs, 'close'):
+                    logs.close()
+
+        return app.response_class(stream_with_context(lines()), mimetype='application/x-ndjson')
+
     @app.route('/api/remote_status', methods=['POST'])
     def handle_remote_status():
         """
@@ -4,29 +4,50 @@ Error handlers module for REST API package.
 This module defines the error handlers used across all the routes
 and registers them with the Flask application.
 """
+import logging
+
 from flask import jsonify, request, Flask, render_template
 
 from squishy_REST_API import logger
 from .utils import create_error_response
 
-def register_error_handlers(app: Flask):
-    """Register unified error handlers for both API and GUI routes."""
-
-    @app.errorhandler(404)
-    def handle_404_error(error):
-        logger.info(f"404 error: {error}")
-        if request.path.startswith('/api/'):
-            return create_error_response(message="The requested API resource was not found.",
-                                         status_code=404,
-                                         error_type="Not Found")
-        else:
-            return render_template('error.html', error=f"Path not found: {error}"), 404
+def register_error_handlers(app: Flask, is_core_site=False):
+    """
+    Register unified error handlers for both API and GUI routes.
+
+    Args:
+        app: Flask application instance
+        is_core_site: Core sites also serve the web-gui, so non-API paths get HTML error
+                      pages. Remote sites have no templates and always answer with JSON.
+    """
+
+    def wants_json():
+        return not is_core_site or request.path.startswith('/api/')
+
+    def make_error_handler(status_code, error_type, api_message, page_message, exc_info=False):
+        """Build a handler answering with JSON for API requests and error.html otherwise."""
+        def handle_error(error):
+            logger.log(logging.INFO if status_code < 500 else logging.ERROR,
+                       "%s error: %s", status_code, error, exc_info=exc_info)
+            if wants_json():
+                return create_error_response(message=api_message,
+                                             status_code=status_code,
+                                             error_type=error_type)
+            return render_template('error.html', error=f"{page_message}: {error}"), status_code
+        return handle_error
+
+    app.register_error_handler(404, make_error_handler(
+        404, "Not Found", "The requested API resource was not found.", "Path not found"))
+    app.register_error_handler(500, make_error_handler(
+        500, "Server Error", "Internal server error", "Internal server error"))
+    app.register_error_handler(Exception, make_error_handler(
+        500, "Server Error", "Internal server error", "Internal server error", exc_info=True))
 
     @app.errorhandler(405)
     def handle_method_not_allowed(error):
         logger.warning(f"405 Method Not Allowed: {request.method} {request.path}")
 
-        if request.path.startswith('/api/'):
+        if wants_json():
             return jsonify({
                 "error": "Method Not Allowed",
                 "message": f"Method '{request.method}' not allowed for this endpoint",
@@ -36,22 +57,3 @@ def register_error_handlers(app: Flask):
         else:
             return render_template('error.html',
                                    error=f"Method '{request.method}' not allowed"), 405
-
-    @app.errorhandler(500)
-    def handle_500_error(error):
-        logger.error(f"500 error: {error}")
-        if request.path.startswith('/api/'):
-            return create_error_response(message="Internal server error",
-                                         error_type="Server Error")
-        else:
-            return render_template('error.html', error=f"Internal server error: {error}"), 500
-
-
-    @app.errorhandler(Exception)
-    def handle_exception(error):
-        logger.error(f"Unhandled exception: {error}", exc_info=True)
-        if request.path.startswith('/api/'):
-            return create_error_response(message="Internal server error",
-                                         error_type="Server Error")
-        else:
-            return render_template('error.html', error=f"Internal server error: {error}"), 500
\ No newline at end of file
@@ -3,10 +3,44 @@ Routes module for REST API package.
 
 This module defines the API routes and registers them with the Flask application.
 """
-from flask import jsonify, request, Flask, render_template
+import logging
 from datetime import datetime, timezone
 
-from squishy_REST_API import logger, config
+from flask import jsonify, request, Flask, render_template, stream_template
+
+from squishy_REST_API import logger
+from squishy_REST_API.configuration import VALID_LOG_LEVELS
+from .utils import ViewCache
+
+LOGS_PER_PAGE = 100
+MAX_LOGS_PER_PAGE = 500
+_LIST_KEYS = ('files', 'dirs', 'links')
+# Log level dropdown options, ordered by severity
+_LOG_LEVEL_OPTIONS = tuple(sorted(VALID_LOG_LEVELS, key=logging.getLevelName))
+
+# Bound once so converting each rendered timestamp skips repeated global/attribute lookups
+_fromts = datetime.fromtimestamp
+_UTC = timezone.utc
+
+
+def _parse_log_cursor(before_ts: str | None, before_id: int | None) -> tuple | None:
+    """
+    Build the (timestamp, log_id) keyset cursor for the logs page.
+
+    The timestamp keeps the backend's own type: an epoch integer for MariaDB, a
+    datetime (rendered as ISO text in the Next link) for MySQL.
+
+    Returns:
+        The cursor, or None if either part is missing or the timestamp isn't valid
+    """
+    if not before_ts or before_id is None:
+        return None
+    if before_ts.isdigit():
+        return int(before_ts), before_id
+    try:
+        return datetime.fromisoformat(before_ts), before_id
+    except ValueError:
+        return None
 
 
 def register_gui_routes(app: Flask, db_instance):
@@ -18,9 +52,24 @@ def register_gui_routes(app: Flask, db_instance):
         core_db_instance: The DBConnection instance to use for core site function web requests
         db_instance: The DBConnection instance to use for routine site web requests
     """
+    # Short-lived page cache, cleared by the API routes when hashtable data changes
+    cache = app.extensions.setdefault('gui_cache', ViewCache())
+
+    @app.template_filter('epoch_utc')
+    def epoch_utc(value):
+        """
+        Convert a UNIX epoch to a UTC datetime as the template renders it.
+
+        Backends that store epochs (MariaDB) are converted lazily, only for the cells
+        actually emitted. Datetime values from MySQL pass through unchanged.
+        """
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return _fromts(value, tz=_UTC)
+        return value or None
 
     @app.route('/')
     @app.route('/dashboard')
+    @cache.cached(timeout=30)
     def dashboard():
         """Display the main dashboard with hashtable overview."""
         logger.debug("GET / - Dashboard request")
@@ -28,44 +77,39 @@ def register_gui_routes(app: Flask, db_instance):
         try:
             # Get all dashboard metrics from the database
             dashboard_data = db_instance.get_dashboard_content()
-            logger.debug(dashboard_data)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Dashboard data: %s", dashboard_data)
             return render_template('dashboard.html', dashboard_data=dashboard_data)
 
         except Exception as e:
-            logger.error(f"Error rendering dashboard: {e}")
+            logger.error("Error rendering dashboard: %s", e)
             return render_template('error.html', error="Failed to load dashboard"), 500
 
     @app.route('/web/hashtable/<path:file_path>')
+    @cache.cached(timeout=60)
     def web_hashtable_detail(file_path):
         """Display detailed view of a specific hashtable record."""
-        logger.debug(f"GET /web/hashtable/{file_path} - HTML hashtable detail request")
+        logger.debug("GET /web/hashtable/%s - HTML hashtable detail request", file_path)
         try:
 
             record = db_instance.get_hash_record(f"/{file_path}")
 
             if not record:
-                logger.info(f"Path not found: {file_path}")
+                logger.info("Path not found: %s", file_path)
                 return render_template('error.html', error=f"Path not found: {file_path}"), 404
-            # Reformat data for display
-            # for key in ['current_dtg_latest', 'current_dtg_first', 'prev_dtg_latest']:
-            #     if record.get(key):
-            #         record[key] = datetime.fromtimestamp(record[key], tz=timezone.utc)
-            #     else:
-            #         record[key] = None
-            # logger.debug(f"Reformatted timestamps")
-            # Reformat files dirs and links
-            for key in ['files', 'dirs', 'links']:
+            # Timestamps arrive as datetime objects from the DB, only list fields need defaults
+            for key in _LIST_KEYS:
                 if not record.get(key):
                     record[key] = []
-            logger.debug(f"Reformatted dirs files and links")
             return render_template('hashtable_detail.html',
                                    record=record,
                                    file_path=file_path)
         except Exception as e:
-            logger.error(f"Error rendering hashtable detail: {e}")
+            logger.error("Error rendering hashtable detail: %s", e)
             return render_template('error.html', error="Failed to load record details"), 500
 
     @app.route('/web/liveness')
+    @cache.cached(timeout=15)
     def site_liveness():
         """Display the liveness status of sites in the network."""
         logger.debug("GET / - site_liveness request")
@@ -76,9 +120,12 @@ def register_gui_routes(app: Flask, db_instance):
             return render_template('site_liveness.html', liveness_data=liveness_data)
 
         except Exception as e:
-            logger.error(f"Error rendering site liveness: {e}")
+            logger.error("Error rendering site liveness: %s", e)
             return render_template('error.html', error="Failed to load site liveness"), 500
 
+    # The logs page streams its output, so the query result is cached rather than the page
+    get_logs_page = cache.memoize(timeout=15)(db_instance.get_logs_page)
+
     @app.route('/web/logs')
     def logs():
         """
@@ -87,43 +134,52 @@ def register_gui_routes(app: Flask, db_instance):
         Query parameters:
             log_level: Filter logs by specific log level
             site_id: Filter logs by specific site ID
+            page: Page number to display, starting at 1
+            per_page: Number of log entries per page (max 500)
+            before_ts, before_id: Timestamp and log_id of the last entry on the previous
+                page, set by the Next link so the query seeks rather than skips rows
         """
         # Get filter parameters from query string
         requested_log_level = request.args.get('log_level', '').strip()
         requested_site_id = request.args.get('site_id', '').strip()
-
-        # Get valid options for dropdowns
-        valid_log_levels = config.get('valid_log_levels')
-        valid_site_ids = db_instance.get_pipeline_sites()
+        page = max(request.args.get('page', 1, type=int), 1)
+        per_page = min(max(request.args.get('per_page', LOGS_PER_PAGE, type=int), 1), MAX_LOGS_PER_PAGE)
 
         # Validate and sanitize filters
         log_level_filter = None
-        site_id_filter = None
 
-        if requested_log_level and requested_log_level.upper() in [level.upper() for level in valid_log_levels]:
+        if requested_log_level and requested_log_level.upper() in VALID_LOG_LEVELS:
             log_level_filter = requested_log_level.upper()
 
-        if requested_site_id and requested_site_id in valid_site_ids:
-            site_id_filter = requested_site_id
-
-        # Get filtered logs
-        logs_data = db_instance.get_recent_logs(log_level=log_level_filter, site_id=site_id_filter)
-
-        # Convert UNIX timestamps to datetime objects for template
-        # for log in logs_data:
-        #     if log.get('timestamp'):
-        #         log['formatted_timestamp'] = datetime.fromtimestamp(log['timestamp'], tz=timezone.utc)
-        #     else:
-        #         log['formatted_timestamp'] = None
-
-        return render_template('logs.html',
-                               logs=logs_data,
-                               valid_log_levels=valid_log_levels,
-                               valid_site_ids=valid_site_ids,
-                               current_log_level=log_level_filter,
-                               current_site_id=site_id_filter)
+        # Page from the previous page's last entry when the Next link provided it
+        before = _parse_log_cursor(request.args.get('before_ts'), request.args.get('before_id', type=int))
+        paging = {'before': before} if before else {'offset': (page - 1) * per_page}
+
+        # Site list, site_id validation and filtered logs come back in one DB round-trip.
+        # One extra row is requested to tell whether a next page exists.
+        logs_page = get_logs_page(log_level=log_level_filter,
+                                  site_id=requested_site_id or None,
+                                  limit=per_page + 1,
+                                  **paging)
+        logs_data = logs_page['logs'][:per_page]
+        has_next = len(logs_page['logs']) > per_page
+        valid_site_ids = logs_page['valid_site_ids']
+        site_id_filter = logs_page['site_id']
+
+        # Stream the page so large log tables are sent row by row instead of built in memory
+        return app.response_class(stream_template('logs.html',
+                                                  logs=logs_data,
+                                                  valid_log_levels=_LOG_LEVEL_OPTIONS,
+                                                  valid_site_ids=valid_site_ids,
+                                                  current_log_level=log_level_filter,
+                                                  current_site_id=site_id_filter,
+                                                  page=page,
+                                                  per_page=per_page,
+                                                  has_next=has_next),
+                                  mimetype='text/html')
 
     @app.route('/web/status')
+    @cache.cached(timeout=15)
     def hash_status():
         """Display the hash status of sites in the network."""
         logger.debug("GET / - hash_status request")
@@ -131,15 +187,10 @@ def register_gui_routes(app: Flask, db_instance):
         try:
             # Get all liveness metrics from the database
             hash_sync_data = db_instance.get_site_sync_status()
-            # for row in hash_sync_data:
-            #     if row.get('last_updated'):
-            #         row['last_updated'] = datetime.fromtimestamp(row['last_updated'], tz=timezone.utc)
-            #     else:
-            #         row['last_updated'] = None
             return render_template('hash_status.html', hash_sync_data=hash_sync_data)
 
         except Exception as e:
-            logger.error(f"Error rendering hash_status: {e}")
+            logger.error("Error rendering hash_status: %s", e)
             return render_template('error.html', error="Failed to load hash status"), 500
 
     logger.info("web-gui routes registered")
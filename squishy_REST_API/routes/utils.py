@@ -3,7 +3,12 @@ data validation module for REST API package.
 
 This module defines standard validation methods used across all the routes.
 """
-from flask import jsonify
+import time
+from functools import wraps
+from hashlib import blake2b
+from threading import Lock
+
+from flask import jsonify, request, make_response
 
 from squishy_REST_API import logger
 
@@ -23,4 +28,84 @@ def create_error_response(message, status_code=500, error_type="Error"):
         "error": error_type,
         "message": message,
         "status": status_code
-    }), status_code
\ No newline at end of file
+    }), status_code
+
+
+class ViewCache:
+    """
+    Small in-process TTL cache for rendered web-gui pages.
+
+    Entries are keyed on the request path plus query string, so filtered views
+    are cached independently. Only fully rendered pages (plain strings) are
+    stored; error pages and streamed responses always go to the view.
+
+    Cached pages carry an ETag, so polling browsers that already hold the
+    current page get an empty 304 response instead of the full body.
+
+    Views that stream their output can cache the data they render instead,
+    through memoize().
+    """
+    MAX_ENTRIES = 256  # Upper bound on stored entries, query strings can't grow the cache past it
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = Lock()
+
+    def _store(self, key, entry, now):
+        """
+        Store an entry, keeping the cache at MAX_ENTRIES.
+
+        Expired entries are pruned first; if every entry is still live the oldest
+        stored ones are evicted. Entries are kept in the order they were stored.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+            if len(self._entries) >= self.MAX_ENTRIES:
+                self._entries = {k: v for k, v in self._entries.items() if v[0] > now}
+                for oldest in list(self._entries)[:len(self._entries) - self.MAX_ENTRIES + 1]:
+                    del self._entries[oldest]
+            self._entries[key] = entry
+
+    def cached(self, timeout):
+        """Decorate a view so its rendered output is reused for `timeout` seconds."""
+        def decorator(view):
+            @wraps(view)
+            def wrapper(*args, **kwargs):
+                key = request.full_path
+                now = time.monotonic()
+                entry = self._entries.get(key)
+                if entry and entry[0] > now:
+                    _, body, etag = entry
+                else:
+                    body = view(*args, **kwargs)
+                    if not isinstance(body, str):
+                        return body
+                    etag = blake2b(body.encode(), digest_size=8).hexdigest()
+                    self._store(key, (now + timeout, body, etag), now)
+
+                response = make_response(body)
+                response.set_etag(etag)
+                return response.make_conditional(request)
+            return wrapper
+        return decorator
+
+    def memoize(self, timeout):
+        """Decorate a data function so its result is reused per argument set for `timeout` seconds."""
+        def decorator(func):
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                key = (func, args, tuple(sorted(kwargs.items())))
+                now = time.monotonic()
+                entry = self._entries.get(key)
+                if entry and entry[0] > now:
+                    return entry[1]
+                result = func(*args, **kwargs)
+                self._store(key, (now + timeout, result), now)
+                return result
+            return wrapper
+        return decorator
+
+    def clear(self):
+        """Drop every cached page, used after writes that change displayed data."""
+        with self._lock:
+            self._entries.clear()
@@ -35,22 +35,20 @@ class CoordinatorService:
             return False
 
         # Pull consolidated logs and post them to the core logs
-        log_entries = self.rest_storage.collect_logs_for_shipping()
+        log_entries = self.rest_storage.collect_logs_for_shipping() or []
         log_ids = []
         if config.is_core:
-            log_func = self.rest_storage.put_log
+            log_func = self.rest_storage.put_logs
         else:
-            log_func = self.core_rest_storage.put_log
-        for entry in log_entries if log_entries else []:
-            result = log_func(
-                site_id=config.get('site_name', None),
-                log_level=entry.get('log_level'),
-                timestamp=entry.get('timestamp'),
-                message=entry.get('summary_message'),
-                detailed_message=entry.get('detailed_message')
-            )
-            if result > 0:
-                log_ids.append(entry.get('log_id'))
+            log_func = self.core_rest_storage.put_logs
+        # All entries are posted in one request and are inserted together, or not at all
+        if log_entries and log_func([{'site_id': config.get('site_name', None),
+                                      'log_level': entry.get('log_level'),
+                                      'timestamp': entry.get('timestamp'),
+                                      'message': entry.get('summary_message'),
+                                      'detailed_message': entry.get('detailed_message')}
+                                     for entry in log_entries]):
+            log_ids = [entry.get('log_id') for entry in log_entries]
 
         logger.debug(f"Log entries: {log_ids}")
         if len(log_ids) < len(log_entries):
@@ -30,6 +30,10 @@ class RestClientStorage(RestProcessorInterface):
         """ Not implemented in coordinator """
         pass
 
+    def get_child_timestamps(self, path: str, limit: int | None = None) -> dict | None:
+        """ Not implemented in coordinator """
+        pass
+
     def get_priority_updates(self) -> list | None:
         return self.rest_client.get_priority_updates()
 
@@ -46,6 +50,9 @@ class RestClientStorage(RestProcessorInterface):
                 ) -> int:
         return self.rest_client.put_log(message, site_id, timestamp, detailed_message, log_level, session_id)
 
+    def put_logs(self, entries: list[dict]) -> list | None:
+        return self.rest_client.put_logs(entries)
+
     def find_orphaned_entries(self) -> list | None:
         return self.rest_client.find_orphaned_entries()
 
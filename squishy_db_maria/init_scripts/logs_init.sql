@@ -5,5 +5,7 @@ CREATE TABLE IF NOT EXISTS logs (
     log_level ENUM('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL') DEFAULT ('INFO'), -- Not case sensitive
     timestamp INT UNSIGNED DEFAULT UNIX_TIMESTAMP(),
     summary_message TEXT NOT NULL,
-    detailed_message TEXT
+    detailed_message TEXT,
+    INDEX idx_timestamp (timestamp),
+    INDEX idx_level_site_timestamp (log_level, site_id, timestamp)
 );
\ No newline at end of file
@@ -125,7 +125,7 @@ class Config:
         """
         missing_keys = [
             key for key in self.REQUIRED_KEYS
-            if key not in self._config or self._config[key] is None
+            if self._config.get(key) is None
         ]
 
         if missing_keys:
@@ -33,6 +33,12 @@ def configure_logging(log_level: Optional[str] = None) -> logging.Logger:
         numeric_level = logging.INFO
     logger.setLevel(numeric_level)
 
+    # Handlers are attached once per process; re-running configure_logging only updates the level
+    if logger.handlers:
+        for handler in logger.handlers:
+            handler.setLevel(numeric_level)
+        return logger
+
     # Create console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(numeric_level)
@@ -6,30 +6,57 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 
+def _iter_tests(suite):
+    """Yield the individual test cases in a (nested) test suite."""
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            yield from _iter_tests(test)
+        else:
+            yield test
+
+
+def load_test_suites():
+    """
+    Discover the tests once and split them into unit and integration suites.
+
+    Integration tests live next to the unit tests as test_*_integration.py, so a
+    single discovery pass covers both and no module is imported twice.
+    """
+    loader = unittest.TestLoader()
+    unit_suite, integration_suite = unittest.TestSuite(), unittest.TestSuite()
+    for test in _iter_tests(loader.discover('tests', pattern='test_*.py')):
+        if type(test).__module__.endswith('_integration'):
+            integration_suite.addTest(test)
+        else:
+            unit_suite.addTest(test)
+    return unit_suite, integration_suite
+
+
 def run_unit_tests():
     """Run all unit tests."""
-    loader = unittest.TestLoader()
-    suite = loader.discover('tests', pattern='test_*.py')
+    unit_suite, _ = load_test_suites()
     runner = unittest.TextTestRunner(verbosity=2)
-    return runner.run(suite)
+    return runner.run(unit_suite)
 
 
 def run_integration_tests():
     """Run all integration tests."""
-    loader = unittest.TestLoader()
-    suite = loader.discover('tests/integration', pattern='test_*_integration.py')
+    _, integration_suite = load_test_suites()
     runner = unittest.TextTestRunner(verbosity=2)
-    return runner.run(suite)
+    return runner.run(integration_suite)
 
 
 def run_all_tests():
     """Run both unit and integration tests."""
+    unit_suite, integration_suite = load_test_suites()
+    runner = unittest.TextTestRunner(verbosity=2)
+
     print("Running Unit Tests...")
-    unit_result = run_unit_tests()
+    unit_result = runner.run(unit_suite)
 
     print("\n" + "=" * 50)
     print("Running Integration Tests...")
-    integration_result = run_integration_tests()
+    integration_result = runner.run(integration_suite)
 
     return unit_result.wasSuccessful() and integration_result.wasSuccessful()
 
@@ -37,13 +64,13 @@ def run_all_tests():
 if __name__ == '__main__':
     if len(sys.argv) > 1:
         if sys.argv[1] == 'unit':
-            result = run_unit_tests()
+            success = run_unit_tests().wasSuccessful()
         elif sys.argv[1] == 'integration':
-            result = run_integration_tests()
+            success = run_integration_tests().wasSuccessful()
         else:
             print("Usage: python run_tests.py [unit|integration]")
             sys.exit(1)
     else:
-        result = run_all_tests()
+        success = run_all_tests()
 
-    sys.exit(0 if result.wasSuccessful() else 1)
+    sys.exit(0 if success else 1)
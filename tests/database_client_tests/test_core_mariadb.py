@@ -0,0 +1,47 @@
+import unittest
+from unittest.mock import Mock, patch
+
+try:
+    import mariadb
+    from database_client.core_mariadb import CoreMariaDBConnection
+except ImportError:  # mariadb needs the MariaDB Connector/C libraries
+    mariadb = None
+
+
+@unittest.skipIf(mariadb is None, "mariadb is not installed")
+class TestCoreMariaDBConnectionLogsPage(unittest.TestCase):
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.mock_connection = Mock()
+        self.mock_cursor = Mock()
+        self.mock_connection.cursor.return_value.__enter__ = Mock(return_value=self.mock_cursor)
+        self.mock_connection.cursor.return_value.__exit__ = Mock(return_value=None)
+
+        # CoreMariaDBConnection doesn't implement the MSSQL site sync yet, so it is still abstract
+        abstract_patcher = patch.object(CoreMariaDBConnection, '__abstractmethods__', frozenset())
+        abstract_patcher.start()
+        self.addCleanup(abstract_patcher.stop)
+
+        self.db_conn = CoreMariaDBConnection(host='localhost', database='test_db', user='test_user',
+                                             password='test_pass',
+                                             connection_factory=Mock(return_value=self.mock_connection))
+
+    def test_get_logs_page_epoch_cursor(self):
+        """Test an epoch (timestamp, log_id) cursor seeks past the previous page instead of skipping rows."""
+        self.mock_cursor.fetchall.side_effect = [
+            [('SITE1',)],
+            [(8, 'SITE1', 's1', 'INFO', 1704110400, 'entry', None)],
+        ]
+
+        page = self.db_conn.get_logs_page(limit=3, before=(1704112200, 9))
+
+        self.assertEqual(page['logs'][0]['timestamp'], 1704110400)
+        sql, params = self.mock_cursor.execute.call_args[0]
+        self.assertIn("AND (timestamp < ? OR (timestamp = ? AND log_id < ?))", sql)
+        self.assertIn("ORDER BY timestamp DESC, log_id DESC", sql)
+        self.assertEqual(params[1:], [1704112200, 1704112200, 9, 3, 0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+from unittest.mock import Mock, patch
+from mysql.connector import Error, MySQLConnection, pooling
+from mysql.connector.cursor import MySQLCursorDict
+
+from database_client.core_mysql import CoreMYSQLConnection
+
+
+class TestCoreMYSQLConnectionLogStream(unittest.TestCase):
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.mock_connection = Mock()
+        self.mock_cursor = Mock()
+        self.mock_connection.cursor.return_value.__enter__ = Mock(return_value=self.mock_cursor)
+        self.mock_connection.cursor.return_value.__exit__ = Mock(return_value=None)
+
+        self.db_conn = CoreMYSQLConnection(host='localhost', database='test_db', user='test_user',
+                                           password='test_pass',
+                                           connection_factory=Mock(return_value=self.mock_connection))
+        self.db_conn._LOG_STREAM_BATCH_SIZE = 2
+
+    def test_iter_recent_logs_reads_in_batches(self):
+        """Test rows are yielded across fetchmany batches until one comes back empty."""
+        self.mock_cursor.fetchmany.side_effect = [[{'log_id': 1}, {'log_id': 2}], [{'log_id': 3}], []]
+
+        logs = list(self.db_conn.iter_recent_logs())
+
+        self.assertEqual([log['log_id'] for log in logs], [1, 2, 3])
+        self.mock_cursor.fetchmany.assert_called_with(2)
+        self.mock_connection.shutdown.assert_not_called()
+
+    def test_iter_recent_logs_error_raised(self):
+        """Test a database error part way through the stream reaches the caller."""
+        self.mock_cursor.fetchmany.side_effect = [[{'log_id': 1}], Error("Lost connection")]
+
+        logs = self.db_conn.iter_recent_logs()
+
+        self.assertEqual(next(logs), {'log_id': 1})
+        with self.assertRaises(Error):
+            next(logs)
+
+    def test_iter_recent_logs_close_on_pooled_connection(self):
+        """Test closing the stream early through a real pool wrapper drops the session without raising."""
+        cnx = MySQLConnection()  # Never connected, the cursor's reads are patched below
+        pooled = pooling.PooledMySQLConnection(pooling.MySQLConnectionPool(pool_name='test_stream', pool_size=1), cnx)
+        cursor = MySQLCursorDict(cnx)
+
+        def execute(query, params):
+            cnx.unread_result = True  # As an unbuffered SELECT leaves it
+
+        self.db_conn.connection_factory = Mock(return_value=pooled)
+        with patch.object(cnx, 'cursor', return_value=cursor), \
+                patch.object(cnx, 'shutdown') as mock_shutdown, \
+                patch.object(cursor, 'execute', side_effect=execute), \
+                patch.object(cursor, 'fetchmany', return_value=[{'log_id': 1}, {'log_id': 2}]):
+            logs = self.db_conn.iter_recent_logs()
+            self.assertEqual(next(logs), {'log_id': 1})
+            logs.close()
+
+        mock_shutdown.assert_called_once()
+        self.assertFalse(cnx.unread_result)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -190,6 +190,16 @@ class TestDBInstance(unittest.TestCase):
 
         self.assertIn("CoreDBConnection implementation not provided", str(context.exception))
 
+    def test_get_logs_page_success(self):
+        """Test get_logs_page passes filters through to the core db."""
+        expected_page = {'valid_site_ids': ['SITE1'], 'site_id': 'SITE1', 'logs': []}
+        self.mock_core_db.get_logs_page.return_value = expected_page
+
+        result = self.db_instance.get_logs_page('ERROR', 'SITE1')
+
+        self.mock_core_db.get_logs_page.assert_called_once_with('ERROR', 'SITE1', None, 0, None)
+        self.assertEqual(result, expected_page)
+
     def test_get_recent_logs_success(self):
         """Test get_recent_logs with successful core db call."""
         expected_logs = [{'log_id': 1, 'message': 'test'}]
@@ -238,6 +248,21 @@ class TestDBInstance(unittest.TestCase):
 
         self.assertIn("PipelineDBConnection implementation not provided", str(context.exception))
 
+    def test_get_pipeline_updates_page_success(self):
+        """Test get_pipeline_updates_page passes the cursor through to the pipeline db."""
+        expected = ([{'id': 3, 'timestamp': 100}], None)
+        self.mock_pipeline_db.get_pipeline_updates_page.return_value = expected
+
+        result = self.db_instance.get_pipeline_updates_page((100, 2), 50)
+
+        self.mock_pipeline_db.get_pipeline_updates_page.assert_called_once_with((100, 2), 50)
+        self.assertEqual(result, expected)
+
+    def test_get_pipeline_updates_page_no_pipeline_db(self):
+        """Test get_pipeline_updates_page when no pipeline db is configured."""
+        with self.assertRaises(NotImplementedError):
+            DBInstance().get_pipeline_updates_page()
+
     def test_put_pipeline_hash_success(self):
         """Test put_pipeline_hash with successful pipeline db call."""
         self.mock_pipeline_db.put_pipeline_hash.return_value = True
@@ -247,6 +272,21 @@ class TestDBInstance(unittest.TestCase):
         self.mock_pipeline_db.put_pipeline_hash.assert_called_once_with('/test', 'abc123')
         self.assertTrue(result)
 
+    def test_get_updates_by_paths_success(self):
+        """Test get_updates_by_paths with successful pipeline db call."""
+        expected = {'/test': {'update_path': '/test', 'hash_value': None}}
+        self.mock_pipeline_db.get_updates_by_paths.return_value = expected
+
+        result = self.db_instance.get_updates_by_paths(['/test', '/missing'])
+
+        self.mock_pipeline_db.get_updates_by_paths.assert_called_once_with(['/test', '/missing'])
+        self.assertEqual(result, expected)
+
+    def test_get_updates_by_paths_no_pipeline_db(self):
+        """Test get_updates_by_paths when no pipeline db is configured."""
+        with self.assertRaises(NotImplementedError):
+            DBInstance().get_updates_by_paths(['/test'])
+
     def test_get_official_sites_success(self):
         """Test get_official_sites with successful pipeline db call."""
         expected_sites = ['site1', 'site2', 'site3']
@@ -0,0 +1,247 @@
+import unittest
+from unittest.mock import Mock, patch
+
+try:
+    import pyodbc
+    from database_client.pipeline_mssql import PipelineMSSQLConnection
+except ImportError:  # pyodbc needs the system ODBC libraries
+    pyodbc = None
+
+
+@unittest.skipIf(pyodbc is None, "pyodbc is not installed")
+class TestPipelineMSSQLConnectionPool(unittest.TestCase):
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.opened = []
+        connect_patcher = patch('database_client.pipeline_mssql.pyodbc.connect', side_effect=self._connect)
+        self.mock_connect = connect_patcher.start()
+        self.addCleanup(connect_patcher.stop)
+
+        self.db_conn = PipelineMSSQLConnection(server='localhost', database='test_db',
+                                               username='test_user', password='test_pass', pool_size=2)
+
+    def _connect(self, connection_string):
+        connection = Mock()
+        self.opened.append(connection)
+        return connection
+
+    def _use(self, error=None):
+        """Check a connection out and back in, raising error inside the block if given."""
+        with self.db_conn._get_connection() as conn:
+            if error:
+                raise error
+            return conn
+
+    def test_connection_reused(self):
+        """Test a connection returned to the pool is rolled back and handed out again."""
+        first = self._use()
+        second = self._use()
+
+        self.assertIs(first, second)
+        self.assertEqual(self.mock_connect.call_count, 1)
+        self.assertEqual(first.rollback.call_count, 2)
+        first.close.assert_not_called()
+
+    def test_database_error_discards_connection_and_idle_pool(self):
+        """Test a database error closes the failing connection and the idle ones opened before it."""
+        with self.db_conn._get_connection() as busy:
+            idle = self._use()  # Opened while busy is checked out, so it is pooled separately
+        self.assertIsNot(busy, idle)
+
+        with self.assertRaises(pyodbc.Error):
+            self._use(pyodbc.Error("connection reset"))
+
+        busy.close.assert_called_once()
+        idle.close.assert_called_once()
+        self.assertNotIn(self._use(), (busy, idle))
+
+    def test_non_database_error_keeps_connection(self):
+        """Test an error raised by the caller's own code returns the connection to the pool."""
+        with self.assertRaises(ValueError):
+            self._use(ValueError("bad input"))
+
+        self.opened[0].close.assert_not_called()
+        self.assertIs(self._use(), self.opened[0])
+
+    def test_full_pool_closes_extra_connection(self):
+        """Test connections beyond pool_size are closed on check in."""
+        with self.db_conn._get_connection():
+            with self.db_conn._get_connection():
+                with self.db_conn._get_connection():
+                    pass
+
+        self.assertEqual(len(self.opened), 3)
+        self.assertEqual(sum(c.close.called for c in self.opened), 1)
+
+    def test_pool_size_zero_disables_pooling(self):
+        """Test pool_size=0 opens and closes a connection per call."""
+        self.db_conn = PipelineMSSQLConnection(pool_size=0)
+
+        first = self._use()
+        second = self._use()
+
+        self.assertIsNot(first, second)
+        first.close.assert_called_once()
+        second.close.assert_called_once()
+
+    def test_pool_rebuilt_after_fork(self):
+        """Test a forked worker doesn't reuse connections pooled by its parent process."""
+        parent = self._use()
+
+        with patch('database_client.pipeline_mssql.os.getpid', return_value=-1):
+            child = self._use()
+
+        self.assertIsNot(parent, child)
+
+    def test_idle_connection_validated_on_checkout(self):
+        """Test a connection idle past validate_idle_after is probed, and replaced if the server dropped it."""
+        stale = self._use()
+        stale.cursor.return_value.execute.side_effect = pyodbc.Error("server restarted")
+        self.db_conn.validate_idle_after = 0
+
+        fresh = self._use()
+
+        stale.close.assert_called_once()
+        self.assertIsNot(fresh, stale)
+
+    def test_recent_connection_not_validated(self):
+        """Test a connection returned moments ago is handed out without a probe query."""
+        connection = self._use()
+        self._use()
+
+        connection.cursor.assert_not_called()
+
+    def test_health_check_probes_after_database_error(self):
+        """Test a database error stops a recent success from standing in for the health probe."""
+        self._use()
+        self.assertEqual(self.db_conn.pipeline_health_check(), {'pipeline_db': True})
+
+        with self.assertRaises(pyodbc.Error):
+            self._use(pyodbc.Error("connection reset"))
+        self.mock_connect.side_effect = pyodbc.Error("server down")
+
+        self.assertEqual(self.db_conn.pipeline_health_check(), {'pipeline_db': False})
+
+
+@unittest.skipIf(pyodbc is None, "pyodbc is not installed")
+class TestPipelineMSSQLConnection(unittest.TestCase):
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.mock_connection = Mock()
+        self.mock_cursor = Mock()
+        self.mock_connection.cursor.return_value = self.mock_cursor
+        connect_patcher = patch('database_client.pipeline_mssql.pyodbc.connect', return_value=self.mock_connection)
+        connect_patcher.start()
+        self.addCleanup(connect_patcher.stop)
+
+        self.db_conn = PipelineMSSQLConnection(server='localhost', database='test_db', pool_size=1)
+
+    def test_put_pipeline_hash_many_batches(self):
+        """Test pairs are sent as one UPDATE per batch and committed once."""
+        self.db_conn._HASH_BATCH_SIZE = 2
+        self.mock_cursor.fetchall.side_effect = [[('/a',), ('/b',)], [('/c',)]]
+
+        result = self.db_conn.put_pipeline_hash_many([('/a', 'h1'), ('/b', 'h2'), ('/c', 'h3')])
+
+        self.assertEqual(result, {'/a': True, '/b': True, '/c': True})
+        self.assertEqual(self.mock_cursor.execute.call_count, 2)
+        first_sql, first_params = self.mock_cursor.execute.call_args_list[0][0]
+        self.assertIn("JOIN (VALUES (?, ?), (?, ?)) AS v(update_path, hash_value)", first_sql)
+        self.assertIn("OUTPUT v.update_path", first_sql)
+        self.assertEqual(first_params, ['/a', 'h1', '/b', 'h2'])
+        self.assertEqual(self.mock_cursor.execute.call_args_list[1][0][1], ['/c', 'h3'])
+        self.mock_connection.commit.assert_called_once()
+
+    def test_put_pipeline_hash_many_maps_output_to_input_paths(self):
+        """Test only the OUTPUT rows are marked updated, keyed on the caller's stripped paths."""
+        self.mock_cursor.fetchall.return_value = [('/Updates/A',)]
+
+        result = self.db_conn.put_pipeline_hash_many([(' /Updates/A ', 'h1'), ('/updates/b', 'h2')])
+
+        self.assertEqual(result, {'/Updates/A': True, '/updates/b': False})
+
+    def test_put_pipeline_hash_many_error(self):
+        """Test a database error reports every path as not updated."""
+        self.mock_cursor.execute.side_effect = pyodbc.Error("deadlock")
+
+        result = self.db_conn.put_pipeline_hash_many([('/a', 'h1'), ('/b', 'h2')])
+
+        self.assertEqual(result, {'/a': False, '/b': False})
+        self.mock_connection.commit.assert_not_called()
+
+    def test_get_updates_by_paths_batches(self):
+        """Test paths are looked up with one VALUES join per batch, keyed by path."""
+        self.db_conn._PATH_BATCH_SIZE = 2
+        self.mock_cursor.fetchmany.side_effect = [
+            [('/a', 1, 'TC1', 100, '/a', 10, None)], [],
+            [('/c', 3, 'TC3', 300, '/c', 30, 'h3')], [],
+        ]
+
+        result = self.db_conn.get_updates_by_paths([' /a', '/b', '/a', '/c'])
+
+        self.assertEqual(set(result), {'/a', '/c'})
+        self.assertEqual(result['/c'], {'id': 3, 'TC_id': 'TC3', 'timestamp': 300, 'update_path': '/c',
+                                        'update_size': 30, 'hash_value': 'h3'})
+        calls = self.mock_cursor.execute.call_args_list
+        self.assertEqual(len(calls), 2)
+        self.assertIn("FROM (VALUES (?), (?)) AS v(update_path)", calls[0][0][0])
+        self.assertEqual(calls[0][0][1], ['/a', '/b'])
+        self.assertEqual(calls[1][0][1], ['/c'])
+
+    def test_get_updates_by_paths_keyed_on_input_paths(self):
+        """Test a record the collation matched despite differing case is keyed on the caller's path."""
+        self.mock_cursor.fetchmany.side_effect = [[('/updates/a', 1, 'TC1', 100, '/Updates/A', 10, None)], []]
+
+        result = self.db_conn.get_updates_by_paths(['/updates/a '])
+
+        self.assertEqual(list(result), ['/updates/a'])
+        self.assertEqual(result['/updates/a']['update_path'], '/Updates/A')
+
+    def test_get_updates_by_paths_rejects_blank_path(self):
+        """Test a whitespace-only path is rejected rather than searched for as an empty string."""
+        with self.assertRaises(ValueError):
+            self.db_conn.get_updates_by_paths(['/a', '  '])
+
+        self.mock_cursor.execute.assert_not_called()
+
+    def test_get_updates_by_paths_default_batch_size(self):
+        """Test the default batch stays under SQL Server's 2100 parameter cap."""
+        self.mock_cursor.fetchmany.return_value = []
+
+        self.db_conn.get_updates_by_paths([f'/p{i}' for i in range(4500)])
+
+        self.assertEqual([len(c[0][1]) for c in self.mock_cursor.execute.call_args_list], [2000, 2000, 500])
+
+    def test_get_pipeline_updates_page_cursor_round_trip(self):
+        """Test a full page returns a (timestamp, id) cursor that seeks past it, a short page returns None."""
+        self.mock_cursor.fetchmany.side_effect = [
+            [(1, 'TC1', 100, '/a', 10, None), (2, 'TC2', 100, '/b', 20, None)], [],
+            [(3, 'TC3', 100, '/c', 30, None)], [],
+        ]
+
+        page, cursor = self.db_conn.get_pipeline_updates_page(batch_size=2)
+
+        self.assertEqual([u['id'] for u in page], [1, 2])
+        self.assertEqual(cursor, (100, 2))
+        sql, params = self.mock_cursor.execute.call_args[0]
+        self.assertTrue(sql.startswith("SELECT TOP (?)"))
+        self.assertEqual(params, [2])
+
+        page, cursor = self.db_conn.get_pipeline_updates_page(cursor, batch_size=2)
+
+        self.assertEqual([u['id'] for u in page], [3])
+        self.assertIsNone(cursor)
+        sql, params = self.mock_cursor.execute.call_args[0]
+        self.assertIn("AND (timestamp > ? OR (timestamp = ? AND id > ?)) ORDER BY timestamp ASC, id ASC", sql)
+        self.assertEqual(params, [2, 100, 100, 2])
+
+    def test_get_pipeline_updates_page_invalid_batch_size(self):
+        """Test a non-positive batch size is rejected."""
+        with self.assertRaises(ValueError):
+            self.db_conn.get_pipeline_updates_page(batch_size=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -89,6 +89,37 @@ class TestRemoteMYSQLConnection(unittest.TestCase):
         self.mock_connection_factory.assert_called_once_with(**self.db_config)
         self.mock_connection.close.assert_called_once()
 
+    def test_get_connection_closes_without_ping(self):
+        """Test the connection is closed without an is_connected() round trip, close errors are ignored."""
+        self.mock_connection.close.side_effect = Error("Connection already closed")
+
+        with self.db_conn._get_connection():
+            pass
+
+        self.mock_connection.is_connected.assert_not_called()
+        self.mock_connection.close.assert_called_once()
+
+    @patch('database_client.mysql_base.pooling.MySQLConnectionPool')
+    def test_get_connection_uses_pool(self, mock_pool_class):
+        """Test connections come from one pool created on first use."""
+        db_conn = RemoteMYSQLConnection(
+            host='localhost',
+            database='test_db',
+            user='test_user',
+            password='test_pass',
+            pool_size=3
+        )
+        mock_pool_class.return_value.get_connection.return_value = self.mock_connection
+
+        with db_conn._get_connection() as conn:
+            self.assertEqual(conn, self.mock_connection)
+        with db_conn._get_connection():
+            pass
+
+        mock_pool_class.assert_called_once()
+        self.assertEqual(mock_pool_class.call_args.kwargs['pool_size'], 3)
+        self.assertEqual(mock_pool_class.return_value.get_connection.call_count, 2)
+
     def test_get_connection_error(self):
         """Test database connection error."""
         self.mock_connection_factory.side_effect = Error("Connection failed")
@@ -102,17 +133,24 @@ class TestRemoteMYSQLConnection(unittest.TestCase):
         expected_result = {
             'path': '/test/path',
             'current_hash': 'abc123',
+            'current_dtg_latest': None,
+            'current_dtg_first': None,
+            'target_hash': None,
+            'prev_hash': None,
+            'prev_dtg_latest': None,
             'dirs': ['dir1', 'dir2'],
             'files': ['file1.txt'],
             'links': []
         }
 
-        self.mock_cursor.fetchone.return_value = expected_result
+        self.mock_cursor.fetchone.return_value = ('/test/path', 'abc123', None, None, None, None, None,
+                                                  '["dir1", "dir2"]', '["file1.txt"]', '[]')
 
         result = self.db_conn.get_hash_record('/test/path')
 
         self.mock_cursor.execute.assert_called_once_with(
-            "SELECT * FROM hashtable WHERE path = %s", ('/test/path',)
+            "SELECT path, current_hash, current_dtg_latest, current_dtg_first, target_hash, prev_hash, "
+            "prev_dtg_latest, dirs, files, links FROM hashtable WHERE hashed_path = SHA2(%s, 256)", ('/test/path',)
         )
         self.assertEqual(result, expected_result)
 
@@ -155,15 +193,69 @@ class TestRemoteMYSQLConnection(unittest.TestCase):
         self.mock_cursor.fetchone.return_value = None
         self.mock_cursor.rowcount = 1
 
-        # Mock put_log method
-        with patch.object(self.db_conn, 'put_log') as mock_put_log:
-            mock_put_log.return_value = 1
+        result = self.db_conn.insert_or_update_hash(record)
 
-            result = self.db_conn.insert_or_update_hash(record)
+        self.assertTrue(result)
+        self.assertEqual(self.mock_cursor.execute.call_count, 3)  # SELECT + INSERT + change log
+        self.assertIn("INSERT INTO logs", self.mock_cursor.execute.call_args_list[2][0][0])
+        self.assertEqual(json.loads(self.mock_cursor.execute.call_args_list[2][0][1]['detailed_message']),
+                         {'modified': [], 'created': ['/new/path'], 'deleted': []})
+
+    def test_insert_or_update_hash_single_connection(self):
+        """Test the record is read, written, its removed children deleted and the changes logged in one transaction."""
+        record = {'path': '/existing/path', 'current_hash': 'xyz789', 'dirs': [], 'files': [], 'links': []}
+
+        self.mock_cursor.fetchone.return_value = ('abc123', json.dumps(['old']), None, None, None)
+        self.mock_cursor.fetchall.side_effect = [[('/existing/path/old', None, None, None)]]
+        self.mock_cursor.rowcount = 1
+
+        result = self.db_conn.insert_or_update_hash(record)
 
         self.assertTrue(result)
-        self.assertEqual(self.mock_cursor.execute.call_count, 2)  # SELECT + INSERT
-        mock_put_log.assert_called_once()
+        self.mock_connection_factory.assert_called_once()
+        self.mock_connection.start_transaction.assert_called_once()
+        self.mock_connection.commit.assert_called_once()
+        statements = [c[0][0] for c in self.mock_cursor.execute.call_args_list]
+        self.assertIn("FOR UPDATE", statements[0])
+        self.assertIn("DELETE FROM hashtable", statements[3])
+        self.assertIn("INSERT INTO logs", statements[4])
+
+    def test_insert_or_update_hash_rolls_back_on_error(self):
+        """Test a failure part way through the write rolls the whole transaction back."""
+        record = {'path': '/existing/path', 'current_hash': 'xyz789', 'dirs': [], 'files': [], 'links': []}
+
+        self.mock_cursor.fetchone.return_value = ('abc123', json.dumps(['old']), None, None, None)
+        self.mock_cursor.fetchall.side_effect = Error("Lock wait timeout exceeded")
+        self.mock_cursor.rowcount = 1
+
+        result = self.db_conn.insert_or_update_hash(record)
+
+        self.assertFalse(result)
+        self.mock_connection.rollback.assert_called_once()
+        self.mock_connection.commit.assert_not_called()
+
+    def test_insert_or_update_hash_retries_deadlock(self):
+        """Test a transaction chosen as a deadlock victim is run again instead of losing the write."""
+        record = {'path': '/new/path', 'current_hash': 'abc123'}
+        deadlock = Error(msg="Deadlock found when trying to get lock", errno=1213)
+        self.mock_cursor.execute.side_effect = [None, deadlock, None, None, None]
+        self.mock_cursor.fetchone.return_value = None
+        self.mock_cursor.rowcount = 1
+
+        self.assertTrue(self.db_conn.insert_or_update_hash(record))
+
+        self.assertEqual(self.mock_connection.start_transaction.call_count, 2)
+        self.mock_connection.rollback.assert_called_once()
+        self.mock_connection.commit.assert_called_once()
+
+    def test_insert_or_update_hash_gives_up_after_repeated_deadlocks(self):
+        """Test the write fails once every attempt has deadlocked."""
+        self.mock_cursor.execute.side_effect = Error(msg="Deadlock found when trying to get lock", errno=1213)
+
+        self.assertFalse(self.db_conn.insert_or_update_hash({'path': '/new/path', 'current_hash': 'abc123'}))
+
+        self.assertEqual(self.mock_connection.start_transaction.call_count, self.db_conn._DEADLOCK_ATTEMPTS)
+        self.mock_connection.commit.assert_not_called()
 
     def test_insert_or_update_hash_existing_record_unchanged(self):
         """Test updating existing hash record with unchanged hash."""
@@ -223,6 +315,38 @@ class TestRemoteMYSQLConnection(unittest.TestCase):
         self.assertIn("prev_hash", calls[1][0][0])
         self.assertIn("current_hash", calls[1][0][0])
 
+    def test_insert_or_update_hash_deletes_removed_children(self):
+        """Test children missing from the update are deleted per field, a name moving between fields included."""
+        record = {'path': '/existing/path', 'current_hash': 'xyz789',
+                  'dirs': ['dir1'], 'files': ['file1.txt', 'moved'], 'links': []}
+
+        self.mock_cursor.fetchone.return_value = (
+            'abc123', json.dumps(['dir1', 'dir2', 'moved']), json.dumps(['link1']), json.dumps(['file1.txt']), None
+        )
+        self.mock_cursor.rowcount = 1
+
+        with patch.object(self.db_conn, '_recursive_delete_hash', return_value=set()) as mock_delete:
+            self.assertTrue(self.db_conn.insert_or_update_hash(record))
+
+        mock_delete.assert_called_once_with(
+            self.mock_cursor, {'/existing/path/dir2', '/existing/path/moved', '/existing/path/link1'})
+
+    def test_recursive_delete_hash_batches_each_level(self):
+        """Test removed paths and their children are deleted with one IN (...) statement per tree level."""
+        self.mock_cursor.fetchall.side_effect = [
+            [('/root/a', json.dumps(['sub']), None, json.dumps(['f1'])),
+             ('/root/b', None, None, None)],
+            [('/root/a/sub', None, None, None)],
+        ]
+
+        deleted = self.db_conn._recursive_delete_hash(self.mock_cursor, {'/root/a', '/root/b', '/root/missing'})
+
+        self.assertEqual(deleted, {'/root/a', '/root/b', '/root/a/sub'})
+        statements = [c[0][0] for c in self.mock_cursor.execute.call_args_list]
+        self.assertEqual(len(statements), 4)  # SELECT + DELETE for each of the two levels
+        self.assertIn("DELETE FROM hashtable WHERE hashed_path IN (SHA2(%s, 256), SHA2(%s, 256))", statements[1])
+        self.assertEqual(self.mock_cursor.execute.call_args_list[2][0][1], ['/root/a/sub', '/root/a/f1'])
+
     def test_insert_or_update_hash_missing_required_fields(self):
         """Test insert_or_update_hash with missing required fields."""
         record = {'path': '/test/path'}  # Missing current_hash
@@ -245,6 +369,29 @@ class TestRemoteMYSQLConnection(unittest.TestCase):
 
         self.assertIn("must be lists", str(context.exception))
 
+    def test_get_timestamps_single_query(self):
+        """Test timestamps for several paths are fetched with one IN (...) query."""
+        self.mock_cursor.fetchall.return_value = [('/a', 100), ('/b', 200)]
+
+        result = self.db_conn.get_timestamps(['/a', '/b', '/missing'])
+
+        self.assertEqual(result, {'/a': 100, '/b': 200})
+        self.mock_cursor.execute.assert_called_once()
+        query, params = self.mock_cursor.execute.call_args[0]
+        self.assertIn("WHERE hashed_path IN (SHA2(%s, 256), SHA2(%s, 256), SHA2(%s, 256))", query)
+        self.assertEqual(params, ['/a', '/b', '/missing'])
+
+    def test_get_timestamps_limit_sorted_in_query(self):
+        """Test a limit orders and cuts the timestamps in the query."""
+        self.mock_cursor.fetchall.return_value = [('/b', 100)]
+
+        result = self.db_conn.get_timestamps(['/a', '/b', '/c'], limit=1)
+
+        self.assertEqual(result, {'/b': 100})
+        query, params = self.mock_cursor.execute.call_args[0]
+        self.assertIn("ORDER BY current_dtg_latest, path LIMIT %s", query)
+        self.assertEqual(params, ['/a', '/b', '/c', 1])
+
     def test_get_single_field_success(self):
         """Test successful single field retrieval."""
         self.mock_cursor.fetchone.return_value = ('abc123',)
@@ -252,10 +399,21 @@ class TestRemoteMYSQLConnection(unittest.TestCase):
         result = self.db_conn.get_single_field('/test/path', 'current_hash')
 
         self.mock_cursor.execute.assert_called_once_with(
-            "SELECT current_hash FROM hashtable WHERE path = %s", ('/test/path',)
+            "SELECT current_hash FROM hashtable WHERE hashed_path = SHA2(%s, 256)", ('/test/path',)
         )
         self.assertEqual(result, 'abc123')
 
+    def test_get_single_field_reads_back_a_write(self):
+        """Test a read right after insert_or_update_hash returns the new value, not an earlier read."""
+        self.mock_cursor.fetchone.side_effect = [('abc123',), None, ('xyz789',)]
+        self.mock_cursor.rowcount = 1
+
+        self.assertEqual(self.db_conn.get_single_field('/test/path', 'current_hash'), 'abc123')
+        self.assertTrue(self.db_conn.insert_or_update_hash({'path': '/test/path', 'current_hash': 'xyz789'}))
+        self.assertEqual(self.db_conn.get_single_field('/test/path', 'current_hash'), 'xyz789')
+        reads = [c for c in self.mock_cursor.execute.call_args_list if c[0][0].startswith("SELECT current_hash ")]
+        self.assertEqual(len(reads), 2)  # Every read goes to the database, another worker may have written
+
     def test_get_single_field_not_found(self):
         """Test single field not found."""
         self.mock_cursor.fetchone.return_value = None
@@ -281,15 +439,16 @@ class TestRemoteMYSQLConnection(unittest.TestCase):
 
     def test_get_priority_updates_success(self):
         """Test successful priority updates retrieval."""
-        mock_paths = [('/path1',), ('/path2',), ('/path1/subpath',)]
+        # Parents with changed descendants are filtered out by the query itself
+        mock_paths = [('/path2',), ('/path1/subpath',)]
         self.mock_cursor.fetchall.return_value = mock_paths
 
         result = self.db_conn.get_priority_updates()
 
-        # Should return deepest paths only
-        self.assertIn('/path2', result)
-        self.assertIn('/path1/subpath', result)
-        self.assertNotIn('/path1', result)  # Should be excluded as it has descendants
+        # Should return deepest paths only, deepest first
+        self.assertEqual(result, ['/path1/subpath', '/path2'])
+        query = self.mock_cursor.execute.call_args[0][0]
+        self.assertIn("NOT EXISTS", query)
 
     def test_get_priority_updates_empty(self):
         """Test priority updates with no results."""
@@ -320,6 +479,20 @@ class TestRemoteMYSQLConnection(unittest.TestCase):
         self.assertEqual(result, 456)
         self.mock_cursor.execute.assert_called_once()
 
+    def test_put_logs_multi_row_insert(self):
+        """Test several log entries are inserted with one multi-row statement in a transaction."""
+        self.mock_cursor.lastrowid = 10
+
+        result = self.db_conn.put_logs([{'summary_message': 'first', 'site_id': 'SITE1'},
+                                        {'message': 'second', 'log_level': 'ERROR'}])
+
+        self.assertEqual(result, [10, 11])
+        self.mock_cursor.execute.assert_called_once()
+        query, params = self.mock_cursor.execute.call_args[0]
+        self.assertIn("VALUES (%s, %s, %s, %s, %s), (%s, %s, %s, %s, %s)", query)
+        self.assertEqual(params, ['SITE1', 'INFO', None, 'first', None, 'local', 'ERROR', None, 'second', None])
+        self.mock_connection.commit.assert_called_once()
+
     def test_put_log_missing_required_field(self):
         """Test put_log with missing required field."""
         log_entry = {}  # Missing summary_message
@@ -365,6 +538,19 @@ class TestRemoteMYSQLConnection(unittest.TestCase):
 
         self.assertEqual(result, {'local_db': False})
 
+    def test_health_check_reuses_recent_result(self):
+        """Test health check results are reused within the TTL."""
+        self.mock_cursor.fetchall.return_value = [(1,)]
+
+        self.assertEqual(self.db_conn.health_check(), {'local_db': True})
+        self.assertEqual(self.db_conn.health_check(), {'local_db': True})
+        self.mock_cursor.execute.assert_called_once_with("SELECT 1;")
+
+        # Once the TTL has passed the database is queried again
+        self.db_conn._health_result = (self.db_conn._health_result[0] - 2, True)
+        self.db_conn.health_check()
+        self.assertEqual(self.mock_cursor.execute.call_count, 2)
+
     def test_delete_log_entries_success(self):
         """Test successful log entry deletion."""
         log_ids = [1, 2, 3]
@@ -269,6 +269,32 @@ class TestRestProcessor(unittest.TestCase):
             json_data=expected_data
         )
 
+    def test_put_logs_single_request(self):
+        """Test put_logs sends every entry in one request"""
+        # Arrange
+        self.mock_http_client.post.return_value = (200, [1, 2])
+
+        # Act
+        result = self.rest_processor.put_logs([{'message': 'first'},
+                                               {'message': 'second', 'site_id': 'site123', 'log_level': 'error'}])
+
+        # Assert
+        self.assertEqual(result, [1, 2])
+        self.mock_http_client.post.assert_called_once_with(
+            "http://test-api:8080/api/logs",
+            json_data=[{'summary_message': 'first', 'log_level': 'INFO'},
+                       {'summary_message': 'second', 'log_level': 'ERROR', 'site_id': 'site123'}]
+        )
+
+    def test_put_logs_invalid_entry(self):
+        """Test put_logs sends nothing when an entry has no message"""
+        # Act
+        result = self.rest_processor.put_logs([{'message': 'first'}, {'message': ''}])
+
+        # Assert
+        self.assertIsNone(result)
+        self.mock_http_client.post.assert_not_called()
+
     def test_put_log_invalid_empty_message(self):
         """Test put_log with empty message"""
         # Act
@@ -344,11 +370,9 @@ class TestRestProcessor(unittest.TestCase):
         self.assertFalse(success)
         self.assertEqual(data, [])
 
-    @patch('rest_client.rest_processor.time')
-    def test_get_oldest_updates_empty_database(self, mock_time):
+    def test_get_oldest_updates_empty_database(self):
         """Test get_oldest_updates when database is empty"""
         # Arrange
-        mock_time.return_value = 1234567890
         self.mock_http_client.get.return_value = (200, {"data": None})
 
         # Act
@@ -357,11 +381,9 @@ class TestRestProcessor(unittest.TestCase):
         # Assert
         self.assertEqual(result, ["/baseline"])
 
-    @patch('rest_client.rest_processor.time')
-    def test_get_oldest_updates_no_dirs(self, mock_time):
+    def test_get_oldest_updates_no_dirs(self):
         """Test get_oldest_updates when no child directories exist"""
         # Arrange
-        mock_time.return_value = 1234567890
         base_response = {"current_dtg_latest": 1234567890, "dirs": []}
         self.mock_http_client.get.return_value = (200, {"data": base_response})
 
@@ -371,11 +393,9 @@ class TestRestProcessor(unittest.TestCase):
         # Assert
         self.assertEqual(result, ["/baseline"])
 
-    @patch('rest_client.rest_processor.time')
-    def test_get_oldest_updates_with_dirs(self, mock_time):
+    def test_get_oldest_updates_with_dirs(self):
         """Test get_oldest_updates with directories"""
         # Arrange
-        mock_time.return_value = 1234567890
         base_response = {
             "current_dtg_latest": 1234567890,
             "dirs": ["dir1", "dir2", "dir3"]
@@ -384,9 +404,8 @@ class TestRestProcessor(unittest.TestCase):
         # Mock the get_hashtable call
         self.mock_http_client.get.side_effect = [
             (200, base_response),  # get_hashtable call
-            (200, 1234567800),  # get_single_timestamp for dir1
-            (200, 1234567850),  # get_single_timestamp for dir2
-            (200, 1234567820),  # get_single_timestamp for dir3
+            (200, {"/baseline/dir1": 1234567800,  # get_child_timestamps, oldest 2 dirs
+                   "/baseline/dir3": 1234567820}),
         ]
 
         # Act
@@ -397,6 +416,28 @@ class TestRestProcessor(unittest.TestCase):
         self.assertIn("/baseline/dir1", result)  # oldest
         self.assertIn("/baseline/dir3", result)  # second oldest
         self.assertEqual(len(result), 2)
+        self.assertEqual(self.mock_http_client.get.call_count, 2)
+        self.mock_http_client.get.assert_called_with(
+            "http://test-api:8080/api/hashtable",
+            params={'path': '/baseline', 'field': 'child_timestamps', 'limit': 2})
+
+    def test_get_oldest_updates_fills_with_untracked_children(self):
+        """Test get_oldest_updates fills remaining slots with children that have no timestamp"""
+        # Arrange
+        base_response = {
+            "current_dtg_latest": 1234567890,
+            "dirs": ["dir3", "dir1", "dir2"]
+        }
+        self.mock_http_client.get.side_effect = [
+            (200, base_response),  # get_hashtable call
+            (200, {"/baseline/dir2": 1234567800}),  # only dir2 is in the database
+        ]
+
+        # Act
+        result = self.rest_processor.get_oldest_updates("/baseline", 50)  # 50% = 2 dirs
+
+        # Assert
+        self.assertEqual(result, ["/baseline/dir2", "/baseline/dir1"])
 
 
 class TestHashInfoValidator(unittest.TestCase):
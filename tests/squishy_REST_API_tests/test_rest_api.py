@@ -62,8 +62,10 @@ class BaseTestCase(unittest.TestCase):
         self.mock_db_instance.insert_or_update_hash = MagicMock()
         self.mock_db_instance.get_single_hash_record = MagicMock()
         self.mock_db_instance.get_single_timestamp = MagicMock()
+        self.mock_db_instance.get_child_timestamps = MagicMock()
         self.mock_db_instance.get_priority_updates = MagicMock()
         self.mock_db_instance.put_log = MagicMock()
+        self.mock_db_instance.put_logs = MagicMock()
         self.mock_db_instance.get_logs = MagicMock()
         self.mock_db_instance.health_check = MagicMock()
         self.mock_db_instance.find_orphaned_entries = MagicMock()
@@ -75,6 +77,8 @@ class BaseTestCase(unittest.TestCase):
         if is_core:
             self.mock_db_instance.get_dashboard_content = MagicMock()
             self.mock_db_instance.get_recent_logs = MagicMock()
+            self.mock_db_instance.get_logs_page = MagicMock()
+            self.mock_db_instance.iter_recent_logs = MagicMock()
             self.mock_db_instance.get_hash_record_count = MagicMock()
             self.mock_db_instance.get_log_count_last_24h = MagicMock()
             self.mock_db_instance.get_site_liveness = MagicMock()
@@ -207,6 +211,34 @@ class HashtableEndpointTestCase(APITestCase):
         # Verify mock was called correctly
         self.mock_db_instance.get_single_timestamp.assert_called_once_with('test_path')
 
+    def test_get_hashtable_child_timestamps(self):
+        """Test GET /api/hashtable?field=child_timestamps returns every child's timestamp in one response."""
+        self.mock_db_instance.get_child_timestamps.return_value = {'test_path/dir1': 123456789.0}
+
+        response = self.client.get('/api/hashtable?path=test_path&field=child_timestamps')
+
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(response.data)
+        self.assertEqual(data['data'], {'test_path/dir1': 123456789.0})
+        self.mock_db_instance.get_child_timestamps.assert_called_once_with('test_path', None)
+
+    def test_get_hashtable_child_timestamps_limit(self):
+        """Test GET /api/hashtable?field=child_timestamps passes the limit through."""
+        self.mock_db_instance.get_child_timestamps.return_value = {'test_path/dir1': 123456789.0}
+
+        response = self.client.get('/api/hashtable?path=test_path&field=child_timestamps&limit=5')
+
+        self.assertEqual(response.status_code, 200)
+        self.mock_db_instance.get_child_timestamps.assert_called_once_with('test_path', 5)
+
+    def test_get_hashtable_child_timestamps_not_found(self):
+        """Test GET /api/hashtable?field=child_timestamps with a path that doesn't exist."""
+        self.mock_db_instance.get_child_timestamps.return_value = None
+
+        response = self.client.get('/api/hashtable?path=missing&field=child_timestamps')
+
+        self.assertEqual(response.status_code, 404)
+
     def test_get_hashtable_priority_updates(self):
         """Test GET /api/hashtable?field=priority."""
         # Configure mock to return priority data
@@ -388,6 +420,41 @@ class LogsEndpointTestCase(APITestCase):
         data = json.loads(response.data)
         self.assertIn('Error adding log entry', data['message'])
 
+    def test_post_logs_batch(self):
+        """Test POST /api/logs with a list of entries inserts them together."""
+        self.mock_db_instance.put_logs.return_value = [7, 8]
+
+        request_data = [
+            {'summary_message': 'First message', 'site_id': 'TEST'},
+            {'summary_message': 'Second message', 'site_id': 'local'}
+        ]
+        response = self.client.post(
+            '/api/logs',
+            data=json.dumps(request_data),
+            content_type='application/json'
+        )
+
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(response.data)
+        self.assertEqual(data['data'], [7, 8])
+        entries = self.mock_db_instance.put_logs.call_args[0][0]
+        self.assertEqual(entries[0]['site_id'], 'TEST')
+        self.assertNotEqual(entries[1]['site_id'], 'local')
+
+    def test_post_logs_batch_non_object_entry(self):
+        """Test POST /api/logs rejects a list containing an entry that isn't an object."""
+        request_data = [{'summary_message': 'First message', 'site_id': 'TEST'}, "x"]
+        response = self.client.post(
+            '/api/logs',
+            data=json.dumps(request_data),
+            content_type='application/json'
+        )
+
+        self.assertEqual(response.status_code, 400)
+        data = json.loads(response.data)
+        self.assertIn('JSON object', data['message'])
+        self.mock_db_instance.put_logs.assert_not_called()
+
     def test_get_logs_consolidate(self):
         """Test GET /api/logs?action=consolidate."""
         # Configure mock to return success
@@ -540,6 +607,58 @@ class HealthCheckEndpointTestCase(APITestCase):
         data = json.loads(response.data)
         self.assertEqual(data['data']['status'], 'healthy')
 
+    def test_livez(self):
+        """Test GET /livez answers without a database call."""
+        response = self.client.get('/livez')
+
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(response.data)
+        self.assertEqual(data['data']['status'], 'alive')
+        self.mock_db_instance.health_check.assert_not_called()
+
+
+class AppFactoryTestCase(APITestCase):
+    """Test cases for the application factory."""
+
+    def test_db_instance_created_once(self):
+        """Test the database instance is built on first use and then reused."""
+        factory = self.RESTAPIFactory
+        original = factory._db_instance
+        factory._db_instance = None
+        try:
+            with patch('squishy_REST_API.app_factory.app_factory.DBClientFactory') as mock_factory:
+                first = factory._get_db_instance()
+                second = factory._get_db_instance()
+
+            self.assertIs(first, second)
+            mock_factory.return_value.create_client.assert_called_once()
+        finally:
+            factory._db_instance = original
+
+
+
+class JSONProviderTestCase(APITestCase):
+    """Test cases for the orjson backed JSON provider."""
+
+    def setUp(self):
+        """Set up test environment before each test."""
+        super().setUp()
+        from squishy_REST_API.app_factory.json_provider import ORJSONProvider
+        if not isinstance(self.app.json, ORJSONProvider):
+            self.skipTest("orjson is not installed")
+
+    def test_dumps_non_string_keys(self):
+        """Test int keys are written as strings, as the default provider does."""
+        self.assertEqual(json.loads(self.app.json.dumps({2: 'b', 1: 'a'})), {'1': 'a', '2': 'b'})
+
+    def test_dumps_honours_kwargs(self):
+        """Test json.dumps arguments change the output rather than being dropped."""
+        data = {'a': [1]}
+
+        self.assertEqual(self.app.json.dumps(data, indent=2), json.dumps(data, indent=2))
+        self.assertEqual(self.app.json.dumps(data, indent=4), json.dumps(data, indent=4))
+        self.assertEqual(self.app.json.dumps(data, separators=(',', ':')), '{"a":[1]}')
+
 
 class CoreAPITestCase(BaseTestCase):
     """Base test case for Core API tests."""
@@ -721,6 +840,66 @@ class PipelineEndpointTestCase(CoreAPITestCase):
     #     self.assertIn('Request body required', data['message'])
 
 
+class RecentLogsEndpointTestCase(CoreAPITestCase):
+    """Test cases for the /api/logs/recent endpoint (core sites only)."""
+
+    def test_stream_recent_logs(self):
+        """Test GET /api/logs/recent streams one JSON record per line."""
+        mock_logs = [
+            {'log_id': 2, 'site_id': 'SITE1', 'log_level': 'ERROR'},
+            {'log_id': 1, 'site_id': 'SITE1', 'log_level': 'ERROR'}
+        ]
+        self.mock_db_instance.iter_recent_logs.return_value = iter(mock_logs)
+
+        # Make request to endpoint
+        response = self.client.get('/api/logs/recent?log_level=ERROR&site_id=SITE1')
+
+        # Check response
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, 'application/x-ndjson')
+        lines = response.get_data(as_text=True).splitlines()
+        self.assertEqual([json.loads(line) for line in lines], mock_logs)
+
+        # Verify mock was called correctly
+        self.mock_db_instance.iter_recent_logs.assert_called_once_with('ERROR', 'SITE1')
+
+    def test_stream_recent_logs_db_error(self):
+        """Test GET /api/logs/recent when the database client can't stream logs."""
+        self.mock_db_instance.iter_recent_logs.side_effect = NotImplementedError("not available")
+
+        response = self.client.get('/api/logs/recent')
+
+        self.assertEqual(response.status_code, 500)
+
+    def test_stream_recent_logs_query_error(self):
+        """Test GET /api/logs/recent returns an error status when the first read fails."""
+        def failing_logs():
+            raise RuntimeError("query failed")
+            yield  # pragma: no cover
+
+        self.mock_db_instance.iter_recent_logs.return_value = failing_logs()
+
+        response = self.client.get('/api/logs/recent')
+
+        self.assertEqual(response.status_code, 500)
+
+    def test_stream_recent_logs_error_mid_stream(self):
+        """Test GET /api/logs/recent ends with an error line when the database fails part way."""
+        def partial_logs():
+            yield {'log_id': 2}
+            raise RuntimeError("connection lost")
+
+        self.mock_db_instance.iter_recent_logs.return_value = partial_logs()
+
+        response = self.client.get('/api/logs/recent')
+
+        self.assertEqual(response.status_code, 200)
+        lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+        self.assertEqual(lines[0], {'log_id': 2})
+        self.assertEqual(lines[-1]['error'], 'Database error')
+        self.assertIn('connection lost', lines[-1]['message'])
+
+
 class GUITestCase(CoreAPITestCase):
     """Base test case for GUI tests (core sites only)."""
 
@@ -777,6 +956,41 @@ class DashboardEndpointTestCase(GUITestCase):
         self.assertEqual(response.status_code, 200)
         self.assertIn(b'Dashboard', response.data)
 
+    def test_dashboard_cached(self):
+        """Test repeated GET /dashboard requests are served from the page cache."""
+        self.mock_db_instance.get_dashboard_content.return_value = {'hash_record_count': 1000}
+
+        first = self.client.get('/dashboard')
+        second = self.client.get('/dashboard')
+
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(first.data, second.data)
+        self.mock_db_instance.get_dashboard_content.assert_called_once()
+
+    def test_dashboard_conditional_get(self):
+        """Test GET /dashboard returns 304 when the client already has the current page."""
+        self.mock_db_instance.get_dashboard_content.return_value = {'hash_record_count': 1000}
+
+        first = self.client.get('/dashboard')
+        second = self.client.get('/dashboard', headers={'If-None-Match': first.headers['ETag']})
+
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(second.data, b'')
+
+    def test_page_cache_size_is_bounded(self):
+        """Test varying the query string can't grow the page cache past MAX_ENTRIES."""
+        self.mock_db_instance.get_dashboard_content.return_value = {'hash_record_count': 1000}
+        cache = self.app.extensions['gui_cache']
+        cache.MAX_ENTRIES = 3
+
+        for i in range(10):
+            self.client.get(f'/dashboard?x={i}')
+
+        self.assertEqual(len(cache._entries), 3)
+        self.assertEqual(self.mock_db_instance.get_dashboard_content.call_count, 10)
+        self.client.get('/dashboard?x=9')  # Most recent page is still cached
+        self.assertEqual(self.mock_db_instance.get_dashboard_content.call_count, 10)
+
 
 class HashtableDetailEndpointTestCase(GUITestCase):
     """Test cases for the /web/hashtable/<path:file_path> endpoint."""
@@ -806,6 +1020,16 @@ class HashtableDetailEndpointTestCase(GUITestCase):
         # Verify mock was called correctly
         self.mock_db_instance.get_hash_record.assert_called_once_with('/test_path')
 
+    def test_template_url_for_external_follows_request_host(self):
+        """Test the template url_for builds external URLs from the current request's host."""
+        cached_url_for = self.app.jinja_env.globals['url_for']
+
+        with self.app.test_request_context(base_url='http://site-a.example'):
+            self.assertEqual(cached_url_for('hash_status', _external=True), 'http://site-a.example/web/status')
+        with self.app.test_request_context(base_url='http://site-b.example'):
+            self.assertEqual(cached_url_for('hash_status', _external=True), 'http://site-b.example/web/status')
+            self.assertEqual(cached_url_for('hash_status'), '/web/status')
+
     def test_hashtable_detail_not_found(self):
         """Test GET /web/hashtable/<path:file_path> with a path that doesn't exist."""
         # Configure mock to return None (not found)
@@ -850,6 +1074,116 @@ class LivenessEndpointTestCase(GUITestCase):
         self.mock_db_instance.get_site_liveness.assert_called_once()
 
 
+    def test_liveness_epoch_timestamps(self):
+        """Test GET /web/liveness renders UNIX epoch timestamps from epoch based backends."""
+        self.mock_db_instance.get_site_liveness.return_value = [
+            {'site_name': 'SITE0',
+             'last_updated': 1704067200,
+             'last_updated_timestamp': 1704067200,
+             'status_category': "live_current"
+             }]
+
+        response = self.client.get('/web/liveness')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b'2024-01-01 00:00:00', response.data)
+
+
+class LogsPageEndpointTestCase(GUITestCase):
+    """Test cases for the /web/logs endpoint."""
+
+    def test_logs_page_filtered(self):
+        """Test GET /web/logs fetches sites and logs in a single call."""
+        self.mock_db_instance.get_logs_page.return_value = {
+            'valid_site_ids': ['SITE1', 'SITE2'],
+            'site_id': 'SITE1',
+            'logs': [{'log_id': 1, 'site_id': 'SITE1', 'log_level': 'ERROR',
+                      'timestamp': datetime.datetime.now(), 'summary_message': 'test summary',
+                      'detailed_message': None}]
+        }
+
+        response = self.client.get('/web/logs?log_level=error&site_id=SITE1')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b'test summary', response.data)
+        self.mock_db_instance.get_logs_page.assert_called_once_with(log_level='ERROR', site_id='SITE1',
+                                                                    limit=101, offset=0)
+
+    def test_logs_page_pagination(self):
+        """Test GET /web/logs pushes paging into the query and links to the next page."""
+        self.mock_db_instance.get_logs_page.return_value = {
+            'valid_site_ids': [],
+            'site_id': None,
+            'logs': [{'log_id': i, 'site_id': 'SITE1', 'log_level': 'INFO',
+                      'timestamp': datetime.datetime.now(), 'summary_message': f'entry {i}',
+                      'detailed_message': None} for i in range(3)]
+        }
+
+        response = self.client.get('/web/logs?page=2&per_page=2')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b'entry 1', response.data)
+        self.assertNotIn(b'entry 2', response.data)
+        self.assertIn(b'page=3', response.data)
+        self.mock_db_instance.get_logs_page.assert_called_once_with(log_level=None, site_id=None,
+                                                                    limit=3, offset=2)
+
+    def test_logs_page_keyset_pagination(self):
+        """Test GET /web/logs seeks from the previous page's last entry when the Next link provides it."""
+        last_seen = datetime.datetime(2024, 1, 1, 12, 0, 0)
+        self.mock_db_instance.get_logs_page.return_value = {
+            'valid_site_ids': [],
+            'site_id': None,
+            'logs': [{'log_id': 7 - i, 'site_id': 'SITE1', 'log_level': 'INFO',
+                      'timestamp': last_seen, 'summary_message': f'entry {i}',
+                      'detailed_message': None} for i in range(3)]
+        }
+
+        response = self.client.get('/web/logs?page=2&per_page=2&before_ts=2024-01-01 12:30:00&before_id=9')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b'before_id=6', response.data)  # Next link continues from the last entry shown
+        self.mock_db_instance.get_logs_page.assert_called_once_with(
+            log_level=None, site_id=None, limit=3, before=(datetime.datetime(2024, 1, 1, 12, 30), 9))
+
+    def test_logs_page_keyset_pagination_epoch(self):
+        """Test GET /web/logs passes an epoch cursor (MariaDB timestamps) through as an integer."""
+        self.mock_db_instance.get_logs_page.return_value = {
+            'valid_site_ids': [],
+            'site_id': None,
+            'logs': [{'log_id': 7 - i, 'site_id': 'SITE1', 'log_level': 'INFO',
+                      'timestamp': 1704110400, 'summary_message': f'entry {i}',
+                      'detailed_message': None} for i in range(3)]
+        }
+
+        response = self.client.get('/web/logs?page=2&per_page=2&before_ts=1704112200&before_id=9')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b'before_ts=1704110400', response.data)
+        self.mock_db_instance.get_logs_page.assert_called_once_with(
+            log_level=None, site_id=None, limit=3, before=(1704112200, 9))
+
+    def test_logs_page_invalid_cursor_uses_offset(self):
+        """Test GET /web/logs falls back to offset paging for an invalid cursor."""
+        self.mock_db_instance.get_logs_page.return_value = {'valid_site_ids': [], 'site_id': None, 'logs': []}
+
+        response = self.client.get('/web/logs?page=2&per_page=2&before_ts=yesterday&before_id=9')
+
+        self.assertEqual(response.status_code, 200)
+        self.mock_db_instance.get_logs_page.assert_called_once_with(log_level=None, site_id=None,
+                                                                    limit=3, offset=2)
+
+    def test_logs_page_query_cached(self):
+        """Test repeated GET /web/logs requests reuse the cached query result."""
+        self.mock_db_instance.get_logs_page.return_value = {'valid_site_ids': [], 'site_id': None, 'logs': []}
+
+        self.client.get('/web/logs?log_level=INFO')
+        self.client.get('/web/logs?log_level=INFO')
+        self.client.get('/web/logs?log_level=ERROR')
+
+        self.assertEqual(self.mock_db_instance.get_logs_page.call_count, 2)
+
+
 class HashStatusEndpointTestCase(GUITestCase):
     """Test cases for the /web/status endpoint."""
 
@@ -887,6 +1221,14 @@ class ErrorHandlerTestCase(APITestCase):
         self.assertEqual(data['error'], 'Not Found')
         self.assertIn('API resource was not found', data['message'])
 
+    def test_404_non_api_path_remote_site(self):
+        """Test 404 errors on a remote site are JSON even outside /api/."""
+        response = self.client.get('/web/nonexistent')
+
+        self.assertEqual(response.status_code, 404)
+        data = json.loads(response.data)
+        self.assertEqual(data['error'], 'Not Found')
+
     def test_405_method_not_allowed(self):
         """Test 405 error handling for API endpoints."""
         # Make PUT request to GET-only endpoint
@@ -922,6 +1264,127 @@ class ConfigTestCase(unittest.TestCase):
         self.assertEqual(config.get('secret_key'), 'test_secret')
 
 
+    @patch.dict('os.environ', {
+        'SITE_NAME': 'TEST',
+        'LOCAL_DB_USER': 'test_user',
+        'LOCAL_DB_PASSWORD': 'test_pass',
+        'API_SECRET_KEY': 'test_secret'
+    })
+    def test_config_reload_keeps_single_handler(self):
+        """Test re-creating the config does not attach duplicate log handlers."""
+        from squishy_REST_API.configuration.config import Config
+
+        handler_count = len(Config().logger.handlers)
+        config = Config()
+
+        self.assertEqual(len(config.logger.handlers), handler_count)
+
+    @patch.dict('os.environ', {
+        'SITE_NAME': 'TEST',
+        'LOCAL_DB_USER': 'test_user',
+        'LOCAL_DB_PASSWORD': 'test_pass',
+        'API_SECRET_KEY': 'test_secret'
+    })
+    def test_config_skips_reinit_for_same_environment(self):
+        """Test repeated construction with an unchanged environment reuses the loaded config."""
+        from squishy_REST_API.configuration.config import Config
+
+        loaded = Config()._config
+        self.assertIs(Config()._config, loaded)
+
+        with patch.dict('os.environ', {'SITE_NAME': 'OTHER'}):
+            self.assertEqual(Config().site_name, 'OTHER')
+
+    @patch.dict('os.environ', {
+        'SITE_NAME': 'TEST',
+        'LOCAL_DB_USER': 'test_user',
+        'LOCAL_DB_PASSWORD': 'test_pass',
+        'API_SECRET_KEY': 'test_secret'
+    })
+    def test_database_url_rebuilt_after_set(self):
+        """Test the cached database URL follows configuration changes."""
+        from squishy_REST_API.configuration.config import Config
+
+        config = Config()
+        self.assertIn('test_user:test_pass@', config.get_database_url())
+
+        config._set('db_user', 'other_user')
+        self.assertIn('other_user:test_pass@', config.database_url)
+        config._set('db_user', 'test_user')
+
+    @patch.dict('os.environ', {
+        'SITE_NAME': 'TEST',
+        'LOCAL_DB_USER': 'test_user',
+        'LOCAL_DB_PASSWORD': 'test_pass',
+        'API_SECRET_KEY': 'test_secret'
+    })
+    def test_config_reloads_environment_after_set(self):
+        """Test a value changed with _set is replaced from the environment on the next Config()."""
+        from squishy_REST_API.configuration.config import Config
+
+        Config()._set('db_user', 'other_user')
+
+        self.assertEqual(Config().get('db_user'), 'test_user')
+
+    @patch.dict('os.environ', {
+        'SITE_NAME': 'TEST',
+        'LOCAL_DB_USER': 'test_user',
+        'LOCAL_DB_PASSWORD': 'test_pass',
+        'API_SECRET_KEY': 'test_secret',
+        'PRELOAD_APP': 'false'
+    })
+    def test_preload_app_from_environment(self):
+        """Test PRELOAD_APP turns off gunicorn's preload_app."""
+        from squishy_REST_API.configuration.config import Config
+
+        self.assertIs(Config().gunicorn_config['preload_app'], False)
+
+    def test_derived_values_built_once(self):
+        """Test the database URL and gunicorn bind are built once and reused."""
+        from squishy_REST_API.configuration.config import config
+
+        self.assertIs(config.get_database_url(), config.get_database_url())
+        self.assertIs(config.gunicorn_config['bind'], config.gunicorn_config['bind'])
+        self.assertEqual(config.gunicorn_config['bind'], f"{config['api_host']}:{config['api_port']}")
+
+    def test_repr_hides_sensitive_keys(self):
+        """Test the config representation omits sensitive values."""
+        from squishy_REST_API.configuration.config import config
+
+        text = repr(config)
+        self.assertIn("'site_name'", text)
+        for key in config.SENSITIVE_KEYS:
+            self.assertNotIn(f"'{key}'", text)
+
+    def test_snapshot_is_frozen(self):
+        """Test the settings snapshot mirrors the config and cannot be modified."""
+        import dataclasses
+        from squishy_REST_API.configuration.config import config
+
+        snapshot = config.snapshot()
+        self.assertIs(config.snapshot(), snapshot)
+        self.assertEqual(snapshot.api_port, config.get('api_port'))
+        self.assertEqual(snapshot.site_name, config.site_name)
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            snapshot.debug = True
+
+    def test_debug_flag_follows_set(self):
+        """Test the cached debug flag is refreshed when a value is set."""
+        from squishy_REST_API.configuration.config import config
+
+        original = config.get('debug')
+        config._set('debug', True)
+        self.assertTrue(config.is_debug_mode())
+        config._set('debug', original)
+        self.assertEqual(config.is_debug_mode(), bool(original))
+
+    def test_convert_value_boolean(self):
+        """Test boolean environment values are converted to bools."""
+        from squishy_REST_API.configuration.config import Config
+
+        self.assertIs(Config._convert_value('debug', 'false'), False)
+        self.assertIs(Config._convert_value('debug', 'True'), True)
+
     @patch.dict('os.environ', {
         'SITE_NAME': 'TEST',
         'LOCAL_DB_USER': 'test_user',